@@ -1,11 +1,16 @@
 import os
+import copy
 import json
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from io import BytesIO
 from flask_cors import CORS
 
 
 from flask import (
     Flask,
+    Response,
     render_template,
     request,
     redirect,
@@ -16,6 +21,53 @@ from flask import (
 )
 import google.generativeai as genai
 
+from history.export import init_history
+from history.store import history
+from interview import jobs
+from interview.dedupe import drop_session, session_index
+from interview.pools import QuestionPool
+from interview.prescore import SKIPPED_ANSWER, merge_reviews, prescore_evaluation, prescore_review
+from interview.question_bank import bank_questions
+from llm.breaker import OPEN, CircuitOpenError, gemini_breaker
+from llm.budget import fit_inputs
+from llm.cache import make_key, response_cache
+from llm.context_cache import create_caches, generate_stream_with_prefix, generate_with_prefix, release_caches
+from llm.routing import generate, generate_stream, get_route
+from llm.streaming import iter_array_items
+from quiz.adaptive import (
+    MAX_ITEMS as ADAPTIVE_MAX_ITEMS,
+    ability_level,
+    bank as adaptive_bank,
+    public_question,
+    record_attempt,
+    should_stop,
+)
+from quiz.services import fallback_quiz_questions
+from quiz.store import question_bank
+from resume.ats import ats_coverage
+from resume.parsing import (
+    MAX_UPLOAD_BYTES,
+    UploadError,
+    profile_from_sections,
+    read_resume_upload,
+)
+from resume.patching import PatchError, apply_line_edits, number_lines, parse_edits
+from resume.rendering import (
+    merge_generated_content,
+    normalize_style,
+    prose_lines,
+    render_html,
+    render_text,
+    with_prose_lines,
+)
+from web.admission import init_admission
+from web.assets import init_assets
+from web.compression import init_compression
+from web.json_provider import FastJSONProvider, dumps as json_dumps, loads as json_loads
+from web.metrics import init_metrics, registry
+from web.page_cache import cached_page, init_page_cache
+from web.profiling import init_profiling
+
 # ------------------ GEMINI CONFIG ------------------
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
 if not GEMINI_API_KEY:
@@ -28,17 +80,60 @@ TEMPLATE_DIR = os.path.join(BASE_DIR, "interview", "templates")
 STATIC_DIR = os.path.join(BASE_DIR, "interview", "static")
 
 app = Flask(__name__, template_folder=TEMPLATE_DIR, static_folder=STATIC_DIR)
+# orjson-backed jsonify when installed (stdlib otherwise).
+app.json = FastJSONProvider(app)
 app.config["SECRET_KEY"] = "super-secret-key-change-this"  # needed for session
+# Reject oversized multipart bodies before they are buffered (resume upload + form fields).
+app.config["MAX_CONTENT_LENGTH"] = MAX_UPLOAD_BYTES + 1024 * 1024
 
 
 # Allow API access from React dev server (http://localhost:5173, etc.)
 CORS(app, resources={r"/api/*": {"origins": "*"}})
 
+# gzip/brotli for large buffered responses; installed before the hooks
+# below so it runs after them (after_request hooks run in reverse).
+init_compression(app)
+
+# Fingerprinted /assets built by scripts/build_assets.py (asset_url() in templates).
+init_assets(app)
+
+# Jinja bytecode cache; @cached_page on user-independent pages.
+init_page_cache(app)
+
+# /metrics, and separate admission pools for LLM-bound and cheap routes so
+# load spikes on Gemini calls are shed with a fast 503 instead of queuing.
+init_metrics(app)
+init_admission(app)
+
+# Opt-in sampling profiler (X-Profile-Token header or PROFILE_SAMPLE_RATE).
+init_profiling(app)
+
+# Practice history: /admin/history export endpoints and `flask history export`.
+init_history(app)
+
+
+def _history_user() -> str:
+    """Anonymous per-browser id the practice history is recorded under."""
+    if "history_user" not in session:
+        session["history_user"] = uuid.uuid4().hex
+    return session["history_user"]
+
+
+registry.describe("llm_input_truncations_total", "Prompts whose free-text inputs were cut to the family's input budget.")
+registry.describe("llm_input_tokens_dropped_total", "Estimated tokens removed from prompt inputs by relevance truncation.")
+registry.describe("llm_input_chunks_dropped_total", "Chunks removed from prompt inputs by relevance truncation.")
+
 
-# ------------------ SHARED GEMINI HELPER ------------------
-def _get_model():
-    """Return a Gemini model instance."""
-    return genai.GenerativeModel("models/gemini-2.0-flash")
+def _fit_prompt_inputs(family: str, inputs: dict, query: str) -> dict:
+    """Free-text prompt inputs cut to the family's token budget; drops are counted in /metrics."""
+    fitted, dropped = fit_inputs(family, inputs, query)
+    if dropped:
+        registry.inc("llm_input_truncations_total", {"family": family})
+        for name, report in dropped.items():
+            labels = {"family": family, "input": name}
+            registry.inc("llm_input_tokens_dropped_total", labels, report["tokens"])
+            registry.inc("llm_input_chunks_dropped_total", labels, report["chunks"])
+    return fitted
 
 
 # ==========================================================
@@ -49,10 +144,28 @@ def extract_profile_from_sources(
     basic_fields: dict,
     old_resume_text: str = "",
     linkedin_profile: str = "",
+    parsed_resume: dict = None,
 ) -> dict:
     """
     Step 2: Data Extraction & Parsing
+
+    When the old resume was parsed locally, its sections are sent as compact
+    JSON instead of the raw text.
     """
+    texts = _fit_prompt_inputs(
+        "extract",
+        {"old_resume_text": old_resume_text, "linkedin_profile": linkedin_profile},
+        " ".join(str(basic_fields.get(key) or "") for key in ("headline", "skills", "experience", "projects")),
+    )
+    old_resume_text, linkedin_profile = texts["old_resume_text"], texts["linkedin_profile"]
+    if parsed_resume:
+        old_resume_block = (
+            "Old resume, pre-parsed into sections:\n"
+            + json.dumps(parsed_resume, separators=(",", ":"), ensure_ascii=False)
+        )
+    else:
+        old_resume_block = f'Old resume text (if provided):\n"""{old_resume_text}"""'
+
     prompt = f"""
 You are an AI assistant that extracts structured resume data.
 
@@ -60,8 +173,7 @@ Combine the following into one clean, complete profile:
 1) Structured form fields:
 {json.dumps(basic_fields, indent=2)}
 
-2) Old resume text (if provided):
-\"\"\"{old_resume_text}\"\"\"
+2) {old_resume_block}
 
 3) LinkedIn profile (if provided):
 \"\"\"{linkedin_profile}\"\"\"
@@ -111,12 +223,11 @@ Return a JSON object with this structure:
 - Only output JSON, no explanations.
 """
 
-    model = _get_model()
-    response = model.generate_content(prompt)
+    response = generate("extract", prompt)
     text = (response.text or "").strip()
 
     try:
-        return json.loads(text)
+        return json_loads(text)
     except Exception:
         cleaned = (
             text.replace("```json", "")
@@ -124,13 +235,19 @@ Return a JSON object with this structure:
             .replace("`", "")
             .strip()
         )
-        return json.loads(cleaned)
+        return json_loads(cleaned)
 
 
 def match_profile_to_job(profile: dict, target_role: str, job_description: str) -> dict:
     """
     Step 3: Job Role & Keyword Matching (ATS Optimization)
     """
+    skills = profile.get("skills") or []
+    job_description = _fit_prompt_inputs(
+        "match",
+        {"job_description": job_description},
+        f"{target_role} {' '.join(map(str, skills)) if isinstance(skills, list) else skills}",
+    )["job_description"]
     prompt = f"""
 You are an ATS optimization assistant.
 
@@ -155,54 +272,127 @@ Tasks:
 Return ONLY the updated profile JSON with the same structure.
 """
 
-    model = _get_model()
-    response = model.generate_content(prompt)
+    response = generate("match", prompt)
     cleaned = _clean_gemini_json(response.text or "{}")
-    data = json.loads(cleaned)
+    data = json_loads(cleaned)
     if not isinstance(data, dict):
         raise ValueError("Gemini evaluation failed.")
     return data
 
 
-def create_resume_from_profile(profile: dict, tone: str, template_style: str) -> str:
+def write_resume_content(profile: dict, tone: str) -> dict:
     """
-    Steps 4 & 5: Content Generation & Formatting
+    Step 4: Content Generation
+
+    Gemini only writes the summary paragraph and rewrites bullets; layout is
+    done locally by resume.rendering.
     """
+    outline = {
+        "name": profile.get("name"),
+        "headline": profile.get("headline"),
+        "skills": profile.get("skills"),
+        "experience": [
+            {k: e.get(k) for k in ("title", "company", "bullets")}
+            for e in profile.get("experience") or [] if isinstance(e, dict)
+        ],
+        "projects": [
+            {k: p.get(k) for k in ("name", "tech_stack", "bullets")}
+            for p in profile.get("projects") or [] if isinstance(p, dict)
+        ],
+        "education": profile.get("education"),
+        "achievements": profile.get("achievements"),
+    }
     prompt = f"""
 You are an expert resume writer and ATS specialist.
 
-Create a professional resume in plain text from this profile JSON:
-{json.dumps(profile, indent=2)}
+Candidate profile JSON:
+{json.dumps(outline, separators=(",", ":"), ensure_ascii=False)}
+
+Tasks:
+1. Write a 2-3 sentence professional summary in a {tone} tone.
+2. Rewrite the bullets of every experience and project entry as strong,
+   ATS-friendly bullet points with action verbs (do NOT invent facts).
 
-Formatting:
-- Put the candidate name as a large header at the top.
-- Next line: contact info and links (email | phone | location | LinkedIn | portfolio if present).
-- Use section headings in ALL CAPS:
-  SUMMARY
-  SKILLS
-  EXPERIENCE
-  PROJECTS
-  EDUCATION
-  ACHIEVEMENTS (only if present)
-- Use '-' bullet points under EXPERIENCE and PROJECTS.
-- Tone should be {tone}.
-- Layout style (template_style): {template_style}
-  - "classic": traditional resume
-  - "modern": slightly more stylish language
-  - "minimal": clean and concise
-
-Return ONLY the resume text, no explanations.
+Return ONLY JSON with this schema (one bullet list per entry, same order and
+same number of entries as the input):
+{{
+  "summary": "...",
+  "experience": [["bullet", "..."]],
+  "projects": [["bullet", "..."]]
+}}
 """
 
-    model = _get_model()
-    response = model.generate_content(prompt)
-    return (response.text or "").strip()
+    response = generate("create", prompt)
+    content = json_loads(_clean_gemini_json(response.text or "{}"))
+    return merge_generated_content(profile, content)
 
 
-def polish_resume_text(resume_text: str) -> str:
+def create_resume_from_profile(profile: dict, tone: str, template_style: str) -> str:
+    """
+    Steps 4 & 5: Content Generation & Formatting
+    """
+    return render_text(write_resume_content(profile, tone), template_style)
+
+
+def polish_resume_profile(profile: dict) -> dict:
+    """
+    Step 6 applied to the generated prose (summary and bullets) only, so the
+    polished wording survives layout switches.
+    """
+    lines = prose_lines(profile)
+    if not any(lines):
+        return profile
+    polished = polish_resume_text("\n".join(lines)).split("\n")
+    # Strip per line only after the split, so an empty summary or bullet
+    # keeps its place and the edits still line up in with_prose_lines().
+    return with_prose_lines(profile, [line.strip() for line in polished])
+
+
+RESUME_POLISH_MODE = os.getenv("RESUME_POLISH_MODE", "patch")
+
+
+def polish_resume_text(resume_text: str, mode: str = RESUME_POLISH_MODE) -> str:
     """
     Step 6: Grammar, Style & Consistency Check
+
+    mode="patch" asks for line-anchored edits and applies them locally,
+    falling back to a full rewrite when the patch does not apply.
     """
+    if mode == "patch":
+        try:
+            return _polish_with_patches(resume_text)
+        except PatchError:
+            pass
+    return _polish_full_rewrite(resume_text)
+
+
+def _polish_with_patches(resume_text: str) -> str:
+    prompt = f"""
+You are a grammar and style corrector.
+
+Review the numbered resume lines below:
+- Fix grammar, spelling, and punctuation.
+- Ensure consistent tense (past roles in past tense, current role in present tense).
+- Avoid redundant repetitions.
+- Do not change structure, sections, facts, jobs or projects.
+
+Resume (line number, then "| ", then the line):
+{number_lines(resume_text)}
+
+Return ONLY a JSON array of edits, one per fix, using this schema:
+[
+  {{"line": 3, "find": "exact text copied from that line", "replace": "corrected text"}}
+]
+- "find" must be the shortest exact substring of that line that needs changing.
+- Return [] if nothing needs fixing. No markdown fences, no commentary.
+"""
+
+    response = generate("polish_patch", prompt)
+    edits = parse_edits(response.text or "[]")
+    return apply_line_edits(resume_text, edits)
+
+
+def _polish_full_rewrite(resume_text: str) -> str:
     prompt = f"""
 You are a grammar and style corrector.
 
@@ -218,12 +408,11 @@ Resume:
 Return ONLY the corrected resume text.
 """
 
-    model = _get_model()
-    response = model.generate_content(prompt)
+    response = generate("polish", prompt)
     return (response.text or "").strip()
 
 
-def full_resume_pipeline(
+def build_base_profile(
     name,
     headline,
     contact,
@@ -235,15 +424,19 @@ def full_resume_pipeline(
     projects,
     skills,
     achievements,
-    target_role,
-    job_description,
-    tone,
-    template_style,
     old_resume_text="",
     linkedin_profile="",
-) -> str:
+    parsed_resume=None,
+) -> dict:
     """
-    Combine all steps of the resume pipeline.
+    Steps 1 & 2: merge the form, the uploaded resume and LinkedIn text into
+    one target-independent profile.
+
+    parsed_resume is the output of resume.parsing.read_resume_upload. When it
+    is well formed and the form adds nothing beyond name/contact, the Gemini
+    extraction step is skipped and the profile is built locally. Gemini
+    extractions are cached per input, so resubmitting the same details for
+    another job does not extract again.
     """
     basic_fields = {
         "name": name,
@@ -259,24 +452,128 @@ def full_resume_pipeline(
         "achievements": achievements,
     }
 
+    sections = (parsed_resume or {}).get("sections")
+    form_details = (education, experience, projects, skills, achievements, linkedin_profile)
+    if parsed_resume and parsed_resume.get("well_formed") and not any(form_details):
+        profile = profile_from_sections(sections)
+        overrides = {
+            "name": name,
+            "headline": headline,
+            "contact": contact,
+            "location": location,
+        }
+        profile.update({key: value for key, value in overrides.items() if value})
+        if linkedin:
+            profile["links"]["linkedin"] = linkedin
+        if portfolio:
+            profile["links"]["portfolio"] = portfolio
+        return profile
+
+    cache_key = make_key("profile", basic_fields, old_resume_text, linkedin_profile, sections)
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        return copy.deepcopy(cached)
     profile = extract_profile_from_sources(
         basic_fields=basic_fields,
         old_resume_text=old_resume_text,
         linkedin_profile=linkedin_profile,
+        parsed_resume=sections,
     )
+    response_cache.set(cache_key, copy.deepcopy(profile))
+    return profile
 
+
+def tailor_profile(profile: dict, target_role: str, job_description: str, tone: str) -> dict:
+    """
+    Steps 3-6 for one target: ATS matching, content generation and polish.
+    """
     if job_description.strip() or target_role.strip():
         profile = match_profile_to_job(profile, target_role, job_description)
 
-    raw_resume = create_resume_from_profile(profile, tone, template_style)
-    final_resume = polish_resume_text(raw_resume)
-    return final_resume
+    profile = write_resume_content(profile, tone)
+    return polish_resume_profile(profile)
+
+
+def full_resume_pipeline(
+    name,
+    headline,
+    contact,
+    location,
+    linkedin,
+    portfolio,
+    education,
+    experience,
+    projects,
+    skills,
+    achievements,
+    target_role,
+    job_description,
+    tone,
+    old_resume_text="",
+    linkedin_profile="",
+    parsed_resume=None,
+) -> dict:
+    """
+    Combine all steps of the resume pipeline and return the final profile.
+    Render it with resume.rendering (render_text / render_html).
+    """
+    profile = build_base_profile(
+        name=name,
+        headline=headline,
+        contact=contact,
+        location=location,
+        linkedin=linkedin,
+        portfolio=portfolio,
+        education=education,
+        experience=experience,
+        projects=projects,
+        skills=skills,
+        achievements=achievements,
+        old_resume_text=old_resume_text,
+        linkedin_profile=linkedin_profile,
+        parsed_resume=parsed_resume,
+    )
+    return tailor_profile(profile, target_role, job_description, tone)
+
+
+MAX_RESUME_TARGETS = int(os.getenv("RESUME_MAX_TARGETS", "5"))
+
+
+def multi_target_resume_pipeline(
+    base_profile: dict,
+    targets: list,
+    tone: str,
+    template_style: str,
+) -> list:
+    """
+    Tailor one extracted profile to several (target_role, job_description)
+    pairs in parallel on the shared fan-out pool. Each variant carries its
+    rendered text and ATS keyword coverage; a failing target reports its
+    error without failing the rest.
+    """
+    def run(target):
+        role = (target.get("target_role") or "").strip()
+        jd = (target.get("job_description") or "").strip()
+        try:
+            profile = tailor_profile(copy.deepcopy(base_profile), role, jd, tone)
+        except Exception as exc:  # pylint: disable=broad-except
+            return {"target_role": role, "error": f"Unable to tailor resume: {exc}"}
+        text = render_text(profile, template_style)
+        return {
+            "target_role": role,
+            "profile": profile,
+            "resume_text": text,
+            "ats": ats_coverage(text, jd or role),
+        }
+
+    return list(_fanout_executor.map(run, targets))
 
 
 # ------------------ RESUME ROUTES ------------------
 
 
 @app.route("/", methods=["GET"])
+@cached_page
 def home():
     return render_template("home.html")
 
@@ -284,6 +581,9 @@ def home():
 @app.route("/resume", methods=["GET", "POST"])
 def resume_builder():
     resume_output = None
+    resume_profile = None
+    template_style = "classic"
+    upload_error = None
 
     if request.method == "POST":
         name = request.form.get("name", "").strip()
@@ -303,12 +603,25 @@ def resume_builder():
         template_style = request.form.get("template_style", "classic").strip()
         linkedin_profile = request.form.get("linkedin_profile", "").strip()
 
+        parsed_resume = None
         old_resume_text = ""
         old_resume_file = request.files.get("old_resume")
         if old_resume_file and old_resume_file.filename:
-            old_resume_text = old_resume_file.read().decode("utf-8", errors="ignore")
-
-        resume_output = full_resume_pipeline(
+            try:
+                parsed_resume = read_resume_upload(old_resume_file)
+            except UploadError as exc:
+                upload_error = str(exc)
+                return render_template(
+                    "resume/resume.html",
+                    resume_output=None,
+                    upload_error=upload_error,
+                ), 400
+            if not parsed_resume["well_formed"] or parsed_resume["sparse"]:
+                # The local parse lost content (e.g. lines under unrecognized
+                # headings): let Gemini read the whole text instead.
+                old_resume_text, parsed_resume = parsed_resume["text"], None
+
+        resume_profile = full_resume_pipeline(
             name=name,
             headline=headline,
             contact=contact,
@@ -323,24 +636,76 @@ def resume_builder():
             target_role=target_role,
             job_description=job_description,
             tone=tone,
-            template_style=template_style,
             old_resume_text=old_resume_text,
             linkedin_profile=linkedin_profile,
+            parsed_resume=parsed_resume,
         )
+        template_style = normalize_style(template_style)
+        resume_output = render_text(resume_profile, template_style)
+
+        # Only the profile is stored; every layout is re-rendered from it.
+        session["last_resume_profile"] = resume_profile
+        session["last_resume_style"] = template_style
+        session["last_resume_name"] = name or resume_profile.get("name") or "resume"
+        history.record(_history_user(), "resume", "version", {
+            "target_role": target_role,
+            "template_style": template_style,
+            "profile": resume_profile,
+        })
+
+    return render_template(
+        "resume/resume.html",
+        resume_output=resume_output,
+        resume_profile=resume_profile,
+        template_style=template_style,
+        upload_error=upload_error,
+    )
+
 
-        session["last_resume_text"] = resume_output
-        session["last_resume_name"] = name or "resume"
+@app.route("/api/resume/multi", methods=["POST"])
+def api_resume_multi():
+    """
+    Build several tailored resumes from one extraction.
 
-    return render_template("resume/resume.html", resume_output=resume_output)
+    Body: the /resume form fields plus
+      "targets": [{"target_role": "...", "job_description": "..."}, ...]
+    """
+    data = request.get_json() or {}
+    targets = [t for t in data.get("targets") or [] if isinstance(t, dict)]
+    if not targets:
+        return jsonify({"error": "At least one target is required."}), 400
+    if len(targets) > MAX_RESUME_TARGETS:
+        return jsonify({"error": f"At most {MAX_RESUME_TARGETS} targets per request."}), 400
+
+    fields = (
+        "name", "headline", "contact", "location", "linkedin", "portfolio",
+        "education", "experience", "projects", "skills", "achievements",
+        "linkedin_profile",
+    )
+    source = {field: str(data.get(field) or "").strip() for field in fields}
+    try:
+        base_profile = build_base_profile(**source)
+    except Exception as exc:  # pylint: disable=broad-except
+        return jsonify({"error": f"Unable to extract profile: {exc}"}), 500
+
+    variants = multi_target_resume_pipeline(
+        base_profile,
+        targets,
+        tone=(data.get("tone") or "corporate").strip(),
+        template_style=normalize_style(data.get("template_style")),
+    )
+    return jsonify({"base_profile": base_profile, "variants": variants})
 
 
 @app.route("/resume/download", methods=["GET"])
 def download_resume():
-    resume_text = session.get("last_resume_text")
+    profile = session.get("last_resume_profile")
     name = session.get("last_resume_name", "resume")
 
-    if not resume_text:
+    if not profile:
         return redirect(url_for("resume_builder"))
+    style = request.args.get("style") or session.get("last_resume_style", "classic")
+    resume_text = render_text(profile, style)
 
     safe_name = "_".join(name.strip().split()).lower() or "resume"
     filename = f"{safe_name}.txt"
@@ -357,16 +722,57 @@ def download_resume():
     )
 
 
+@app.route("/resume/preview/<style>", methods=["GET"])
+def preview_resume(style):
+    """
+    Render the last generated resume in any template style (no API call).
+    """
+    profile = session.get("last_resume_profile")
+    if not profile:
+        return redirect(url_for("resume_builder"))
+    return render_html(profile, style)
+
+
+@app.route("/resume/print/<style>", methods=["GET"])
+def print_resume(style):
+    """
+    Print layout of the last generated resume (opens the browser print dialog).
+    """
+    profile = session.get("last_resume_profile")
+    if not profile:
+        return redirect(url_for("resume_builder"))
+    return render_html(profile, style, print_layout=True)
+
+
 # ==========================================================
 #             VIDEO-CALL STYLE MOCK INTERVIEW
 # ==========================================================
 
-def generate_question_set(user_profile: dict, count: int = 10) -> list:
+INTERVIEW_PROMPT_FAMILIES = ("question_gen", "evaluate")
+
+
+def _budgeted_profile(user_profile: dict) -> dict:
     """
-    Generate interview questions tailored to the candidate profile.
+    Interview profile with the pasted JD/resume cut to the tightest token
+    budget of the interview prompts. Run once when the session starts; the
+    result is what the session stores and every later prompt uses.
     """
-    prompt = f"""
-You are an experienced interviewer. Generate {count} realistic questions tailored to this candidate.
+    family = min(INTERVIEW_PROMPT_FAMILIES, key=lambda name: get_route(name).get("input_budget") or float("inf"))
+    texts = _fit_prompt_inputs(
+        family,
+        {
+            "job_description": user_profile.get("job_description") or "",
+            "resume_text": user_profile.get("resume_text") or "",
+        },
+        user_profile.get("role") or "",
+    )
+    return {**user_profile, **texts}
+
+
+def _question_set_prefix(user_profile: dict) -> str:
+    """Stable part of the question-generation prompt (cacheable per session)."""
+    return f"""
+You are an experienced interviewer generating realistic questions tailored to this candidate.
 
 Candidate profile:
 {json.dumps(user_profile, indent=2)}
@@ -387,46 +793,71 @@ Rules:
 - Do not add markdown fences or commentary.
 """
 
-    model = _get_model()
-    response = model.generate_content(prompt)
+
+def generate_question_set(user_profile: dict, count: int = 10, cache_name: str = None) -> list:
+    """
+    Generate interview questions tailored to the candidate profile.
+    cache_name reuses the session's cached prompt prefix when available.
+    """
+    response = generate_with_prefix(
+        "question_gen",
+        _question_set_prefix(user_profile),
+        f"\nGenerate {count} questions now.\n",
+        cache_name=cache_name,
+    )
     cleaned = _clean_gemini_json(response.text or "[]")
-    raw_questions = json.loads(cleaned)
+    raw_questions = json_loads(cleaned)
     if not isinstance(raw_questions, list):
         raise ValueError("Gemini did not return a list of questions.")
 
-    normalized = []
-    for idx, item in enumerate(raw_questions, start=1):
-        question_text = item.get("question") or item.get("text")
-        if not question_text:
-            continue
-        normalized.append({
-            "id": item.get("id") or f"q{idx}",
-            "question": question_text.strip(),
-            "category": (item.get("category") or "general").lower(),
-            "difficulty": (item.get("difficulty") or "medium").lower(),
-            "guidance": item.get("guidance", ""),
-        })
-
+    normalized = [
+        _normalize_question(item, idx)
+        for idx, item in enumerate(raw_questions, start=1)
+        if _has_question_text(item)
+    ]
     if not normalized:
         raise ValueError("Gemini returned no usable questions.")
     return normalized[:count]
 
 
-def evaluate_interview_answer(question: dict, answer: str, user_profile: dict) -> dict:
+def _has_question_text(item) -> bool:
+    return isinstance(item, dict) and bool(item.get("question") or item.get("text"))
+
+
+def _normalize_question(item: dict, idx: int) -> dict:
+    return {
+        "id": item.get("id") or f"q{idx}",
+        "question": (item.get("question") or item.get("text")).strip(),
+        "category": (item.get("category") or "general").lower(),
+        "difficulty": (item.get("difficulty") or "medium").lower(),
+        "guidance": item.get("guidance", ""),
+    }
+
+
+def stream_question_set(user_profile: dict, count: int = 10, cache_name: str = None):
     """
-    Evaluate an answer and return rating/feedback JSON.
+    Streaming generate_question_set(): yields each question as soon as its
+    JSON object has arrived and stops reading after count questions or at
+    the first off-schema element (llm/streaming.py).
     """
-    prompt = f"""
-You are an AI interview coach.
+    chunks = generate_stream_with_prefix(
+        "question_gen",
+        _question_set_prefix(user_profile),
+        f"\nGenerate {count} questions now.\n",
+        cache_name=cache_name,
+    )
+    for idx, item in enumerate(iter_array_items(chunks, limit=count, validate=_has_question_text), start=1):
+        yield _normalize_question(item, idx)
 
-User profile:
-{json.dumps(user_profile, indent=2)}
 
-Question:
-{json.dumps(question, indent=2)}
+def _evaluation_prefix(user_profile: dict) -> str:
+    """Stable part of the evaluation prompt (cacheable per session)."""
+    return f"""
+You are an AI interview coach. You will be given one interview question and the
+candidate's answer, and must evaluate the answer for this candidate.
 
-Candidate Answer:
-\"\"\"{answer}\"\"\"
+User profile:
+{json.dumps(user_profile, indent=2)}
 
 Return ONLY JSON with this schema:
 {{
@@ -439,10 +870,33 @@ Return ONLY JSON with this schema:
 Rating must be an integer 1-5.
 """
 
-    model = _get_model()
-    response = model.generate_content(prompt)
+
+def evaluate_interview_answer(
+    question: dict,
+    answer: str,
+    user_profile: dict,
+    cache_name: str = None,
+) -> dict:
+    """
+    Evaluate an answer and return rating/feedback JSON.
+    cache_name reuses the session's cached prompt prefix when available.
+    """
+    suffix = f"""
+Question:
+{json.dumps(question, indent=2)}
+
+Candidate Answer:
+\"\"\"{answer}\"\"\"
+"""
+
+    response = generate_with_prefix(
+        "evaluate",
+        _evaluation_prefix(user_profile),
+        suffix,
+        cache_name=cache_name,
+    )
     cleaned = _clean_gemini_json(response.text or "{}")
-    result = json.loads(cleaned)
+    result = json_loads(cleaned)
     if not isinstance(result, dict):
         raise ValueError("Gemini returned invalid evaluation.")
     result.setdefault("rating", 3)
@@ -452,10 +906,209 @@ Rating must be an integer 1-5.
     return result
 
 
+QUEUED_EVALUATION = {
+    "rating": None,
+    "feedback": (
+        "AI feedback is temporarily unavailable. Your answer was saved and "
+        "will be reviewed automatically."
+    ),
+    "correct_answer": None,
+    "followup_question": None,
+}
+
+
+def _interview_cache_key(user_profile: dict) -> str:
+    return make_key(
+        "interview_questions",
+        (user_profile.get("role") or "").strip().lower(),
+        user_profile.get("experience"),
+        user_profile.get("style"),
+    )
+
+
+def _fallback_interview_questions(user_profile: dict, count: int = 10) -> list:
+    """
+    Degraded mode: reuse cached questions for the same role bucket, else the
+    local question bank.
+    """
+    cached = response_cache.get(_interview_cache_key(user_profile))
+    if cached:
+        return [dict(q) for q in cached[:count]]
+    return bank_questions(count=count, style=user_profile.get("style"))
+
+
+# Generic questions per (role, experience, style) bucket, so common roles
+# start without waiting for Gemini.
+question_pool = QuestionPool(lambda profile, count: generate_question_set(profile, count))
+POOL_START_QUESTIONS = int(os.getenv("INTERVIEW_POOL_START_QUESTIONS", "5"))
+QUESTION_TOPUP_ROUNDS = int(os.getenv("QUESTION_DUP_TOPUP_ROUNDS", "1"))
+# Generate the next batch in the background when fewer questions remain.
+QUESTION_PREFETCH_AT = int(os.getenv("INTERVIEW_PREFETCH_AT", "2"))
+EVALUATION_STREAM_SECONDS = int(os.getenv("INTERVIEW_EVALUATION_STREAM_SECONDS", "60"))
+
+
+def _renumber_questions(questions: list, offset: int = 0) -> list:
+    for idx, q in enumerate(questions, start=1):
+        q["id"] = f"q{offset + idx}"
+    return questions
+
+
+def _dedupe_with_topup(index, questions: list, wanted: int, generate_more) -> list:
+    """
+    Drop near-duplicates of questions already in the index (and of each
+    other), then call generate_more(n) only for the shortfall.
+    """
+    fresh = index.filter(questions, limit=wanted)
+    for _ in range(QUESTION_TOPUP_ROUNDS):
+        shortfall = wanted - len(fresh)
+        if shortfall <= 0:
+            break
+        try:
+            extra = generate_more(shortfall)
+        except Exception:  # pylint: disable=broad-except
+            break
+        fresh.extend(index.filter(extra, limit=shortfall))
+    return fresh
+
+
+def _interview_dedupe_index(state: dict):
+    return session_index(
+        ("interview", state.get("interview_id")),
+        seed=[q.get("question", "") for q in state.get("questions", [])],
+    )
+
+
+# Start a non-pooled interview as soon as the first question has streamed in.
+STREAM_INTERVIEW_START = os.getenv("INTERVIEW_STREAM_START", "1") == "1"
+
+
+def _store_question_set(user_profile: dict, questions: list, personalized: bool) -> None:
+    """Keep a full generated set for degraded mode and, if generic, the shared pool."""
+    response_cache.set(_interview_cache_key(user_profile), questions)
+    if not personalized:
+        question_pool.add(user_profile, questions)
+
+
+def _drain_question_stream(question_stream, first: list, user_profile: dict, personalized: bool) -> list:
+    """
+    Background job: the rest of a streamed question set (merged like other
+    question jobs). Questions are kept as they arrive, so a stream that goes
+    off schema part-way still returns the ones parsed before it.
+    """
+    rest = []
+    try:
+        for question in question_stream:
+            rest.append(question)
+    except Exception:  # pylint: disable=broad-except
+        if not rest:
+            raise
+        return rest
+    _store_question_set(user_profile, first + rest, personalized)
+    return rest
+
+
+def _submit_question_job(state: dict, name: str, *args) -> None:
+    """Generate questions for the live interview in the background."""
+    jobs.submit((name, state["interview_id"]), generate_question_set, *args)
+    state.setdefault("question_jobs", []).append(name)
+
+
+def _merge_background_questions(state: dict) -> None:
+    """
+    Append questions generated in the background (the personalized set of a
+    pool-started session, prefetched batches) once they are ready.
+    """
+    pending = []
+    for name in state.get("question_jobs", []):
+        job = jobs.get((name, state.get("interview_id")))
+        if job is not None and job["status"] not in (jobs.DONE, jobs.FAILED):
+            pending.append(name)
+            continue
+        if job is not None and job["status"] == jobs.DONE:
+            questions = state.setdefault("questions", [])
+            fresh = _interview_dedupe_index(state).filter(job["result"] or [])
+            questions.extend(_renumber_questions(fresh, offset=len(questions)))
+    state["question_jobs"] = pending
+
+
+def _advance_interview(state: dict):
+    """
+    Move the live interview to its next question, generating more when the
+    session has run out. Returns the question, or None if none is available.
+    Prefetches the next batch in the background when few questions remain.
+    """
+    current_index = state.get("current_index", 0) + 1
+    if current_index >= len(state.get("questions", [])) and "streamed" in state.get("question_jobs", []):
+        # The rest of the first set is still streaming in: wait for it
+        # rather than generating a second set in this request.
+        jobs.wait(("streamed", state.get("interview_id")), get_route("question_gen")["latency_budget"])
+    _merge_background_questions(state)
+    questions = state.setdefault("questions", [])
+    cache_name = _session_caches(state).get("question_gen")
+
+    if current_index >= len(questions):
+        try:
+            fresh_questions = _dedupe_with_topup(
+                _interview_dedupe_index(state),
+                generate_question_set(state["profile"], cache_name=cache_name),
+                10,
+                lambda n: generate_question_set(state["profile"], count=n, cache_name=cache_name),
+            )
+        except Exception:  # pylint: disable=broad-except
+            fresh_questions = []
+        if not fresh_questions:
+            fresh_questions = bank_questions(
+                style=state["profile"].get("style"),
+                exclude=[q.get("question", "") for q in questions],
+            )
+        if not fresh_questions:
+            return None
+        questions.extend(_renumber_questions(fresh_questions, offset=len(questions)))
+
+    state["current_index"] = current_index
+    remaining = len(questions) - current_index - 1
+    if remaining < QUESTION_PREFETCH_AT and not state.get("question_jobs"):
+        _submit_question_job(state, "prefetch", state["profile"], 10, cache_name)
+    return questions[current_index]
+
+
+def _sync_history(state: dict) -> None:
+    """Fill in background evaluations that have finished since the last request."""
+    for entry in state.get("history", []):
+        if entry.get("status") not in ("pending", "queued"):
+            continue
+        job = jobs.get(("evaluation", state.get("interview_id"), entry["question_id"]))
+        if job is not None and job["status"] == jobs.DONE:
+            entry["evaluation"] = job["result"]
+            entry["status"] = "done"
+
+
+def _session_caches(state: dict) -> dict:
+    """
+    Context-cache names ({family: name}) for the live interview, once the
+    background creation started by /api/interview/start has finished.
+    """
+    if "context_caches" not in state:
+        job = jobs.get(("context_cache", state.get("interview_id")))
+        if job is None or job["status"] not in (jobs.DONE, jobs.FAILED):
+            return {}
+        state["context_caches"] = job["result"] or {}
+    return state["context_caches"]
+
+
+def _release_session_caches(state: dict) -> None:
+    if not state:
+        return
+    names = list(_session_caches(state).values())
+    if names:
+        jobs.submit(("release_cache", state.get("interview_id")), release_caches, names)
+
+
 # ------------------ INTERVIEW SIM ROUTES ------------------
 
 
 @app.route("/interview-sim", methods=["GET"])
+@cached_page
 def interview_sim_page():
     """
     Renders the video-call style mock interview page.
@@ -476,37 +1129,89 @@ def api_interview_start():
     job_description = data.get("job_description", "")
     resume_text = data.get("resume_text", "")
 
-    user_profile = {
+    user_profile = _budgeted_profile({
         "name": name,
         "role": role,
         "experience": experience,
         "style": style,
         "job_description": job_description,
         "resume_text": resume_text,
-    }
+    })
 
-    try:
-        questions = generate_question_set(user_profile)
-    except Exception as exc:  # pylint: disable=broad-except
-        return jsonify({"error": f"Unable to generate questions: {exc}"}), 500
+    degraded = False
+    personalized = bool(job_description.strip() or resume_text.strip())
+    # Personalized sessions are tailored in the background anyway: they
+    # draw from the pool but never trigger a refill of it.
+    questions = _renumber_questions(
+        question_pool.take(user_profile, POOL_START_QUESTIONS, refill=not personalized)
+    )
+    pooled = bool(questions)
+    question_stream = None
+    if not pooled:
+        try:
+            if STREAM_INTERVIEW_START:
+                # Answer with the first streamed question; the rest of the
+                # set is drained by a background job (see below).
+                question_stream = stream_question_set(user_profile)
+                questions = [next(question_stream)]
+            else:
+                questions = generate_question_set(user_profile)
+                _store_question_set(user_profile, questions, personalized)
+            if not personalized:
+                question_pool.refill(user_profile)
+        except Exception:  # pylint: disable=broad-except
+            questions = _fallback_interview_questions(user_profile)
+            question_stream = None
+            degraded = True
 
     if not questions:
         return jsonify({"error": "No questions generated."}), 500
 
+    _release_session_caches(session.get("live_interview"))
     interview_state = {
+        "interview_id": uuid.uuid4().hex,
         "profile": user_profile,
         "questions": questions,
         "current_index": 0,
         "history": [],
+        "question_jobs": [],
     }
+
+    # Pool questions are generic: tailor the rest of the session to the
+    # resume/JD in the background (merged in by next-question).
+    if pooled and personalized:
+        _submit_question_job(interview_state, "personalized", user_profile)
+    if question_stream is not None:
+        jobs.stream(
+            ("streamed", interview_state["interview_id"]),
+            _drain_question_stream,
+            question_stream,
+            list(questions),
+            user_profile,
+            personalized,
+        )
+        interview_state["question_jobs"].append("streamed")
     session["live_interview"] = interview_state
 
+    # Cache the stable prompt prefixes for the rest of the session (no-op
+    # when the profile is too small or caching is unavailable).
+    jobs.submit(
+        ("context_cache", interview_state["interview_id"]),
+        create_caches,
+        {
+            "evaluate": _evaluation_prefix(user_profile),
+            "question_gen": _question_set_prefix(user_profile),
+        },
+    )
+
     first_question = questions[0]
 
     return jsonify({
         "total_questions": len(questions),
         "question_index": 0,
         "question": first_question,
+        "degraded": degraded,
+        "pooled": pooled,
     })
 
 
@@ -531,8 +1236,26 @@ def api_interview_submit_answer():
     if not question:
         return jsonify({"error": "Question not found."}), 404
 
+    interview_id = state.setdefault("interview_id", uuid.uuid4().hex)
+    cache_name = _session_caches(state).get("evaluate")
+    queued = False
+    # Skipped, too-short and off-topic answers are rated locally.
+    evaluation = prescore_evaluation(question, answer)
     try:
-        evaluation = evaluate_interview_answer(question, answer, state["profile"])
+        if evaluation is None:
+            evaluation = evaluate_interview_answer(question, answer, state["profile"], cache_name)
+    except CircuitOpenError:
+        # Gemini is down: keep the answer and evaluate it once it recovers.
+        jobs.defer(
+            ("evaluation", interview_id, question_id),
+            evaluate_interview_answer,
+            question,
+            answer,
+            state["profile"],
+            cache_name,
+        )
+        evaluation = dict(QUEUED_EVALUATION)
+        queued = True
     except Exception as exc:  # pylint: disable=broad-except
         return jsonify({"error": f"Unable to evaluate answer: {exc}"}), 500
 
@@ -540,13 +1263,42 @@ def api_interview_submit_answer():
     history.append({
         "question_id": question_id,
         "answer": answer,
-        "evaluation": evaluation,
+        "evaluation": None if queued else evaluation,
+        "status": "queued" if queued else "done",
     })
     session["live_interview"] = state
 
+    if queued:
+        return jsonify({
+            "evaluation": evaluation,
+            "queued": True,
+            "retry_after": gemini_breaker.retry_after(),
+        }), 202
     return jsonify({"evaluation": evaluation})
 
 
+@app.route("/api/interview/evaluation/<question_id>", methods=["GET"])
+def api_interview_evaluation(question_id):
+    """
+    Poll for an evaluation running in the background (/api/interview/step)
+    or queued while Gemini was unavailable. Read-only: the session history
+    picks the result up in _sync_history() on the next step, so a poll
+    racing /api/interview/step cannot overwrite its session.
+    """
+    state = session.get("live_interview")
+    if not state or not state.get("interview_id"):
+        return jsonify({"error": "No active interview session."}), 400
+
+    job = jobs.get(("evaluation", state["interview_id"], question_id))
+    if job is None:
+        return jsonify({"error": "No pending evaluation for this question."}), 404
+    if job["status"] == jobs.FAILED:
+        return jsonify({"status": job["status"], "error": job["error"]}), 500
+    if job["status"] != jobs.DONE:
+        return jsonify({"status": job["status"]}), 202
+    return jsonify({"status": job["status"], "evaluation": job["result"]})
+
+
 @app.route("/api/interview/next-question", methods=["POST"])
 def api_interview_next_question():
     """
@@ -556,32 +1308,165 @@ def api_interview_next_question():
     if not state:
         return jsonify({"error": "No active interview session."}), 400
 
-    current_index = state.get("current_index", 0) + 1
-    questions = state.get("questions", [])
-
-    if current_index >= len(questions):
-        try:
-            fresh_questions = generate_question_set(state["profile"])
-        except Exception as exc:  # pylint: disable=broad-except
-            return jsonify({"error": f"Unable to fetch more questions: {exc}"}), 500
-        offset = len(questions)
-        for idx, q in enumerate(fresh_questions, start=1):
-            if not q.get("id"):
-                q["id"] = f"q{offset + idx}"
-        questions.extend(fresh_questions)
-        state["questions"] = questions
-
-    state["current_index"] = current_index
+    _sync_history(state)
+    question = _advance_interview(state)
     session["live_interview"] = state
+    if question is None:
+        return jsonify({"error": "Unable to fetch more questions."}), 503
 
-    question = questions[current_index]
     return jsonify({
-                "total_questions": len(questions),
-        "question_index": current_index,
+        "total_questions": len(state["questions"]),
+        "question_index": state["current_index"],
         "question": question,
     })
 
 
+@app.route("/api/interview/step", methods=["POST"])
+def api_interview_step():
+    """
+    Record the answer to the current question and return the next question
+    in one round trip. The evaluation runs in the background; fetch it from
+    /api/interview/evaluation/<question_id> (poll) or .../events (SSE).
+    An empty answer skips the question.
+    """
+    data = request.get_json() or {}
+    question_id = data.get("question_id")
+    answer = (data.get("answer") or "").strip()
+
+    state = session.get("live_interview")
+    if not state:
+        return jsonify({"error": "No active interview session."}), 400
+
+    question = next((q for q in state.get("questions", []) if q.get("id") == question_id), None)
+    if not question:
+        return jsonify({"error": "Question not found."}), 404
+
+    interview_id = state.setdefault("interview_id", uuid.uuid4().hex)
+    _sync_history(state)
+    # Skipped, too-short and off-topic answers are rated locally.
+    evaluation = prescore_evaluation(question, answer) if answer else None
+    if not answer:
+        status = "skipped"
+    elif evaluation is not None:
+        status = "done"
+    else:
+        jobs.submit(
+            ("evaluation", interview_id, question_id),
+            evaluate_interview_answer,
+            question,
+            answer,
+            state["profile"],
+            _session_caches(state).get("evaluate"),
+        )
+        status = "pending"
+    state.setdefault("history", []).append({
+        "question_id": question_id,
+        "answer": answer,
+        "evaluation": evaluation,
+        "status": status,
+    })
+
+    next_question = _advance_interview(state)
+    session["live_interview"] = state
+
+    payload = {
+        "answered_question_id": question_id,
+        "evaluation_status": status,
+        "evaluation": evaluation,
+    }
+    if status == "pending":
+        payload["evaluation_url"] = url_for("api_interview_evaluation", question_id=question_id)
+        payload["evaluation_events_url"] = url_for(
+            "api_interview_evaluation_events", question_id=question_id
+        )
+    if next_question is None:
+        payload["error"] = "Unable to fetch more questions."
+        return jsonify(payload), 503
+    payload.update({
+        "total_questions": len(state["questions"]),
+        "question_index": state["current_index"],
+        "question": next_question,
+    })
+    return jsonify(payload)
+
+
+@app.route("/api/interview/evaluation/<question_id>/events", methods=["GET"])
+def api_interview_evaluation_events(question_id):
+    """
+    Server-sent events for a background evaluation: comment heartbeats while
+    it runs, then one "evaluation" event with {status, evaluation|error}.
+    """
+    state = session.get("live_interview")
+    if not state or not state.get("interview_id"):
+        return jsonify({"error": "No active interview session."}), 400
+    key = ("evaluation", state["interview_id"], question_id)
+    if jobs.get(key) is None:
+        return jsonify({"error": "No pending evaluation for this question."}), 404
+
+    def events():
+        deadline = time.monotonic() + EVALUATION_STREAM_SECONDS
+        last_beat = time.monotonic()
+        while True:
+            job = jobs.get(key)
+            if job is None or job["status"] in (jobs.DONE, jobs.FAILED):
+                break
+            if time.monotonic() > deadline:
+                yield "event: timeout\ndata: {}\n\n"
+                return
+            if time.monotonic() - last_beat >= 5:
+                last_beat = time.monotonic()
+                yield ": waiting\n\n"
+            time.sleep(0.25)
+        if job is None:
+            body = {"status": jobs.FAILED, "error": "Evaluation expired."}
+        elif job["status"] == jobs.FAILED:
+            body = {"status": job["status"], "error": job["error"]}
+        else:
+            body = {"status": job["status"], "evaluation": job["result"]}
+        yield f"event: evaluation\ndata: {json_dumps(body)}\n\n"
+
+    return Response(
+        events(),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.route("/api/interview/end", methods=["POST"])
+def api_interview_end():
+    """
+    End the live interview and expire its cached prompt context.
+    """
+    state = session.pop("live_interview", None)
+    if not state:
+        return jsonify({"status": "ended", "answered": 0})
+    _release_session_caches(state)
+    drop_session(("interview", state.get("interview_id")))
+    _sync_history(state)
+    if state.get("history"):
+        history.record(_history_user(), "interview", "session", _interview_history_payload(state))
+    return jsonify({"status": "ended", "answered": len(state.get("history", []))})
+
+
+def _interview_history_payload(state: dict) -> dict:
+    profile = state.get("profile", {})
+    questions = {q["id"]: q.get("question") for q in state.get("questions", [])}
+    return {
+        "interview_id": state.get("interview_id"),
+        "role": profile.get("role"),
+        "experience": profile.get("experience"),
+        "style": profile.get("style"),
+        "answers": [
+            {
+                "question": questions.get(entry.get("question_id")),
+                "answer": entry.get("answer"),
+                "rating": (entry.get("evaluation") or {}).get("rating"),
+            }
+            for entry in state.get("history", [])
+        ],
+    }
+
+
 # ==========================================================
 #                SKILL ASSESSMENT (QUIZ + Q&A)
 # ==========================================================
@@ -594,14 +1479,21 @@ def _clean_gemini_json(text: str) -> str:
     return cleaned
 
 
-def _generate_ai_questions(filters: dict) -> list:
+QUIZ_LAZY_EXPLANATIONS = os.getenv("QUIZ_LAZY_EXPLANATIONS", "1") == "1"
+EXPLANATION_BATCH_SIZE = int(os.getenv("QUIZ_EXPLANATION_BATCH_SIZE", "3"))
+
+
+def _question_prompt(filters: dict) -> tuple:
     """
-    Call Gemini to generate quiz/interview questions.
+    Build the question-generation prompt; returns (prompt, num_questions).
 
     filters keys:
       mode: quiz|interview
       num_questions: int (<=15)
       company, technology, role, difficulty, question_type
+
+    With QUIZ_LAZY_EXPLANATIONS, MCQs are generated without explanations;
+    /api/quiz/explanations fills them in for missed questions after grading.
     """
     mode = filters.get("mode", "quiz").lower()
     num_questions = max(1, min(int(filters.get("num_questions", 5)), 15))
@@ -611,6 +1503,7 @@ def _generate_ai_questions(filters: dict) -> list:
     difficulty = (filters.get("difficulty") or "Mixed").lower()
     question_type = filters.get("question_type") or ("MCQ" if mode == "quiz" else "Theory")
     keywords = filters.get("search_text") or "None"
+    focus_line = f"\n- Sub-focus for this batch: {filters['focus']}" if filters.get("focus") else ""
 
     quiz_schema = """
 [
@@ -627,6 +1520,8 @@ def _generate_ai_questions(filters: dict) -> list:
   }
 ]
 """.strip()
+    if QUIZ_LAZY_EXPLANATIONS:
+        quiz_schema = quiz_schema.replace('    "explanation": "1-2 sentence reasoning",\n', "")
 
     interview_schema = """
 [
@@ -652,7 +1547,7 @@ Generate {num_questions} distinct questions for:
 - Difficulty preference: {difficulty}
 - Question type requested: {question_type}
 - Mode: {"Quiz/MCQ" if mode == "quiz" else "Interview coaching"}
-- Extra keywords or constraints: {keywords}
+- Extra keywords or constraints: {keywords}{focus_line}
 
 Rules:
 - Questions must be realistic for {role} roles at {company}.
@@ -665,11 +1560,118 @@ Rules:
 Expected JSON format:
 {quiz_schema if mode == "quiz" else interview_schema}
 """
+    return prompt, num_questions
+
+
+# Shared, bounded pool for requests that fan out into parallel Gemini calls
+# (quiz shards, explanation batches, multi-target resumes). Its workers only wait on generate(),
+# which runs on llm/routing.py's own pool, so the two never deadlock.
+_fanout_executor = ThreadPoolExecutor(
+    max_workers=int(os.getenv("LLM_FANOUT_WORKERS", "8")),
+    thread_name_prefix="llm-fanout",
+)
+
+# Large requests are split into shards of about QUIZ_SHARD_SIZE questions
+# generated concurrently: output length dominates generation time.
+QUIZ_SHARD_MIN_QUESTIONS = int(os.getenv("QUIZ_SHARD_MIN_QUESTIONS", "8"))
+QUIZ_SHARD_SIZE = int(os.getenv("QUIZ_SHARD_SIZE", "4"))
+SHARD_DIFFICULTIES = ("easy", "medium", "hard")
+SHARD_FOCUS = (
+    "core concepts and definitions",
+    "practical usage and code behaviour",
+    "edge cases, pitfalls and debugging",
+    "performance, scaling and design trade-offs",
+)
+
 
-    model = _get_model()
-    response = model.generate_content(prompt)
+def _requested_question_count(filters: dict) -> int:
+    """filters["num_questions"] clamped to 1-15 (5 if missing or invalid)."""
+    try:
+        return max(1, min(int(filters.get("num_questions", 5)), 15))
+    except (TypeError, ValueError):
+        return 5
+
+
+def _generate_ai_questions(filters: dict) -> list:
+    """
+    Call Gemini to generate quiz/interview questions (see _question_prompt
+    for the filters). Requests of QUIZ_SHARD_MIN_QUESTIONS or more are
+    generated in parallel shards (_generate_sharded_questions).
+    """
+    num_questions = _requested_question_count(filters)
+    if QUIZ_SHARD_SIZE > 0 and num_questions >= max(QUIZ_SHARD_MIN_QUESTIONS, 2 * QUIZ_SHARD_SIZE):
+        return _generate_sharded_questions(filters, num_questions)
+    return _generate_question_batch(filters)
+
+
+def _shard_plan(filters: dict, num_questions: int) -> list:
+    """
+    Per-shard filters. A mixed difficulty is split evenly into easy, medium
+    and hard bands; within a band (or a fixed difficulty) shards get
+    different sub-focuses so they do not overlap.
+    """
+    difficulty = (filters.get("difficulty") or "mixed").lower()
+    if difficulty in SHARD_DIFFICULTIES:
+        bands = [(difficulty, num_questions)]
+    else:
+        base, extra = divmod(num_questions, len(SHARD_DIFFICULTIES))
+        bands = [(band, base + (1 if idx < extra else 0)) for idx, band in enumerate(SHARD_DIFFICULTIES)]
+
+    plan = []
+    for band, count in bands:
+        shards = max(1, round(count / QUIZ_SHARD_SIZE))
+        base, extra = divmod(count, shards)
+        for idx in range(shards):
+            size = base + (1 if idx < extra else 0)
+            if not size:
+                continue
+            shard = {**filters, "num_questions": size, "difficulty": band}
+            if shards > 1:
+                shard["focus"] = SHARD_FOCUS[idx % len(SHARD_FOCUS)]
+            plan.append(shard)
+    return plan
+
+
+def _generate_sharded_questions(filters: dict, num_questions: int) -> list:
+    """
+    Generate the shards concurrently and merge them in plan order: exact
+    duplicates (by normalized text) are dropped and ids renumbered. A failed
+    shard only shortens the result (api_generate_questions tops up the
+    shortfall); the error is raised only if every shard failed.
+    """
+    plan = _shard_plan(filters, num_questions)
+    results = [None] * len(plan)
+    errors = []
+    futures = {_fanout_executor.submit(_generate_question_batch, shard): idx for idx, shard in enumerate(plan)}
+    for future in as_completed(futures):
+        try:
+            results[futures[future]] = future.result()
+        except Exception as exc:  # pylint: disable=broad-except
+            errors.append(exc)
+    if len(errors) == len(plan):
+        raise errors[0]
+
+    merged, seen = [], set()
+    for shard, questions in zip(plan, results):
+        for q in (questions or [])[:shard["num_questions"]]:
+            if not isinstance(q, dict):
+                continue
+            key = " ".join(str(q.get("question") or "").lower().split())
+            if not key or key in seen:
+                continue
+            seen.add(key)
+            # Keep the model's own label; the shard's band only fills a gap.
+            q["difficulty"] = q.get("difficulty") or shard["difficulty"]
+            merged.append(q)
+    return _renumber_questions(merged[:num_questions])
+
+
+def _generate_question_batch(filters: dict) -> list:
+    """One Gemini call for up to 15 questions."""
+    prompt, num_questions = _question_prompt(filters)
+    response = generate("question_gen", prompt)
     cleaned = _clean_gemini_json(response.text or "[]")
-    questions = json.loads(cleaned)
+    questions = json_loads(cleaned)
 
     if not isinstance(questions, list):
         raise ValueError("Gemini did not return a list of questions.")
@@ -677,13 +1679,96 @@ Expected JSON format:
     return questions[:num_questions]
 
 
-def _evaluate_interview_answers(entries: list) -> list:
+def _explanation_cache_key(question: dict) -> str:
+    return make_key(
+        "explanation",
+        question.get("question"),
+        question.get("options"),
+        question.get("correct_option_index"),
+    )
+
+
+def _cached_explanation(question: dict) -> str:
+    return question.get("explanation") or response_cache.get(_explanation_cache_key(question)) or ""
+
+
+def _generate_explanations(questions: list) -> dict:
     """
-    Ask Gemini to review user answers vs. model answers.
-    entries: [{id, question, model_answer, user_answer}]
+    One Gemini call explaining the correct option of each MCQ.
+    Returns {question_id: explanation} and caches every explanation.
     """
-    prompt_payload = json.dumps(entries, indent=2)
+    items = [
+        {
+            "id": q["id"],
+            "question": q.get("question"),
+            "options": q.get("options", []),
+            "correct_option_index": q.get("correct_option_index"),
+        }
+        for q in questions
+    ]
     prompt = f"""
+You are an expert interviewer reviewing a multiple-choice quiz.
+
+For each question below, explain in 1-2 sentences why the option at
+correct_option_index (0-based) is correct and the others are not.
+
+Questions JSON:
+{json.dumps(items, indent=2)}
+
+Return ONLY a JSON array: [{{"id": "q1", "explanation": "..."}}]
+Do not wrap the JSON in markdown fences or commentary.
+"""
+    response = generate("explain", prompt)
+    data = json_loads(_clean_gemini_json(response.text or "[]"))
+    if not isinstance(data, list):
+        raise ValueError("Gemini did not return a list of explanations.")
+
+    by_id = {q["id"]: q for q in questions}
+    explanations = {}
+    for entry in data:
+        if not isinstance(entry, dict) or entry.get("id") not in by_id:
+            continue
+        text = " ".join(str(entry.get("explanation") or "").split())
+        if text:
+            explanations[entry["id"]] = text
+            response_cache.set(_explanation_cache_key(by_id[entry["id"]]), text)
+    return explanations
+
+
+def _stream_explanations(questions: list):
+    """
+    Yield NDJSON lines {"id", "explanation"} as explanations become ready:
+    cached ones first, then one line per question as each parallel batch of
+    EXPLANATION_BATCH_SIZE returns. Failed batches yield {"id", "error"}.
+    """
+    missing = []
+    for q in questions:
+        text = _cached_explanation(q)
+        if text:
+            yield json_dumps({"id": q["id"], "explanation": text}) + "\n"
+        else:
+            missing.append(q)
+    if not missing:
+        return
+
+    size = max(1, EXPLANATION_BATCH_SIZE)
+    batches = [missing[i:i + size] for i in range(0, len(missing), size)]
+    futures = {_fanout_executor.submit(_generate_explanations, batch): batch for batch in batches}
+    for future in as_completed(futures):
+        try:
+            explanations = future.result()
+        except Exception:  # pylint: disable=broad-except
+            explanations = {}
+        for q in futures[future]:
+            if q["id"] in explanations:
+                yield json_dumps({"id": q["id"], "explanation": explanations[q["id"]]}) + "\n"
+            else:
+                yield json_dumps({"id": q["id"], "error": "Explanation unavailable."}) + "\n"
+
+
+def _batch_review_prompt(entries: list) -> str:
+    prompt_payload = json.dumps(entries, indent=2)
+    return f"""
 You are an interview coach. For each entry in the JSON array below, compare the
 candidate answer to the provided model answer. Provide structured feedback.
 
@@ -704,16 +1789,115 @@ Return JSON array with the same order, using this schema (no markdown, just JSON
 
 Rating must be an integer 1-5.
 """
-    model = _get_model()
-    response = model.generate_content(prompt)
+
+
+def _evaluate_interview_answers(entries: list) -> list:
+    """
+    Ask Gemini to review user answers vs. model answers.
+    entries: [{id, question, model_answer, user_answer}]
+    """
+    response = generate("batch_review", _batch_review_prompt(entries))
     cleaned = _clean_gemini_json(response.text or "[]")
-    evaluations = json.loads(cleaned)
+    evaluations = json_loads(cleaned)
     if not isinstance(evaluations, list):
         raise ValueError("Gemini did not return a list of evaluations.")
     return evaluations
 
 
+def _review_interview_entries(entries: list) -> list:
+    """
+    Pre-score trivial answers locally, send only the substantive ones to
+    Gemini, and return all evaluations in the order of entries.
+    """
+    prescored = {entry["id"]: prescore_review(entry) for entry in entries}
+    to_model = [entry for entry in entries if prescored[entry["id"]] is None]
+    evaluations = _evaluate_interview_answers(to_model) if to_model else []
+    return merge_reviews(entries, prescored, evaluations)
+
+
+def _stream_reviews(entries: list):
+    """
+    Yield NDJSON lines {"id", "evaluation"} in the order evaluations are
+    ready: pre-scored answers at once, then each model evaluation as soon as
+    its JSON object has streamed in. The stream is cut once every answer has
+    one; answers left without an evaluation (off-schema output, a failed
+    call, an evaluation with an unknown or repeated id) get {"id", "error"}.
+    Evaluations are matched by id only, as in merge_reviews().
+    """
+    remaining = {}
+    for entry in entries:
+        evaluation = prescore_review(entry)
+        if evaluation is None:
+            remaining[str(entry["id"])] = entry
+        else:
+            yield json_dumps({"id": entry["id"], "evaluation": evaluation}) + "\n"
+    if not remaining:
+        return
+
+    error = "No evaluation was returned for this answer."
+    try:
+        items = iter_array_items(
+            generate_stream("batch_review", _batch_review_prompt(list(remaining.values()))),
+            limit=len(remaining),
+            validate=lambda item: isinstance(item, dict) and "rating" in item,
+        )
+        for evaluation in items:
+            entry = remaining.pop(str(evaluation.get("id")), None)
+            if entry is None:
+                continue  # unknown or repeated id: never guess which answer it is for
+            evaluation["id"] = entry["id"]
+            yield json_dumps({"id": entry["id"], "evaluation": evaluation}) + "\n"
+            if not remaining:
+                break
+    except Exception as exc:  # pylint: disable=broad-except
+        error = f"Unable to review answer: {exc}"
+    for entry in remaining.values():
+        yield json_dumps({"id": entry["id"], "error": error}) + "\n"
+
+
+def _skills_cache_key(mode: str, filters: dict) -> str:
+    fields = ("num_questions", "company", "technology", "role", "difficulty",
+              "question_type", "search_text")
+    return make_key("skills_questions", mode, {f: filters.get(f) for f in fields})
+
+
+def _fallback_skills_questions(mode: str, filters: dict, cache_key: str) -> list:
+    """
+    Degraded mode for /api/generate_questions: cached response for the same
+    filters, else quiz/data.py MCQs or the interview question bank.
+    """
+    cached = response_cache.get(cache_key)
+    if cached:
+        return cached
+
+    try:
+        num_questions = max(1, min(int(filters.get("num_questions", 5)), 15))
+    except (TypeError, ValueError):
+        num_questions = 5
+    if mode == "quiz":
+        return fallback_quiz_questions(
+            question_bank(),
+            filters.get("company"),
+            filters.get("technology"),
+            filters.get("difficulty"),
+            num_questions,
+        )
+    return [
+        {
+            "id": q["id"],
+            "question": q["question"],
+            "model_answer": q["guidance"],
+            "difficulty": q["difficulty"],
+            "topic": q["category"].capitalize(),
+            "company": filters.get("company") or "Any company",
+            "role": filters.get("role") or "Any role",
+        }
+        for q in bank_questions(count=num_questions)
+    ]
+
+
 @app.route("/skills", methods=["GET"])
+@cached_page
 def skills_page():
     return render_template("skills/skills.html")
 
@@ -728,16 +1912,39 @@ def api_generate_questions():
     if mode not in ("quiz", "interview"):
         return jsonify({"error": "Invalid mode."}), 400
 
+    cache_key = _skills_cache_key(mode, data)
+    degraded = False
+    short = False
     try:
         questions = _generate_ai_questions(data)
-    except Exception as exc:  # pylint: disable=broad-except
-        return jsonify({"error": f"Unable to generate questions: {exc}"}), 500
+        response_cache.set(cache_key, questions)
+    except Exception:  # pylint: disable=broad-except
+        questions = _fallback_skills_questions(mode, data, cache_key)
+        degraded = True
+
+    if not degraded:
+        # Drop paraphrases of questions this user already got in earlier
+        # batches and top up to the requested count (this also covers failed
+        # shards); only the shortfall is requested again.
+        wanted = _requested_question_count(data)
+        skills_id = session.setdefault("skills_id", uuid.uuid4().hex)
+        questions = _renumber_questions(_dedupe_with_topup(
+            session_index(("skills", skills_id, mode)),
+            questions,
+            wanted,
+            lambda n: _generate_ai_questions({**data, "num_questions": n}),
+        ))
+        short = len(questions) < wanted
+
+    if mode == "quiz" and not degraded:
+        # Every generated MCQ grows the adaptive quiz bank.
+        adaptive_bank.add(questions, (data.get("technology") or "").strip())
 
     skills_state = session.get("skills_session", {})
     skills_state[mode] = questions
     session["skills_session"] = skills_state
 
-    return jsonify({"mode": mode, "questions": questions})
+    return jsonify({"mode": mode, "questions": questions, "degraded": degraded or short})
 
 
 @app.route("/api/grade_quiz", methods=["POST"])
@@ -754,12 +1961,28 @@ def api_grade_quiz():
         return jsonify({"error": "No quiz questions available. Generate questions first."}), 400
 
     question_map = {q["id"]: q for q in quiz_questions if "correct_option_index" in q}
-    total = len(question_map)
-    if total == 0:
+    if not question_map:
         return jsonify({"error": "Quiz questions missing answer keys."}), 500
 
+    graded = _grade_quiz_answers(question_map, answers)
+    history.record(_history_user(), "quiz", "graded", {
+        "topic": quiz_questions[0].get("topic"),
+        "score": graded["score"],
+        "total": graded["total"],
+        "answers": [
+            {"question": r["question"], "selected_option_index": r["selected_option_index"], "is_correct": r["is_correct"]}
+            for r in graded["results"]
+        ],
+    })
+    return jsonify(graded)
+
+
+def _grade_quiz_answers(question_map: dict, answers: list) -> dict:
+    """Score answers against {question_id: question}; unexplained misses are listed as pending."""
+    total = len(question_map)
     correct = 0
     results = []
+    pending = []
     for ans in answers:
         qid = ans.get("id")
         selected = ans.get("selected_option_index")
@@ -769,6 +1992,9 @@ def api_grade_quiz():
         is_correct = selected == q.get("correct_option_index")
         if is_correct:
             correct += 1
+        explanation = _cached_explanation(q)
+        if not is_correct and not explanation:
+            pending.append(qid)
         results.append({
             "id": qid,
             "question": q.get("question"),
@@ -776,29 +2002,188 @@ def api_grade_quiz():
             "selected_option_index": selected,
             "correct_option_index": q.get("correct_option_index"),
             "is_correct": is_correct,
-            "explanation": q.get("explanation", ""),
+            "explanation": explanation,
         })
 
-    return jsonify({
+    return {
         "score": correct,
         "total": total,
         "accuracy": (correct / total * 100) if total else 0,
         "results": results,
+        "pending_explanations": pending,
+    }
+
+
+@app.route("/api/quiz/explanations", methods=["POST"])
+def api_quiz_explanations():
+    """
+    Stream explanations for the given quiz question ids as NDJSON,
+    one {"id", "explanation"} (or {"id", "error"}) object per line.
+    """
+    payload = request.get_json() or {}
+    ids = payload.get("ids") or []
+    quiz_questions = session.get("skills_session", {}).get("quiz") or []
+    question_map = {q["id"]: q for q in quiz_questions if "correct_option_index" in q}
+    wanted = [question_map[qid] for qid in dict.fromkeys(ids) if qid in question_map]
+    if not wanted:
+        return jsonify({"error": "No matching quiz questions."}), 400
+
+    return Response(_stream_explanations(wanted), mimetype="application/x-ndjson")
+
+
+ADAPTIVE_MIN_BANK = int(os.getenv("ADAPTIVE_MIN_BANK", "8"))
+
+
+def _adaptive_table(topic: str):
+    """
+    Item table for the topic; when the bank has fewer than ADAPTIVE_MIN_BANK
+    matching items, one mixed-difficulty batch is generated into it first.
+    """
+    table = adaptive_bank.table(topic)
+    if len(table) < ADAPTIVE_MIN_BANK:
+        try:
+            adaptive_bank.add(_generate_ai_questions({
+                "mode": "quiz",
+                "num_questions": 15,
+                "technology": topic,
+                "difficulty": "mixed",
+            }), topic)
+            table = adaptive_bank.table(topic)
+        except Exception:  # pylint: disable=broad-except
+            pass
+    return table
+
+
+@app.route("/api/quiz/adaptive/start", methods=["POST"])
+def api_adaptive_quiz_start():
+    """
+    Start an adaptive MCQ assessment on the item bank (quiz/adaptive.py).
+    Body: {"technology"}. Returns the first question without its answer key.
+    """
+    payload = request.get_json() or {}
+    topic = (payload.get("technology") or "").strip()
+    table = _adaptive_table(topic)
+    if not len(table):
+        return jsonify({"error": "No questions available for this topic yet."}), 503
+
+    theta, se = table.estimate([], [])
+    first_id = table.next_item(theta, [])
+    state = {"assessment_id": uuid.uuid4().hex, "topic": topic, "items": [first_id], "responses": []}
+    session["adaptive_quiz"] = state
+
+    return jsonify({
+        "assessment_id": state["assessment_id"],
+        "question": public_question(adaptive_bank.get(first_id)),
+        "question_number": 1,
+        "max_questions": ADAPTIVE_MAX_ITEMS,
+        "theta": round(theta, 3),
+        "se": round(se, 3),
     })
 
 
+@app.route("/api/quiz/adaptive/answer", methods=["POST"])
+def api_adaptive_quiz_answer():
+    """
+    Grade the pending adaptive question, update the ability estimate and
+    return either the next question or, once it is precise enough, the result.
+    """
+    payload = request.get_json() or {}
+    state = session.get("adaptive_quiz")
+    if not state or len(state["items"]) == len(state["responses"]):
+        return jsonify({"error": "No adaptive quiz question pending. Start a new assessment."}), 400
+    question_id = state["items"][-1]
+    if payload.get("question_id") not in (None, question_id):
+        return jsonify({"error": "Answer does not match the pending question."}), 400
+
+    question = adaptive_bank.get(question_id)
+    selected = payload.get("selected_option_index")
+    is_correct = question is not None and selected == question.get("correct_option_index")
+    state["responses"].append(1 if is_correct else 0)
+    record_attempt(state["assessment_id"], question_id, is_correct)
+
+    table = adaptive_bank.table(state["topic"])
+    theta, se = table.estimate(state["items"], state["responses"])
+    asked = len(state["items"])
+    result = {
+        "question_id": question_id,
+        "is_correct": is_correct,
+        "correct_option_index": (question or {}).get("correct_option_index"),
+        "explanation": _cached_explanation(question) if question else "",
+        "answered": asked,
+        "theta": round(theta, 3),
+        "se": round(se, 3),
+    }
+
+    next_id = None
+    if not should_stop(asked, se, len(table) - asked):
+        next_id = table.next_item(theta, state["items"])
+    if next_id:
+        state["items"].append(next_id)
+        result["question"] = public_question(adaptive_bank.get(next_id))
+        result["question_number"] = asked + 1
+    else:
+        result["score"] = sum(state["responses"])
+        result["level"] = ability_level(theta)
+        registry.observe("adaptive_quiz_questions", asked)
+        history.record(_history_user(), "quiz", "adaptive", {
+            "assessment_id": state["assessment_id"],
+            "topic": state["topic"],
+            "answered": asked,
+            "score": result["score"],
+            "theta": result["theta"],
+            "se": result["se"],
+            "level": result["level"],
+        })
+    result["done"] = next_id is None
+    session["adaptive_quiz"] = state
+    return jsonify(result)
+
+
 @app.route("/api/review_interview_answers", methods=["POST"])
 def api_review_interview_answers():
     """
     Send interview answers to Gemini for evaluation.
     """
     payload = request.get_json() or {}
-    answers = payload.get("answers", [])
-    skills_state = session.get("skills_session", {})
-    interview_questions = skills_state.get("interview")
+    interview_questions = session.get("skills_session", {}).get("interview")
     if not interview_questions:
         return jsonify({"error": "No interview questions available. Generate questions first."}), 400
+    entries = _skills_review_entries(interview_questions, payload.get("answers", []))
+    if not entries:
+        return jsonify({"error": "No valid answers to review."}), 400
 
+    try:
+        evaluations = _review_interview_entries(entries)
+    except CircuitOpenError:
+        return _queue_review(entries)
+    except Exception as exc:  # pylint: disable=broad-except
+        return jsonify({"error": f"Unable to review answers: {exc}"}), 500
+
+    return jsonify({"evaluations": evaluations})
+
+
+@app.route("/api/review_interview_answers/stream", methods=["POST"])
+def api_review_interview_answers_stream():
+    """
+    Streaming review: NDJSON, one {"id", "evaluation"} (or {"id", "error"})
+    line per answer as soon as it is evaluated. While Gemini is unavailable
+    the review is queued exactly like /api/review_interview_answers.
+    """
+    payload = request.get_json() or {}
+    interview_questions = session.get("skills_session", {}).get("interview")
+    if not interview_questions:
+        return jsonify({"error": "No interview questions available. Generate questions first."}), 400
+    entries = _skills_review_entries(interview_questions, payload.get("answers", []))
+    if not entries:
+        return jsonify({"error": "No valid answers to review."}), 400
+    if gemini_breaker.state == OPEN:
+        return _queue_review(entries)
+
+    return Response(_stream_reviews(entries), mimetype="application/x-ndjson")
+
+
+def _skills_review_entries(interview_questions: list, answers: list) -> list:
+    """[{id, question, model_answer, user_answer}] for answers to known questions."""
     question_map = {q["id"]: q for q in interview_questions}
     entries = []
     for ans in answers:
@@ -811,18 +2196,35 @@ def api_review_interview_answers():
             "id": qid,
             "question": q.get("question"),
             "model_answer": q.get("model_answer", ""),
-            "user_answer": user_answer or "User skipped this question.",
+            "user_answer": user_answer or SKIPPED_ANSWER,
         })
+    return entries
 
-    if not entries:
-        return jsonify({"error": "No valid answers to review."}), 400
 
-    try:
-        evaluations = _evaluate_interview_answers(entries)
-    except Exception as exc:  # pylint: disable=broad-except
-        return jsonify({"error": f"Unable to review answers: {exc}"}), 500
+def _queue_review(entries: list):
+    """Defer a review until Gemini is reachable; the client polls the job."""
+    job_id = uuid.uuid4().hex
+    jobs.defer(("review", job_id), _review_interview_entries, entries)
+    return jsonify({
+        "queued": True,
+        "job_id": job_id,
+        "retry_after": gemini_breaker.retry_after(),
+    }), 202
 
-    return jsonify({"evaluations": evaluations})
+
+@app.route("/api/review_interview_answers/<job_id>", methods=["GET"])
+def api_review_interview_answers_status(job_id):
+    """
+    Poll a review that was queued while Gemini was unavailable.
+    """
+    job = jobs.get(("review", job_id))
+    if job is None:
+        return jsonify({"error": "Unknown or expired review job."}), 404
+    if job["status"] == jobs.FAILED:
+        return jsonify({"status": job["status"], "error": job["error"]}), 500
+    if job["status"] != jobs.DONE:
+        return jsonify({"status": job["status"]}), 202
+    return jsonify({"status": job["status"], "evaluations": job["result"]})
 
 # ==========================================================
 #                     DASHBOARD API
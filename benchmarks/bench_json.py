@@ -0,0 +1,133 @@
+"""
+JSON encode time and bytes on the wire per API route.
+
+Calls each route through the Flask test client (Gemini replaced by canned
+responses), then re-encodes the route's JSON body with the stdlib and with
+the fast provider and compresses it with every available encoding.
+
+    python benchmarks/bench_json.py [--repeat 2000]
+"""
+import argparse
+import json
+import os
+import sys
+import timeit
+from types import SimpleNamespace
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.environ.setdefault("GEMINI_API_KEY", "bench")
+os.environ["LLM_CONTEXT_CACHE"] = "0"
+
+from llm import routing  # noqa: E402  pylint: disable=wrong-import-position
+from web import json_provider  # noqa: E402  pylint: disable=wrong-import-position
+from web.compression import available_encodings, compress  # noqa: E402  pylint: disable=wrong-import-position
+
+TOPICS = ["Arrays", "SQL", "Operating Systems", "Networking", "OOP", "System Design"]
+
+
+def _canned(family, prompt, cached_content=None):  # pylint: disable=unused-argument
+    if family == "batch_review":
+        entries = json.loads(prompt.split("Entries:")[1].split("Return JSON")[0])
+        body = [{
+            "id": entry["id"],
+            "rating": 4,
+            "verdict": "Strong",
+            "feedback": "Clear structure and a relevant example; quantify the impact next time. " * 3,
+            "strengths": ["Structured answer", "Relevant example", "Good terminology"],
+            "improvements": ["Quantify the result", "Mention trade-offs"],
+        } for entry in entries]
+    elif family == "evaluate":
+        body = {"rating": 4, "feedback": "Solid answer. " * 20, "correct_answer": "Key points. " * 20}
+    else:
+        body = [{
+            "id": f"q{i}",
+            "question": f"Question {i} about {TOPICS[i % len(TOPICS)]}: explain the trade-offs involved "
+                        f"and give a concrete example from a real project #{i}.",
+            "options": [f"Option {c} for question {i} with a plausible distractor" for c in "ABCD"],
+            "correct_option_index": i % 4,
+            "model_answer": "A strong answer covers definitions, trade-offs and an example. " * 2,
+            "difficulty": ["easy", "medium", "hard"][i % 3],
+            "topic": TOPICS[i % len(TOPICS)],
+            "company": "Any company",
+            "role": "SDE",
+        } for i in range(1, 16)]
+    return SimpleNamespace(text=json.dumps(body))
+
+
+def route_payloads(app) -> dict:
+    """{route: decoded JSON body} for the routes with the largest payloads."""
+    client = app.test_client()
+    payloads = {}
+
+    def call(name, method, path, **kwargs):
+        response = client.open(path, method=method, **kwargs)
+        payloads[name] = json.loads(response.get_data())
+        response.close()
+        return payloads[name]
+
+    quiz = call("POST /api/generate_questions (quiz)", "POST", "/api/generate_questions",
+                json={"mode": "quiz", "num_questions": 15})
+    call("POST /api/grade_quiz", "POST", "/api/grade_quiz", json={
+        "answers": [{"id": q["id"], "selected_option_index": 0} for q in quiz["questions"]],
+    })
+    interview = call("POST /api/generate_questions (interview)", "POST", "/api/generate_questions",
+                     json={"mode": "interview", "num_questions": 15})
+    call("POST /api/review_interview_answers", "POST", "/api/review_interview_answers", json={
+        "answers": [
+            {"id": q["id"], "answer": f"{q['question']} I would explain the trade-offs with an example."}
+            for q in interview["questions"]
+        ],
+    })
+    call("POST /api/interview/start", "POST", "/api/interview/start",
+         json={"role": "Software Engineer", "experience": "Fresher", "style": "General"})
+    call("GET /api/dashboard/summary", "GET", "/api/dashboard/summary")
+    return payloads
+
+
+def bench(payloads: dict, repeat: int) -> list:
+    rows = []
+    encodings = available_encodings()
+    for route, payload in payloads.items():
+        raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        row = {
+            "route": route,
+            "stdlib_us": timeit.timeit(lambda p=payload: json.dumps(p), number=repeat) / repeat * 1e6,
+            "fast_us": timeit.timeit(lambda p=payload: json_provider.dumps(p), number=repeat) / repeat * 1e6,
+            "identity_bytes": len(raw),
+        }
+        for encoding in encodings:
+            row[f"{encoding}_bytes"] = len(compress(raw, encoding))
+        rows.append(row)
+    return rows
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="JSON encode/compression benchmark per route")
+    parser.add_argument("--repeat", type=int, default=2000)
+    parser.add_argument("--json", action="store_true", help="print raw results as JSON")
+    args = parser.parse_args(argv)
+
+    routing.set_backend(_canned)
+    from app import app  # pylint: disable=import-outside-toplevel
+
+    rows = bench(route_payloads(app), args.repeat)
+    if args.json:
+        print(json.dumps({"backend": json_provider.BACKEND, "rows": rows}, indent=2))
+        return 0
+
+    encodings = available_encodings()
+    print(f"fast encoder: {json_provider.BACKEND}; encodings: {', '.join(encodings)}")
+    header = f"{'route':42} {'stdlib us':>10} {'fast us':>8} {'speedup':>8} {'bytes':>7}"
+    header += "".join(f" {enc + ' bytes':>10}" for enc in encodings)
+    print(header)
+    for row in rows:
+        line = (f"{row['route']:42} {row['stdlib_us']:>10.1f} {row['fast_us']:>8.1f} "
+                f"{row['stdlib_us'] / row['fast_us']:>7.1f}x {row['identity_bytes']:>7}")
+        line += "".join(f" {row[enc + '_bytes']:>10}" for enc in encodings)
+        print(line)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+"""
+Deterministic synthetic fixtures for the hot-path benchmarks.
+
+Shapes follow the real data: quiz/data.py bank questions, the MCQ schema
+returned by /api/generate_questions, fenced Gemini JSON, and the
+live_interview session state.
+"""
+import json
+import random
+
+COMPANIES = ["TCS", "Infosys", "Wipro", "Accenture", "Google", "Amazon", "Zoho", "Any company"]
+TECHS = ["DSA", "SQL", "Python", "Java", "OS", "DBMS", "Networking", "System Design"]
+ROLES = ["SDE", "Data Analyst", "Backend Engineer", "Frontend Developer"]
+DIFFICULTIES = ["Easy", "Medium", "Hard"]
+WORDS = ("array index query join thread process socket cache latency heap stack queue "
+         "tree graph hash lock commit schema class object interface pointer").split()
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize() + "?"
+
+
+def bank_questions(count: int, seed: int = 0) -> list:
+    """quiz/data.py-style questions."""
+    rng = random.Random(seed)
+    return [
+        {
+            "id": idx,
+            "question_text": _sentence(rng, 12),
+            "options": [_sentence(rng, 4) for _ in range(4)],
+            "correct_option": rng.randrange(4),
+            "explanation": _sentence(rng, 18),
+            "company_tags": rng.sample(COMPANIES, 2),
+            "tech_tags": rng.sample(TECHS, 2),
+            "role_tags": [rng.choice(ROLES)],
+            "round_type": "Technical",
+            "difficulty": rng.choice(DIFFICULTIES),
+            "question_type": "MCQ",
+        }
+        for idx in range(1, count + 1)
+    ]
+
+
+def skills_questions(count: int, seed: int = 0, explained: float = 0.5) -> list:
+    """Generated MCQs as stored in session["skills_session"]["quiz"]."""
+    rng = random.Random(seed)
+    questions = []
+    for idx in range(1, count + 1):
+        question = {
+            "id": f"q{idx}",
+            "question": _sentence(rng, 14),
+            "options": [_sentence(rng, 5) for _ in range(4)],
+            "correct_option_index": rng.randrange(4),
+            "difficulty": rng.choice(DIFFICULTIES).lower(),
+            "topic": rng.choice(TECHS),
+            "company": rng.choice(COMPANIES),
+            "role": rng.choice(ROLES),
+        }
+        if rng.random() < explained:
+            question["explanation"] = _sentence(rng, 18)
+        questions.append(question)
+    return questions
+
+
+def quiz_answers(questions: list, seed: int = 0) -> list:
+    rng = random.Random(seed)
+    return [{"id": q["id"], "selected_option_index": rng.randrange(4)} for q in questions]
+
+
+def bank_answers(questions: list, seed: int = 0) -> list:
+    rng = random.Random(seed)
+    return [rng.choice([None, 0, 1, 2, 3]) for _ in questions]
+
+
+def gemini_text(count: int, seed: int = 0) -> str:
+    """A fenced Gemini response carrying count MCQs."""
+    body = json.dumps(skills_questions(count, seed), indent=2)
+    return f"```json\n{body}\n```"
+
+
+def question_filters(seed: int = 0) -> dict:
+    rng = random.Random(seed)
+    return {
+        "mode": rng.choice(["quiz", "interview"]),
+        "num_questions": 15,
+        "company": rng.choice(COMPANIES),
+        "technology": rng.choice(TECHS),
+        "role": rng.choice(ROLES),
+        "difficulty": rng.choice(DIFFICULTIES),
+        "search_text": " ".join(rng.sample(WORDS, 5)),
+    }
+
+
+def interview_state(history: int, seed: int = 0) -> dict:
+    """A live_interview session state with `history` answered questions."""
+    rng = random.Random(seed)
+    questions = [
+        {
+            "id": f"q{idx}",
+            "question": _sentence(rng, 16),
+            "type": rng.choice(["technical", "behavioral", "hr"]),
+            "difficulty": rng.choice(DIFFICULTIES).lower(),
+            "reference_answer": " ".join(_sentence(rng, 12) for _ in range(3)),
+        }
+        for idx in range(1, history + 11)
+    ]
+    return {
+        "interview_id": "%032x" % rng.getrandbits(128),
+        "profile": {
+            "role": rng.choice(ROLES),
+            "experience": "Fresher",
+            "style": "General",
+            "job_description": " ".join(_sentence(rng, 15) for _ in range(6)),
+            "resume_text": " ".join(_sentence(rng, 15) for _ in range(10)),
+        },
+        "questions": questions,
+        "current_index": history,
+        "history": [
+            {
+                "question_id": questions[idx]["id"],
+                "answer": " ".join(_sentence(rng, 14) for _ in range(4)),
+                "evaluation": {
+                    "rating": rng.randint(1, 5),
+                    "feedback": " ".join(_sentence(rng, 12) for _ in range(3)),
+                    "correct_answer": " ".join(_sentence(rng, 12) for _ in range(2)),
+                },
+                "status": "done",
+            }
+            for idx in range(history)
+        ],
+        "question_jobs": [],
+    }
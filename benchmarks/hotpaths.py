@@ -0,0 +1,167 @@
+"""
+Microbenchmarks for pure-Python hot paths, with a stored baseline.
+
+    python benchmarks/hotpaths.py                   # compare against benchmarks/baseline.json
+    python benchmarks/hotpaths.py --save            # record a new baseline
+    python benchmarks/hotpaths.py -k grade --threshold 0.1
+
+Each case reports the best per-call time over --repeat rounds (the minimum
+is the least noisy estimate for CPU-bound code). Compared with the baseline,
+any case slower by more than --threshold (default 25%) is listed in a
+regression report and the exit status is 1. Baselines are machine-specific:
+record one on the machine that runs the comparison.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.environ.setdefault("GEMINI_API_KEY", "bench")
+
+from benchmarks import fixtures  # noqa: E402  pylint: disable=wrong-import-position
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+DEFAULT_THRESHOLD = float(os.getenv("BENCH_REGRESSION_THRESHOLD", "0.25"))
+QUESTION_SCALES = (10, 1_000, 100_000)
+HISTORY_SCALES = (1, 20, 200)
+
+
+def _cases():
+    """Yield (name, setup) pairs; setup() builds fixtures and returns the timed callable."""
+    import app as app_module  # pylint: disable=import-outside-toplevel
+    from quiz.services import filter_questions, grade_answers  # pylint: disable=import-outside-toplevel
+    from quiz.store import QuestionStore, build_store  # pylint: disable=import-outside-toplevel
+
+    for n in QUESTION_SCALES:
+        def clean(n=n):
+            text = fixtures.gemini_text(n)
+            return lambda: app_module._clean_gemini_json(text)  # pylint: disable=protected-access
+        yield f"clean_gemini_json[{n}]", clean
+
+        def filter_bank(n=n):
+            bank = fixtures.bank_questions(n)
+            random.seed(0)
+            return lambda: filter_questions(bank, "TCS", "DSA", "Medium", 10)
+        yield f"filter_questions[{n}]", filter_bank
+
+        def filter_store(n=n):
+            path = os.path.join(tempfile.mkdtemp(prefix="bench-qstore-"), "questions.qstore")
+            build_store(fixtures.bank_questions(n), path)
+            store = QuestionStore(path)
+            random.seed(0)
+            return lambda: filter_questions(store, "TCS", "DSA", "Medium", 10)
+        yield f"filter_question_store[{n}]", filter_store
+
+        def grade_skills(n=n):
+            questions = fixtures.skills_questions(n)
+            question_map = {q["id"]: q for q in questions}
+            answers = fixtures.quiz_answers(questions)
+            return lambda: app_module._grade_quiz_answers(question_map, answers)  # pylint: disable=protected-access
+        yield f"api_grade_quiz[{n}]", grade_skills
+
+        def grade_bank(n=n):
+            questions = fixtures.bank_questions(n)
+            answers = fixtures.bank_answers(questions)
+            return lambda: grade_answers(questions, answers)
+        yield f"submit_quiz[{n}]", grade_bank
+
+    def prompt():
+        filters = [fixtures.question_filters(seed) for seed in range(8)]
+        return lambda: [app_module._question_prompt(f) for f in filters]  # pylint: disable=protected-access
+    yield "question_prompt[x8]", prompt
+
+    serializer = app_module.app.session_interface.get_signing_serializer(app_module.app)
+    for n in HISTORY_SCALES:
+        def session_cookie(n=n):
+            data = {"live_interview": fixtures.interview_state(n)}
+            return lambda: serializer.loads(serializer.dumps(data))
+        yield f"session_cookie_roundtrip[{n}]", session_cookie
+
+
+def measure(func, repeat: int) -> float:
+    """Best seconds per call."""
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def run(pattern: str = "", repeat: int = 5) -> dict:
+    results = {}
+    for name, setup in _cases():
+        if pattern and pattern not in name:
+            continue
+        results[name] = measure(setup(), repeat)
+        print(f"  {name:36} {_fmt(results[name]):>12}", file=sys.stderr)
+    return results
+
+
+def _fmt(seconds: float) -> str:
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds / 1e-9:.0f} ns"
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list:
+    """[(name, baseline_s, current_s, ratio)] for cases slower than threshold."""
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if previous and current > previous * (1 + threshold):
+            regressions.append((name, previous, current, current / previous))
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Hot-path microbenchmarks")
+    parser.add_argument("-k", dest="pattern", default="", help="only cases whose name contains this")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed slowdown before failing (0.25 = 25%%)")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--save", action="store_true", help="write results as the new baseline")
+    args = parser.parse_args(argv)
+
+    results = run(args.pattern, args.repeat)
+
+    if args.save:
+        with open(args.baseline, "w", encoding="utf-8") as fh:
+            json.dump({
+                "python": platform.python_version(),
+                "machine": platform.machine(),
+                "results": results,
+            }, fh, indent=2, sort_keys=True)
+            fh.write("\n")
+        print(f"baseline saved to {os.path.relpath(args.baseline, ROOT)}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print("no baseline; run with --save first")
+        return 0
+    with open(args.baseline, encoding="utf-8") as fh:
+        baseline = json.load(fh)["results"]
+
+    print(f"{'case':36} {'baseline':>12} {'current':>12} {'change':>8}")
+    for name, current in results.items():
+        previous = baseline.get(name)
+        change = f"{(current / previous - 1) * 100:+.1f}%" if previous else "new"
+        print(f"{name:36} {_fmt(previous) if previous else '-':>12} {_fmt(current):>12} {change:>8}")
+
+    regressions = compare(results, baseline, args.threshold)
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%}:")
+        for name, previous, current, ratio in regressions:
+            print(f"  {name}: {_fmt(previous)} -> {_fmt(current)} ({ratio:.2f}x)")
+        return 1
+    print(f"\nno regressions beyond {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1 @@
+"""Practice history (interviews, quizzes, resume versions) and its export."""
@@ -0,0 +1,167 @@
+"""
+Export of the practice history as NDJSON or CSV.
+
+    GET /admin/history?feature=quiz&since=2026-01-01&limit=100     one JSON page + next_cursor
+    GET /admin/history/export?format=csv&user=...&until=...         the whole range, streamed
+    flask --app app history export --format ndjson --feature interview -o out.ndjson
+
+Both endpoints need the X-Admin-Token header (HISTORY_ADMIN_TOKEN). Exports
+are generated batch by batch from the keyset cursor in history/store.py, so
+memory stays flat however many rows match, and the id range is fixed when
+the export starts, so rows written during a long export are left out of it.
+"""
+import csv
+import io
+import json
+import os
+import sys
+
+import click
+from flask import Blueprint, Response, abort, jsonify, request
+from flask.cli import AppGroup
+
+from .store import (
+    EXPORT_BATCH_SIZE,
+    FEATURES,
+    decode_cursor,
+    encode_cursor,
+    format_time,
+    history,
+    parse_time,
+)
+
+HISTORY_ADMIN_TOKEN = os.getenv("HISTORY_ADMIN_TOKEN", "")
+ADMIN_HEADER = "X-Admin-Token"
+MAX_PAGE_SIZE = 1000
+CSV_COLUMNS = ("id", "time", "user", "feature", "kind", "payload")
+FORMATS = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+history_bp = Blueprint("history", __name__, url_prefix="/admin/history")
+history_cli = AppGroup("history", help="Practice history export.")
+
+
+def parse_filters(user=None, feature=None, since=None, until=None) -> dict:
+    """Validated export filters; ValueError on a bad feature or date."""
+    if feature and feature not in FEATURES:
+        raise ValueError(f"feature must be one of {', '.join(FEATURES)}.")
+    return {
+        "user": user or None,
+        "feature": feature or None,
+        "since": parse_time(since),
+        "until": parse_time(until),
+    }
+
+
+def row_dict(row: tuple) -> dict:
+    event_id, ts, user, feature, kind, payload = row
+    return {
+        "id": event_id,
+        "time": format_time(ts),
+        "user": user,
+        "feature": feature,
+        "kind": kind,
+        "payload": json.loads(payload),
+    }
+
+
+def iter_ndjson(rows):
+    for event_id, ts, user, feature, kind, payload in rows:
+        head = json.dumps({"id": event_id, "time": format_time(ts), "user": user, "feature": feature, "kind": kind})
+        # The stored payload is already JSON: splice it in instead of re-encoding.
+        yield f'{head[:-1]},"payload":{payload}}}\n'
+
+
+def iter_csv(rows, batch: int = EXPORT_BATCH_SIZE):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(CSV_COLUMNS)
+    for count, (event_id, ts, user, feature, kind, payload) in enumerate(rows, start=1):
+        writer.writerow((event_id, format_time(ts), user, feature, kind, payload))
+        if count % batch == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+
+def export_lines(fmt: str, filters: dict, upto: int = None):
+    rows = history.iter_rows(filters, upto=upto)
+    return iter_csv(rows) if fmt == "csv" else iter_ndjson(rows)
+
+
+def _require_admin() -> None:
+    token = request.headers.get(ADMIN_HEADER, "")
+    if not HISTORY_ADMIN_TOKEN or token != HISTORY_ADMIN_TOKEN:
+        abort(403)
+
+
+def _request_filters() -> dict:
+    return parse_filters(
+        request.args.get("user"),
+        request.args.get("feature"),
+        request.args.get("since"),
+        request.args.get("until"),
+    )
+
+
+@history_bp.route("", methods=["GET"])
+def list_history():
+    """One page of events; pass next_cursor back as ?cursor= for the next one."""
+    _require_admin()
+    limit = max(1, min(request.args.get("limit", 100, type=int), MAX_PAGE_SIZE))
+    try:
+        filters = _request_filters()
+        after, upto = decode_cursor(request.args["cursor"]) if request.args.get("cursor") else (0, history.high_water())
+    except ValueError as exc:
+        return jsonify({"error": str(exc)}), 400
+    rows, last_id = history.page(filters, after, upto, limit)
+    return jsonify({
+        "events": [row_dict(row) for row in rows],
+        "next_cursor": encode_cursor(last_id, upto) if last_id is not None else None,
+    })
+
+
+@history_bp.route("/export", methods=["GET"])
+def export_history():
+    """Stream every matching event as NDJSON (default) or CSV."""
+    _require_admin()
+    fmt = request.args.get("format", "ndjson")
+    if fmt not in FORMATS:
+        return jsonify({"error": f"format must be one of {', '.join(FORMATS)}."}), 400
+    try:
+        filters = _request_filters()
+    except ValueError as exc:
+        return jsonify({"error": str(exc)}), 400
+    upto = history.high_water()
+    response = Response(export_lines(fmt, filters, upto), mimetype=FORMATS[fmt])
+    response.headers["Content-Disposition"] = f"attachment; filename=history-{upto}.{fmt}"
+    response.headers["X-Export-Upto"] = str(upto)
+    return response
+
+
+@history_cli.command("export")
+@click.option("--format", "fmt", type=click.Choice(sorted(FORMATS)), default="ndjson")
+@click.option("--user")
+@click.option("--feature", type=click.Choice(FEATURES))
+@click.option("--since", help="ISO date/datetime (UTC) or epoch seconds")
+@click.option("--until", help="ISO date/datetime (UTC) or epoch seconds, exclusive")
+@click.option("-o", "--output", type=click.Path(dir_okay=False), help="file to write (default: stdout)")
+def export_command(fmt, user, feature, since, until, output):
+    """Export practice history as NDJSON or CSV."""
+    try:
+        filters = parse_filters(user, feature, since, until)
+    except ValueError as exc:
+        raise click.BadParameter(str(exc)) from exc
+    out = open(output, "w", encoding="utf-8", newline="") if output else sys.stdout
+    try:
+        for chunk in export_lines(fmt, filters):
+            out.write(chunk)
+    finally:
+        if output:
+            out.close()
+
+
+def init_history(app) -> None:
+    """Register the export endpoints and the `flask history` commands."""
+    app.register_blueprint(history_bp)
+    app.cli.add_command(history_cli)
@@ -0,0 +1,185 @@
+"""
+Append-only store of user practice history.
+
+Every finished interview, graded quiz and built resume is one row in an
+SQLite table (WAL mode, so exports read while the app keeps writing):
+
+    events(id, ts, user, feature, kind, payload)
+
+feature is one of FEATURES; payload is the JSON document of the event.
+Rows are never updated, which is what keeps long exports consistent without
+holding a read transaction open: an export fixes the highest id at its
+start and walks `id > cursor AND id <= upto` in keyset-paginated batches, so
+every batch is a short indexed query and rows written meanwhile are simply
+not part of it.
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+
+HISTORY_ENABLED = os.getenv("HISTORY_ENABLED", "1") == "1"
+HISTORY_DB = os.getenv(
+    "HISTORY_DB",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "instance", "history.sqlite3"),
+)
+EXPORT_BATCH_SIZE = int(os.getenv("HISTORY_EXPORT_BATCH_SIZE", "500"))
+
+FEATURES = ("interview", "quiz", "resume")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    ts REAL NOT NULL,
+    user TEXT NOT NULL,
+    feature TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS events_ts ON events (ts);
+CREATE INDEX IF NOT EXISTS events_user ON events (user, id);
+CREATE INDEX IF NOT EXISTS events_feature ON events (feature, id);
+"""
+
+
+def parse_time(value) -> float:
+    """Epoch seconds from an epoch number or an ISO date/datetime (UTC if naive)."""
+    if value in (None, ""):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    parsed = datetime.fromisoformat(str(value).strip().replace("Z", "+00:00"))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def format_time(ts: float) -> str:
+    return datetime.fromtimestamp(ts, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def encode_cursor(after: int, upto: int) -> str:
+    return f"{after}.{upto}"
+
+
+def decode_cursor(cursor: str) -> tuple:
+    """(after, upto) from a cursor string; ValueError if malformed."""
+    after, _, upto = (cursor or "").partition(".")
+    try:
+        after, upto = int(after), int(upto)
+    except ValueError:
+        raise ValueError("Invalid cursor.") from None
+    if after < 0 or upto < after:
+        raise ValueError("Invalid cursor.")
+    return after, upto
+
+
+class HistoryStore:
+    """SQLite-backed event log; one connection per thread."""
+
+    def __init__(self, path: str = HISTORY_DB):
+        self.path = path
+        self._local = threading.local()
+        self._schema_lock = threading.Lock()
+        self._schema_ready = False
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            with self._schema_lock:
+                if not self._schema_ready:
+                    conn.executescript(_SCHEMA)
+                    self._schema_ready = True
+            self._local.conn = conn
+        return conn
+
+    def record(self, user: str, feature: str, kind: str, payload: dict, ts: float = None) -> int:
+        """Append one event; returns its id, or None if it could not be stored. Never raises."""
+        if not HISTORY_ENABLED:
+            return None
+        try:
+            cursor = self._conn().execute(
+                "INSERT INTO events (ts, user, feature, kind, payload) VALUES (?, ?, ?, ?, ?)",
+                (ts or time.time(), user or "anonymous", feature, kind,
+                 json.dumps(payload, separators=(",", ":"), default=str)),
+            )
+            return cursor.lastrowid
+        except (sqlite3.Error, OSError, TypeError, ValueError):
+            return None
+
+    def high_water(self) -> int:
+        """Highest event id now: the consistent upper bound for an export."""
+        row = self._conn().execute("SELECT MAX(id) FROM events").fetchone()
+        return row[0] or 0
+
+    def _id_range(self, filters: dict, after: int, upto: int) -> tuple:
+        """Narrow (after, upto) to the ids inside the since/until window."""
+        conn = self._conn()
+        if filters.get("since") is not None:
+            first = conn.execute("SELECT MIN(id) FROM events WHERE ts >= ?", (filters["since"],)).fetchone()[0]
+            after = max(after, (first or upto + 1) - 1)
+        if filters.get("until") is not None:
+            last = conn.execute("SELECT MAX(id) FROM events WHERE ts < ?", (filters["until"],)).fetchone()[0]
+            upto = min(upto, last or 0)
+        return after, upto
+
+    def _where(self, filters: dict, after: int, upto: int) -> tuple:
+        # Time bounds are turned into an id range by _id_range(); "+ts" keeps
+        # SQLite walking ids instead of sorting the whole window by ts.
+        clauses = ["id > ?", "id <= ?"]
+        params = [after, upto]
+        if filters.get("user"):
+            clauses.append("user = ?")
+            params.append(filters["user"])
+        if filters.get("feature"):
+            clauses.append("feature = ?")
+            params.append(filters["feature"])
+        if filters.get("since") is not None:
+            clauses.append("+ts >= ?")
+            params.append(filters["since"])
+        if filters.get("until") is not None:
+            clauses.append("+ts < ?")
+            params.append(filters["until"])
+        return " AND ".join(clauses), params
+
+    def page(self, filters: dict, after: int = 0, upto: int = None, limit: int = EXPORT_BATCH_SIZE) -> tuple:
+        """
+        (rows, last_id) for the next page after `after`, up to id `upto`.
+        rows are (id, ts, user, feature, kind, payload_json) tuples; last_id is
+        None once the range is exhausted.
+        """
+        if upto is None:
+            upto = self.high_water()
+        start, end = self._id_range(filters, after, upto)
+        if start >= end:
+            return [], None
+        where, params = self._where(filters, start, end)
+        rows = self._conn().execute(
+            f"SELECT id, ts, user, feature, kind, payload FROM events WHERE {where} ORDER BY id LIMIT ?",
+            params + [limit],
+        ).fetchall()
+        last_id = rows[-1][0] if len(rows) == limit else None
+        return rows, last_id
+
+    def iter_rows(self, filters: dict, after: int = 0, upto: int = None, batch: int = EXPORT_BATCH_SIZE):
+        """Every matching row in id order, fetched batch by batch."""
+        if upto is None:
+            upto = self.high_water()
+        while True:
+            rows, after = self.page(filters, after, upto, batch)
+            yield from rows
+            if after is None:
+                return
+
+
+history = HistoryStore()
@@ -0,0 +1,149 @@
+"""
+Near-duplicate question detection with MinHash signatures and LSH banding.
+
+Questions are normalized (lower-case, stopwords dropped, crude stemming),
+shingled into character 5-grams and reduced to a NUM_PERM MinHash
+signature. Signatures are split into BANDS bands; two questions are only
+compared when they share a band, so a lookup touches a handful of
+candidates instead of the whole index.
+"""
+import os
+import random
+import re
+import threading
+import zlib
+from collections import OrderedDict
+
+NUM_PERM = 64
+BANDS = 16
+SHINGLE_SIZE = 5
+# Estimated Jaccard similarity at or above which two questions are repeats.
+SIMILARITY_THRESHOLD = float(os.getenv("QUESTION_DUP_THRESHOLD", "0.6"))
+MAX_SESSIONS = int(os.getenv("QUESTION_DUP_MAX_SESSIONS", "2000"))
+
+_PRIME = (1 << 61) - 1
+_rng = random.Random(1729)
+_PERMS = [(_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(NUM_PERM)]
+
+_WORD_RE = re.compile(r"[a-z0-9+#]+")
+_STOPWORDS = {
+    "a", "an", "and", "are", "can", "could", "describe", "do", "does", "explain",
+    "for", "how", "in", "is", "it", "of", "on", "or", "please", "the", "to",
+    "what", "when", "which", "why", "would", "you", "your",
+}
+
+
+def _stem(word: str) -> str:
+    if word.endswith("ing") and len(word) > 5:
+        word = word[:-3]
+    elif word.endswith("ed") and len(word) > 4:
+        word = word[:-2]
+    if word.endswith("s") and not word.endswith("ss") and len(word) > 3:
+        word = word[:-1]
+    if word.endswith("e") and len(word) > 3:
+        word = word[:-1]
+    return word
+
+
+def normalize(text: str) -> str:
+    words = _WORD_RE.findall((text or "").lower())
+    return " ".join(_stem(w) for w in words if w not in _STOPWORDS)
+
+
+def signature(text: str) -> tuple:
+    """MinHash signature of the question's character shingles."""
+    norm = normalize(text)
+    if len(norm) <= SHINGLE_SIZE:
+        shingles = {norm}
+    else:
+        shingles = {norm[i:i + SHINGLE_SIZE] for i in range(len(norm) - SHINGLE_SIZE + 1)}
+    hashes = [zlib.crc32(s.encode("utf-8")) for s in shingles]
+    return tuple(min((a * h + b) % _PRIME for h in hashes) for a, b in _PERMS)
+
+
+def similarity(sig_a: tuple, sig_b: tuple) -> float:
+    return sum(x == y for x, y in zip(sig_a, sig_b)) / NUM_PERM
+
+
+class NearDuplicateIndex:
+    """Thread-safe LSH index of question signatures."""
+
+    def __init__(self, threshold: float = SIMILARITY_THRESHOLD):
+        self.threshold = threshold
+        self._rows = NUM_PERM // BANDS
+        self._buckets = [dict() for _ in range(BANDS)]
+        self._signatures = []
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def _bands(self, sig: tuple):
+        for band in range(BANDS):
+            yield band, sig[band * self._rows:(band + 1) * self._rows]
+
+    def _is_duplicate(self, sig: tuple) -> bool:
+        candidates = set()
+        for band, key in self._bands(sig):
+            candidates.update(self._buckets[band].get(key, ()))
+        return any(similarity(sig, self._signatures[i]) >= self.threshold for i in candidates)
+
+    def contains(self, text: str) -> bool:
+        """True if a near-duplicate of text is already indexed."""
+        sig = signature(text)
+        with self._lock:
+            return self._is_duplicate(sig)
+
+    def add(self, text: str) -> bool:
+        """Index text unless it repeats an indexed question; True if added."""
+        sig = signature(text)
+        with self._lock:
+            if self._is_duplicate(sig):
+                return False
+            idx = len(self._signatures)
+            self._signatures.append(sig)
+            for band, key in self._bands(sig):
+                self._buckets[band].setdefault(key, []).append(idx)
+            return True
+
+    def filter(self, questions: list, limit: int = None, field: str = "question") -> list:
+        """
+        Up to limit questions whose text is new (also among themselves);
+        only the returned questions are indexed.
+        """
+        fresh = []
+        for question in questions:
+            if limit is not None and len(fresh) >= limit:
+                break
+            if self.add(question.get(field) or ""):
+                fresh.append(question)
+        return fresh
+
+
+_sessions = OrderedDict()
+_sessions_lock = threading.Lock()
+
+
+def session_index(session_key: str, seed=()) -> NearDuplicateIndex:
+    """
+    Per-session index, created from the seed texts (questions already shown)
+    on first use. The least recently used sessions are dropped beyond
+    MAX_SESSIONS.
+    """
+    with _sessions_lock:
+        index = _sessions.get(session_key)
+        if index is not None:
+            _sessions.move_to_end(session_key)
+            return index
+        index = NearDuplicateIndex()
+        for text in seed:
+            index.add(text)
+        _sessions[session_key] = index
+        while len(_sessions) > MAX_SESSIONS:
+            _sessions.popitem(last=False)
+        return index
+
+
+def drop_session(session_key: str) -> None:
+    with _sessions_lock:
+        _sessions.pop(session_key, None)
@@ -0,0 +1,135 @@
+"""
+In-process background jobs for interview features.
+
+submit() runs work on a small thread pool right away; stream() does the
+same on a separate pool for long-running stream drains, so they never hold
+the workers evaluations need; defer() parks work until the Gemini circuit
+breaker is no longer open and then runs it. Results are kept for
+JOB_TTL_SECONDS so clients can poll for them, or wait() for them.
+"""
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from llm.breaker import OPEN, CircuitOpenError, gemini_breaker
+
+JOB_TTL_SECONDS = 30 * 60
+DRAIN_INTERVAL_SECONDS = 2.0
+MAX_DEFERRED = int(os.getenv("INTERVIEW_MAX_DEFERRED_JOBS", "500"))
+
+PENDING = "pending"
+QUEUED = "queued"
+DONE = "done"
+FAILED = "failed"
+
+_executor = ThreadPoolExecutor(
+    max_workers=int(os.getenv("INTERVIEW_JOB_WORKERS", "4")),
+    thread_name_prefix="interview-jobs",
+)
+_stream_executor = ThreadPoolExecutor(
+    max_workers=int(os.getenv("INTERVIEW_STREAM_WORKERS", "8")),
+    thread_name_prefix="interview-streams",
+)
+_jobs = {}
+_deferred = deque()
+_lock = threading.Lock()
+_changed = threading.Condition(_lock)
+_drainer = None
+
+
+def _set(key, **fields) -> None:
+    with _lock:
+        job = _jobs.setdefault(key, {})
+        job.update(fields, updated_at=time.time())
+        _changed.notify_all()
+
+
+def _prune() -> None:
+    cutoff = time.time() - JOB_TTL_SECONDS
+    with _lock:
+        for key in [k for k, job in _jobs.items() if job["updated_at"] < cutoff]:
+            del _jobs[key]
+
+
+def _run(key, fn, args, kwargs) -> None:
+    try:
+        result = fn(*args, **kwargs)
+    except CircuitOpenError:
+        # Upstream went down again before this job ran: park it.
+        _enqueue(key, fn, args, kwargs)
+        return
+    except Exception as exc:  # pylint: disable=broad-except
+        _set(key, status=FAILED, error=str(exc))
+        return
+    _set(key, status=DONE, result=result)
+
+
+def submit(key, fn, *args, **kwargs) -> None:
+    """Run fn in the background and store its result under key."""
+    _prune()
+    _set(key, status=PENDING, result=None, error=None)
+    _executor.submit(_run, key, fn, args, kwargs)
+
+
+def stream(key, fn, *args, **kwargs) -> None:
+    """submit() on the stream pool, for jobs that consume a model stream."""
+    _prune()
+    _set(key, status=PENDING, result=None, error=None)
+    _stream_executor.submit(_run, key, fn, args, kwargs)
+
+
+def _enqueue(key, fn, args, kwargs) -> None:
+    global _drainer  # pylint: disable=global-statement
+    with _lock:
+        if len(_deferred) >= MAX_DEFERRED:
+            dropped_key = _deferred.popleft()[0]
+            _jobs.pop(dropped_key, None)
+        _deferred.append((key, fn, args, kwargs))
+        if _drainer is None:
+            _drainer = threading.Thread(target=_drain_loop, name="interview-jobs-drain", daemon=True)
+            _drainer.start()
+    _set(key, status=QUEUED, result=None, error=None)
+
+
+def defer(key, fn, *args, **kwargs) -> None:
+    """Queue fn until Gemini is reachable again, then run it like submit()."""
+    _prune()
+    _enqueue(key, fn, args, kwargs)
+
+
+def _drain_loop() -> None:
+    global _drainer  # pylint: disable=global-statement
+    while True:
+        time.sleep(DRAIN_INTERVAL_SECONDS)
+        if gemini_breaker.state == OPEN:
+            continue
+        with _lock:
+            batch = list(_deferred)
+            _deferred.clear()
+        for key, fn, args, kwargs in batch:
+            _set(key, status=PENDING)
+            _executor.submit(_run, key, fn, args, kwargs)
+        with _lock:
+            if not _deferred:
+                _drainer = None
+                return
+
+
+def get(key):
+    """Return {"status", "result", "error"} for key, or None if unknown/expired."""
+    with _lock:
+        job = _jobs.get(key)
+        return dict(job) if job else None
+
+
+def wait(key, timeout: float):
+    """get(key) once the job is DONE or FAILED, or as it stands after timeout seconds."""
+    with _changed:
+        _changed.wait_for(
+            lambda: _jobs.get(key) is None or _jobs[key]["status"] in (DONE, FAILED),
+            timeout,
+        )
+        job = _jobs.get(key)
+        return dict(job) if job else None
@@ -0,0 +1,160 @@
+"""
+Shared per-bucket interview question pools.
+
+Profiles are bucketed by (role, experience, style). Each bucket keeps a
+stock of pre-generated generic questions, deduplicated against everything
+the bucket has ever stocked (interview/dedupe.py), so a session can
+start without waiting for Gemini. Every question is served at most
+POOL_MAX_SERVES times; buckets that fall below POOL_LOW_WATER are refilled
+by a background worker, but only once they have been asked for
+POOL_MIN_REQUESTS times, so one-off roles do not cost a batch of
+generations. At most POOL_MAX_BUCKETS buckets are kept; the least recently
+used one is dropped beyond that.
+"""
+import os
+import queue
+import random
+import re
+import threading
+from collections import OrderedDict
+
+from .dedupe import NearDuplicateIndex
+
+POOL_TARGET = int(os.getenv("INTERVIEW_POOL_TARGET", "30"))
+POOL_LOW_WATER = int(os.getenv("INTERVIEW_POOL_LOW_WATER", "15"))
+POOL_BATCH_SIZE = int(os.getenv("INTERVIEW_POOL_BATCH_SIZE", "10"))
+POOL_MAX_SERVES = int(os.getenv("INTERVIEW_POOL_MAX_SERVES", "20"))
+POOL_MAX_BUCKETS = int(os.getenv("INTERVIEW_POOL_MAX_BUCKETS", "256"))
+POOL_MIN_REQUESTS = int(os.getenv("INTERVIEW_POOL_MIN_REQUESTS", "3"))
+
+
+def bucket_key(profile: dict) -> tuple:
+    """(role, experience, style), normalized for case and punctuation."""
+    def norm(value):
+        return " ".join(re.sub(r"[^a-z0-9+#]+", " ", (value or "").lower()).split())
+
+    return (
+        norm(profile.get("role")),
+        norm(profile.get("experience")) or "fresher",
+        norm(profile.get("style")) or "general",
+    )
+
+
+class QuestionPool:
+    """
+    generator(profile, count) -> list of question dicts; it is only ever
+    called with the generic part of a profile (role, experience, style).
+    """
+
+    def __init__(
+        self,
+        generator,
+        target: int = POOL_TARGET,
+        low_water: int = POOL_LOW_WATER,
+        max_buckets: int = POOL_MAX_BUCKETS,
+        min_requests: int = POOL_MIN_REQUESTS,
+    ):
+        self.generator = generator
+        self.target = target
+        self.low_water = low_water
+        self.max_buckets = max_buckets
+        self.min_requests = min_requests
+        self._stock = {}  # bucket -> list of {"question": dict, "serves": int}
+        self._seen = {}  # bucket -> NearDuplicateIndex of every stocked question
+        self._requests = OrderedDict()  # bucket -> take() count, in LRU order
+        self._pending = set()
+        self._lock = threading.Lock()
+        self._queue = queue.Queue()
+        self._worker = None
+
+    def _touch(self, bucket: tuple, requested: bool = False) -> None:
+        """Mark bucket most recently used and evict beyond max_buckets; call with the lock held."""
+        self._requests[bucket] = self._requests.get(bucket, 0) + (1 if requested else 0)
+        self._requests.move_to_end(bucket)
+        while len(self._requests) > self.max_buckets:
+            evicted, _ = self._requests.popitem(last=False)
+            self._stock.pop(evicted, None)
+            self._seen.pop(evicted, None)
+
+    def take(self, profile: dict, count: int, refill: bool = True) -> list:
+        """
+        Up to count questions for the profile's bucket (copies, without
+        ids), least-served first. Schedules a refill when the bucket is low,
+        unless refill is False (personalized sessions).
+        """
+        bucket = bucket_key(profile)
+        with self._lock:
+            self._touch(bucket, requested=True)
+            stock = self._stock.setdefault(bucket, [])
+            random.shuffle(stock)
+            stock.sort(key=lambda item: item["serves"])
+            picked = stock[:count]
+            for item in picked:
+                item["serves"] += 1
+            self._stock[bucket] = [item for item in stock if item["serves"] < POOL_MAX_SERVES]
+            low = len(self._stock[bucket]) < self.low_water
+        if low and refill:
+            self.refill(profile)
+        return [
+            {k: v for k, v in item["question"].items() if k != "id"} for item in picked
+        ]
+
+    def add(self, profile: dict, questions: list) -> int:
+        """
+        Add generic questions to the profile's bucket, skipping near-duplicates
+        of anything it has stocked before; returns how many were new.
+        """
+        bucket = bucket_key(profile)
+        added = 0
+        with self._lock:
+            self._touch(bucket)
+            stock = self._stock.setdefault(bucket, [])
+            seen = self._seen.setdefault(bucket, NearDuplicateIndex())
+            for question in questions:
+                if len(stock) >= self.target:
+                    break
+                if not question.get("question") or not seen.add(question["question"]):
+                    continue
+                stock.append({"question": dict(question), "serves": 0})
+                added += 1
+        return added
+
+    def size(self, profile: dict) -> int:
+        with self._lock:
+            return len(self._stock.get(bucket_key(profile), []))
+
+    def refill(self, profile: dict) -> None:
+        """
+        Queue a background refill of the profile's bucket (once at a time),
+        if it has been asked for at least min_requests times.
+        """
+        bucket = bucket_key(profile)
+        with self._lock:
+            if bucket in self._pending or self._requests.get(bucket, 0) < self.min_requests:
+                return
+            self._pending.add(bucket)
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(
+                    target=self._refill_loop, name="interview-pool-refill", daemon=True
+                )
+                self._worker.start()
+        self._queue.put({
+            "role": profile.get("role", ""),
+            "experience": profile.get("experience", ""),
+            "style": profile.get("style", ""),
+        })
+
+    def _refill_loop(self) -> None:
+        while True:
+            profile = self._queue.get()
+            bucket = bucket_key(profile)
+            try:
+                while self.size(profile) < self.target:
+                    if not self.add(profile, self.generator(profile, POOL_BATCH_SIZE)):
+                        break
+            except Exception:  # pylint: disable=broad-except
+                # Gemini unavailable: the next take() on this bucket retries.
+                pass
+            finally:
+                with self._lock:
+                    self._pending.discard(bucket)
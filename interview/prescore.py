@@ -0,0 +1,139 @@
+"""
+Deterministic pre-scoring of interview answers.
+
+Empty, skipped, too-short and off-topic answers are rated locally so only
+substantive answers are sent to Gemini. An answer is off-topic when it
+shares no keyword with the question and its model_answer / guidance.
+"""
+import os
+import re
+
+SKIPPED_ANSWER = "User skipped this question."
+# Only near-empty answers: short but correct ones ("Use a hash map.") go to the model.
+MIN_ANSWER_WORDS = int(os.getenv("PRESCORE_MIN_WORDS", "3"))
+# Fraction of reference keywords an answer must mention to count as on-topic.
+MIN_KEYWORD_OVERLAP = float(os.getenv("PRESCORE_MIN_OVERLAP", "0.05"))
+# Off-topic checks need a reference with at least this many keywords.
+MIN_REFERENCE_KEYWORDS = 5
+
+_WORD_RE = re.compile(r"[a-z0-9][a-z0-9+#.-]*")
+_SKIP_PHRASES = {
+    "skip", "skipped", "pass", "n/a", "na", "none", "idk", "no idea",
+    "i don't know", "i dont know", "not sure", "no answer",
+}
+_STOPWORDS = {
+    "a", "about", "an", "and", "are", "as", "at", "be", "but", "by", "can",
+    "do", "for", "from", "had", "has", "have", "how", "i", "if", "in", "is",
+    "it", "its", "me", "my", "of", "on", "or", "our", "so", "that", "the",
+    "their", "then", "there", "this", "to", "was", "we", "were", "what",
+    "when", "which", "who", "why", "will", "with", "would", "you", "your",
+}
+
+_FEEDBACK = {
+    "empty": "No answer was given. Try to outline at least the key points next time.",
+    "skipped": "This question was skipped. Review the key points below and practise an answer.",
+    "too_short": "The answer is too short to evaluate. Expand it with specifics and an example.",
+    "off_topic": "The answer does not address the question. Re-read it and focus on what is asked.",
+}
+
+
+def _words(text: str) -> list:
+    return _WORD_RE.findall((text or "").lower())
+
+
+def _keywords(text: str) -> set:
+    return {w.strip(".-") for w in _words(text) if len(w) > 2 and w not in _STOPWORDS}
+
+
+def classify(answer: str, question: str, reference: str = "") -> str:
+    """
+    Return "empty", "skipped", "too_short" or "off_topic" for answers that
+    can be scored locally, or "" when the answer should go to the model.
+    """
+    text = " ".join((answer or "").split())
+    if not text:
+        return "empty"
+    if text == SKIPPED_ANSWER or text.lower().strip(".!") in _SKIP_PHRASES:
+        return "skipped"
+    if len(_words(text)) < MIN_ANSWER_WORDS:
+        return "too_short"
+
+    expected = _keywords(f"{question} {reference}")
+    if len(expected) >= MIN_REFERENCE_KEYWORDS:
+        overlap = len(expected & _keywords(text)) / len(expected)
+        if overlap < MIN_KEYWORD_OVERLAP:
+            return "off_topic"
+    return ""
+
+
+def prescore_review(entry: dict) -> dict:
+    """
+    Local /api/review_interview_answers evaluation for an entry
+    {id, question, model_answer, user_answer}, or None if it needs the model.
+    """
+    reason = classify(entry.get("user_answer"), entry.get("question"), entry.get("model_answer"))
+    if not reason:
+        return None
+    improvements = ["Cover the key points of the model answer."]
+    if reason == "too_short":
+        improvements.append("Add a concrete example or result.")
+    return {
+        "id": entry.get("id"),
+        "rating": 1,
+        "verdict": "Improve",
+        "feedback": _FEEDBACK[reason],
+        "strengths": [],
+        "improvements": improvements,
+        "prescored": reason,
+    }
+
+
+def prescore_evaluation(question: dict, answer: str) -> dict:
+    """
+    Local live-interview evaluation (evaluate_interview_answer schema),
+    or None if the answer needs the model.
+    """
+    reason = classify(answer, question.get("question"), question.get("guidance"))
+    if not reason:
+        return None
+    return {
+        "rating": 1,
+        "feedback": _FEEDBACK[reason],
+        "correct_answer": question.get("guidance") or "Not available.",
+        "followup_question": None,
+        "prescored": reason,
+    }
+
+
+def merge_reviews(entries: list, prescored: dict, evaluations: list) -> list:
+    """
+    Reassemble evaluations in the order of entries: prescored ones from
+    {id: evaluation}, the rest from the model's list, matched by id only
+    (a position could attach a review to the wrong answer). A repeated id
+    keeps its first evaluation and unknown ids are ignored, as in the
+    streamed path. Entries the model returned no evaluation for are marked
+    unavailable.
+    """
+    by_id = {}
+    for ev in evaluations:
+        if isinstance(ev, dict) and ev.get("id") is not None:
+            by_id.setdefault(str(ev["id"]), ev)
+    merged = []
+    for entry in entries:
+        if prescored.get(entry["id"]) is not None:
+            merged.append(prescored[entry["id"]])
+            continue
+        evaluation = by_id.get(str(entry["id"]))
+        if evaluation is not None:
+            evaluation = dict(evaluation, id=entry["id"])
+        else:
+            evaluation = {
+                "id": entry["id"],
+                "rating": None,
+                "verdict": "Unavailable",
+                "feedback": "No evaluation was returned for this answer.",
+                "strengths": [],
+                "improvements": [],
+            }
+        merged.append(evaluation)
+    return merged
@@ -0,0 +1,138 @@
+"""
+Local interview question bank.
+
+Used when Gemini is unavailable (circuit open, timeouts) so an interview can
+still start and continue with generic but realistic questions.
+"""
+import copy
+
+BANK = [
+    {
+        "question": "Tell me about yourself and what drew you to this role.",
+        "category": "hr",
+        "difficulty": "easy",
+        "guidance": "Short background, 1-2 relevant achievements, why this role and company.",
+    },
+    {
+        "question": "Describe a project you are proud of. What was your specific contribution?",
+        "category": "behavioral",
+        "difficulty": "easy",
+        "guidance": "Use STAR: context, your actions, measurable result, what you learned.",
+    },
+    {
+        "question": "Tell me about a time you disagreed with a teammate. How did you resolve it?",
+        "category": "behavioral",
+        "difficulty": "medium",
+        "guidance": "Stay factual, show listening, focus on the outcome and the relationship.",
+    },
+    {
+        "question": "Describe a situation where you had to learn something new quickly.",
+        "category": "behavioral",
+        "difficulty": "easy",
+        "guidance": "What you had to learn, how you approached it, how fast you became productive.",
+    },
+    {
+        "question": "Tell me about a mistake you made and what you changed afterwards.",
+        "category": "behavioral",
+        "difficulty": "medium",
+        "guidance": "Own the mistake, explain the impact, show the concrete change you made.",
+    },
+    {
+        "question": "How do you prioritise when you have several deadlines at the same time?",
+        "category": "behavioral",
+        "difficulty": "medium",
+        "guidance": "Impact vs urgency, communicating trade-offs, an example where it worked.",
+    },
+    {
+        "question": "Where do you see yourself in three years?",
+        "category": "hr",
+        "difficulty": "easy",
+        "guidance": "Growth that fits the role, skills you want to build, commitment.",
+    },
+    {
+        "question": "Why should we hire you over other candidates?",
+        "category": "hr",
+        "difficulty": "medium",
+        "guidance": "Match 2-3 strengths to the job requirements with evidence.",
+    },
+    {
+        "question": "What are your strengths and one area you are working to improve?",
+        "category": "hr",
+        "difficulty": "easy",
+        "guidance": "Honest strengths with examples; a real weakness and the steps you are taking.",
+    },
+    {
+        "question": "Walk me through how you would debug a feature that works locally but fails in production.",
+        "category": "technical",
+        "difficulty": "medium",
+        "guidance": "Reproduce, compare config/data/versions, logs and metrics, narrow down, fix and add a test.",
+    },
+    {
+        "question": "Explain the difference between a process and a thread.",
+        "category": "technical",
+        "difficulty": "easy",
+        "guidance": "Memory isolation, scheduling, communication cost, when to use each.",
+    },
+    {
+        "question": "How would you design a URL shortener? Focus on the data model and scaling.",
+        "category": "technical",
+        "difficulty": "hard",
+        "guidance": "ID generation, storage schema, caching of hot links, read-heavy scaling, analytics.",
+    },
+    {
+        "question": "What happens when you type a URL into the browser and press Enter?",
+        "category": "technical",
+        "difficulty": "medium",
+        "guidance": "DNS, TCP/TLS handshake, HTTP request, server processing, rendering.",
+    },
+    {
+        "question": "How do you make sure the code you write is maintainable?",
+        "category": "technical",
+        "difficulty": "easy",
+        "guidance": "Naming, small functions, tests, code review, documentation where it matters.",
+    },
+    {
+        "question": "Explain indexing in a relational database and when an index can hurt performance.",
+        "category": "technical",
+        "difficulty": "medium",
+        "guidance": "B-tree lookups, selectivity, write amplification, storage cost, unused indexes.",
+    },
+    {
+        "question": "Write a function that returns the first non-repeating character in a string. Explain its complexity.",
+        "category": "coding",
+        "difficulty": "easy",
+        "guidance": "Count with a hash map, second pass to find the first count of 1; O(n) time, O(k) space.",
+    },
+    {
+        "question": "Given an array of integers, find two numbers that add up to a target. How would you optimise it?",
+        "category": "coding",
+        "difficulty": "easy",
+        "guidance": "Brute force O(n^2), then a hash map of seen values for O(n).",
+    },
+    {
+        "question": "How would you detect a cycle in a linked list?",
+        "category": "coding",
+        "difficulty": "medium",
+        "guidance": "Floyd's slow/fast pointers; O(n) time and O(1) space; finding the cycle start.",
+    },
+]
+
+
+def bank_questions(count: int = 10, style: str = "General", exclude=()) -> list:
+    """
+    Return up to count bank questions in generate_question_set's schema.
+    Questions whose text is in exclude are skipped. Non-general styles put
+    matching categories first.
+    """
+    excluded = {text.strip().lower() for text in exclude}
+    wanted = (style or "General").strip().lower()
+    pool = [q for q in BANK if q["question"].lower() not in excluded]
+    if wanted != "general":
+        pool.sort(key=lambda q: q["category"] != wanted)
+
+    selected = []
+    for idx, item in enumerate(pool[:count], start=1):
+        question = copy.deepcopy(item)
+        question["id"] = f"q{idx}"
+        selected.append(question)
+    return selected
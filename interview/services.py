@@ -1,6 +1,7 @@
 import os
 import json
 import google.generativeai as genai
+from llm.routing import generate
 
 genai.configure(api_key=os.getenv("GEMINI_API_KEY"))
 
@@ -20,9 +21,7 @@ Return ONLY JSON array:
 ]
 """
 
-    model = genai.GenerativeModel("models/gemini-2.0-flash")
-
-    response = model.generate_content(prompt)
+    response = generate("question_gen", prompt)
 
     return json.loads(response.text)
 
@@ -51,7 +50,6 @@ Return JSON in this exact format:
 }}
 """
 
-    model = genai.GenerativeModel("models/gemini-2.0-flash")
-    response = model.generate_content(prompt)
+    response = generate("evaluate", prompt)
 
     return json.loads(response.text)
@@ -59,11 +59,15 @@ document.addEventListener("DOMContentLoaded", () => {
       loadNextQuestion();
     });
     ui.buttons.skip.addEventListener("click", () => {
+      if (!state.interviewActive || !state.currentQuestion) {
+        return;
+      }
       ui.answerBox.value = "";
       ui.transcriptBox.textContent = "Question skipped. Loading the next one...";
-      loadNextQuestion();
+      stepInterview("");
     });
     ui.buttons.end.addEventListener("click", () => {
+      fetch("/api/interview/end", { method: "POST" }).catch(() => {});
       resetInterview("Interview ended. Feel free to start again.");
     });
   }
@@ -261,28 +265,43 @@ document.addEventListener("DOMContentLoaded", () => {
       return;
     }
 
-    setStatus("Evaluating your answer...", "primary");
+    stepInterview(answer);
+  }
+
+  // One round trip: record the answer and get the next question. The
+  // evaluation runs on the server and arrives later via SSE (or polling).
+  async function stepInterview(answer) {
+    const answered = state.currentQuestion;
+    const answeredNumber = (state.interviewIndex || 0) + 1;
+    setStatus("Sending your answer...", "primary");
     updateInteractionState(false);
 
     try {
-      const res = await fetch("/api/interview/submit-answer", {
+      const res = await fetch("/api/interview/step", {
         method: "POST",
         headers: { "Content-Type": "application/json" },
-        body: JSON.stringify({
-          question_id: state.currentQuestion.id,
-          answer,
-        }),
+        body: JSON.stringify({ question_id: answered.id, answer }),
       });
       const data = await res.json();
+
+      if (data.evaluation) {
+        displayFeedback(data.evaluation, `Q${answeredNumber}`);
+      } else if (data.evaluation_status === "pending") {
+        ui.ratingBadge.textContent = "Rating: …";
+        ui.ratingBadge.className = "badge bg-secondary";
+        ui.feedbackBox.textContent = `Evaluating your answer to Q${answeredNumber}...`;
+        watchEvaluation(data, `Q${answeredNumber}`);
+      }
       if (!res.ok) {
-        throw new Error(data.error || "Evaluation failed.");
+        throw new Error(data.error || "Unable to fetch next question.");
       }
 
-      displayFeedback(data.evaluation);
-      setStatus("Answer evaluated. Loading the next question...", "success");
-      setTimeout(() => {
-        loadNextQuestion();
-      }, 1200);
+      state.totalQuestions = data.total_questions || state.totalQuestions;
+      state.interviewIndex = data.question_index;
+      renderQuestion(data.question, data.question_index, data.total_questions);
+      ui.transcriptBox.textContent = "Press 🎤 Start Recording when you are ready.";
+      setStatus("Next question loaded.", "primary");
+      updateInteractionState(true);
     } catch (err) {
       console.error(err);
       setStatus(err.message, "danger");
@@ -290,12 +309,56 @@ document.addEventListener("DOMContentLoaded", () => {
     }
   }
 
-  function displayFeedback(evaluation = {}) {
+  function watchEvaluation(data, label) {
+    if (window.EventSource && data.evaluation_events_url) {
+      const source = new EventSource(data.evaluation_events_url);
+      source.addEventListener("evaluation", (event) => {
+        source.close();
+        const body = JSON.parse(event.data);
+        if (body.evaluation) {
+          displayFeedback(body.evaluation, label);
+        } else {
+          ui.feedbackBox.textContent = body.error || "Evaluation failed.";
+        }
+      });
+      const fallback = () => {
+        source.close();
+        pollEvaluation(data.evaluation_url, label);
+      };
+      source.addEventListener("timeout", fallback);
+      source.onerror = fallback;
+      return;
+    }
+    pollEvaluation(data.evaluation_url, label);
+  }
+
+  async function pollEvaluation(url, label, delay = 1500) {
+    try {
+      const res = await fetch(url);
+      const body = await res.json();
+      if (res.status === 202) {
+        setTimeout(() => pollEvaluation(url, label, Math.min(delay * 1.5, 10000)), delay);
+        return;
+      }
+      if (!res.ok) {
+        throw new Error(body.error || "Evaluation failed.");
+      }
+      displayFeedback(body.evaluation, label);
+    } catch (err) {
+      console.error(err);
+      ui.feedbackBox.textContent = err.message;
+    }
+  }
+
+  function displayFeedback(evaluation = {}, label = "") {
     const rating = evaluation.rating ?? "—";
     ui.ratingBadge.textContent = `Rating: ${rating}`;
     ui.ratingBadge.className = rating >= 4 ? "badge bg-success" : rating >= 2 ? "badge bg-warning" : "badge bg-danger";
 
     const lines = [];
+    if (label) {
+      lines.push(`Feedback on ${label}`);
+    }
     if (evaluation.feedback) {
       lines.push(`Feedback:\n${evaluation.feedback}`);
     }
@@ -323,6 +386,7 @@ document.addEventListener("DOMContentLoaded", () => {
         throw new Error(data.error || "Unable to fetch next question.");
       }
       state.totalQuestions = data.total_questions || state.totalQuestions;
+      state.interviewIndex = data.question_index;
       renderQuestion(data.question, data.question_index, data.total_questions);
       ui.answerBox.value = "";
       ui.transcriptBox.textContent = "Press 🎤 Start Recording when you are ready.";
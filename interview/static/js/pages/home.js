@@ -0,0 +1,59 @@
+// Load dashboard summary
+async function loadDashboard() {
+  try {
+    const res = await fetch('/api/dashboard/summary');
+    if (!res.ok) return;
+    const data = await res.json();
+
+    // Load metrics
+    const metrics = data.metrics || {};
+    const metricsContainer = document.getElementById('metricsContainer');
+    metricsContainer.innerHTML = `
+      <div class="col-md-4">
+        <div class="metric-card">
+          <div class="metric-value">${metrics.resume?.count || 0}</div>
+          <div class="metric-label">Resumes Built</div>
+        </div>
+      </div>
+      <div class="col-md-4">
+        <div class="metric-card">
+          <div class="metric-value">${metrics.interview?.last_overall?.toFixed(1) || 0}</div>
+          <div class="metric-label">Last Interview Score</div>
+        </div>
+      </div>
+      <div class="col-md-4">
+        <div class="metric-card">
+          <div class="metric-value">${metrics.quiz?.accuracy?.toFixed(0) || 0}%</div>
+          <div class="metric-label">Quiz Accuracy</div>
+        </div>
+      </div>
+    `;
+
+    // Load activity
+    const activity = data.activity || [];
+    const activityContainer = document.getElementById('activityContainer');
+    activityContainer.innerHTML = activity.map(act => `
+      <div class="activity-item">
+        <small class="text-muted">${act.timestamp}</small>
+        <div><strong>${act.title}</strong></div>
+        <div class="small">${act.details}</div>
+      </div>
+    `).join('');
+
+    // Load badges
+    const badges = data.badges || [];
+    const badgesContainer = document.getElementById('badgesContainer');
+    badgesContainer.innerHTML = badges.map(badge => `
+      <div class="badge-soft mb-2">
+        <strong>${badge.label}</strong><br>
+        <small>${badge.description}</small>
+      </div>
+    `).join('');
+
+  } catch (error) {
+    console.error('Error loading dashboard:', error);
+  }
+}
+
+// Load on page load
+loadDashboard();
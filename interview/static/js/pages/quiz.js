@@ -0,0 +1,315 @@
+// ---------- CAMERA + "RECORDING" UI ----------
+const videoEl = document.getElementById("userVideo");
+const statusText = document.getElementById("statusText");
+const btnToggleCamera = document.getElementById("btnToggleCamera");
+const recordStatus = document.getElementById("recordStatus");
+const btnRecord = document.getElementById("btnRecord");
+
+let cameraStream = null;
+let cameraOn = false;
+let mediaRecorder = null;
+let recordingChunks = [];
+let isRecording = false;
+
+async function startCamera() {
+  try {
+    cameraStream = await navigator.mediaDevices.getUserMedia({ video: true, audio: true });
+    videoEl.srcObject = cameraStream;
+    cameraOn = true;
+    statusText.textContent = "Camera: On";
+  } catch (err) {
+    console.error("Camera error:", err);
+    statusText.textContent = "Camera: Permission denied or not available.";
+  }
+}
+
+function stopCamera() {
+  if (cameraStream) {
+    cameraStream.getTracks().forEach(t => t.stop());
+    cameraStream = null;
+  }
+  cameraOn = false;
+  videoEl.srcObject = null;
+  statusText.textContent = "Camera: Off";
+}
+
+btnToggleCamera.addEventListener("click", () => {
+  if (cameraOn) {
+    stopCamera();
+  } else {
+    startCamera();
+  }
+});
+
+startCamera();
+
+function startRecording() {
+  if (!cameraStream) {
+    alert("Camera not available");
+    return;
+  }
+  if (isRecording) return;
+
+  mediaRecorder = new MediaRecorder(cameraStream);
+  recordingChunks = [];
+  mediaRecorder.ondataavailable = e => {
+    if (e.data.size > 0) recordingChunks.push(e.data);
+  };
+  mediaRecorder.onstop = () => {
+    // If you want to upload the recorded blob to backend for speech-to-text,
+    // convert `recordingChunks` to a Blob here and send via fetch.
+    const blob = new Blob(recordingChunks, { type: "video/webm" });
+    console.log("Recorded video blob size:", blob.size);
+  };
+  mediaRecorder.start();
+  isRecording = true;
+  recordStatus.textContent = "Recording...";
+  btnRecord.textContent = "⏹ Stop Recording";
+}
+
+function stopRecording() {
+  if (!isRecording || !mediaRecorder) return;
+  mediaRecorder.stop();
+  isRecording = false;
+  recordStatus.textContent = "Recorded. (Not uploaded, just simulated.)";
+  btnRecord.textContent = "⏺ Record";
+}
+
+btnRecord.addEventListener("click", () => {
+  if (!isRecording) {
+    startRecording();
+  } else {
+    stopRecording();
+  }
+});
+
+// ---------- INTERVIEW LOGIC ----------
+const btnStartInterview = document.getElementById("btnStartInterview");
+const questionBubble = document.getElementById("questionBubble");
+const answerInput = document.getElementById("answerInput");
+const feedbackBox = document.getElementById("feedbackBox");
+const btnSend = document.getElementById("btnSend");
+const btnNext = document.getElementById("btnNext");
+const btnSkip = document.getElementById("btnSkip");
+const btnEnd = document.getElementById("btnEnd");
+const btnSpeakQuestion = document.getElementById("btnSpeakQuestion");
+
+const userNameInput = document.getElementById("userName");
+const roleInput = document.getElementById("role");
+const experienceInput = document.getElementById("experience");
+const styleInput = document.getElementById("style");
+const jobDescriptionInput = document.getElementById("jobDescription");
+const resumeTextInput = document.getElementById("resumeText");
+
+const questionCounter = document.getElementById("questionCounter");
+const timerDisplay = document.getElementById("timerDisplay");
+const progressOverview = document.getElementById("progressOverview");
+
+let currentQuestionIndex = -1;
+let totalQuestions = 0;
+let answeredCount = 0;
+let timerInterval = null;
+let secondsElapsed = 0;
+
+function startTimer() {
+  clearInterval(timerInterval);
+  secondsElapsed = 0;
+  timerInterval = setInterval(() => {
+    secondsElapsed++;
+    const mins = String(Math.floor(secondsElapsed / 60)).padStart(2, "0");
+    const secs = String(secondsElapsed % 60).padStart(2, "0");
+    timerDisplay.textContent = `Time: ${mins}:${secs}`;
+  }, 1000);
+}
+
+function stopTimer() {
+  clearInterval(timerInterval);
+}
+
+async function startInterview() {
+  const name = userNameInput.value.trim();
+  const role = roleInput.value.trim();
+
+  if (!name || !role) {
+    alert("Please fill at least Name and Role.");
+    return;
+  }
+
+  questionBubble.textContent = "Preparing your interview questions...";
+  feedbackBox.textContent = "After you answer, AI feedback will appear here.";
+  answerInput.value = "";
+  progressOverview.textContent = "Progress: 0 / 0";
+  questionCounter.textContent = "Question 0 / 0";
+
+  const payload = {
+    name: name,
+    role: role,
+    experience: experienceInput.value,
+    style: styleInput.value,
+    job_description: jobDescriptionInput.value,
+    resume_text: resumeTextInput.value,
+  };
+
+  const res = await fetch("/api/interview/start", {
+    method: "POST",
+    headers: { "Content-Type": "application/json" },
+    body: JSON.stringify(payload),
+  });
+
+  if (!res.ok) {
+    questionBubble.textContent = "Error starting interview. Try again.";
+    return;
+  }
+
+  const data = await res.json();
+  totalQuestions = data.questions_count || 0;
+  currentQuestionIndex = data.question_index ?? 0;
+
+  if (!data.question) {
+    questionBubble.textContent = "No questions received.";
+    return;
+  }
+
+  showQuestion(data.question);
+  startTimer();
+  updateCounters();
+}
+
+function showQuestion(questionObj) {
+  const qText = questionObj?.text || "No question text.";
+  questionBubble.textContent = qText;
+  answerInput.value = "";
+  feedbackBox.textContent = "After you answer, AI feedback will appear here.";
+}
+
+function updateCounters() {
+  questionCounter.textContent = `Question ${currentQuestionIndex + 1} / ${totalQuestions}`;
+  progressOverview.textContent = `Progress: ${answeredCount} / ${totalQuestions}`;
+}
+
+async function sendAnswer() {
+  if (currentQuestionIndex < 0) {
+    alert("Start the interview first.");
+    return;
+  }
+  const answer = answerInput.value.trim();
+  if (!answer) {
+    alert("Type your answer (key points) for evaluation.");
+    return;
+  }
+
+  feedbackBox.textContent = "Evaluating your answer with AI...";
+
+  const payload = {
+    question_index: currentQuestionIndex,
+    answer: answer,
+  };
+
+  const res = await fetch("/api/interview/answer", {
+    method: "POST",
+    headers: { "Content-Type": "application/json" },
+    body: JSON.stringify(payload),
+  });
+
+  if (!res.ok) {
+    feedbackBox.textContent = "Error during evaluation. Try again.";
+    return;
+  }
+
+  const data = await res.json();
+  if (data.error) {
+    feedbackBox.textContent = "Error: " + data.error;
+    return;
+  }
+
+  answeredCount = Math.max(answeredCount, currentQuestionIndex + 1);
+  updateCounters();
+
+  const scores = data.scores || {};
+  const strengths = data.strengths || [];
+  const improvements = data.improvements || [];
+  const improvedAnswer = data.improved_answer || "";
+
+  let feedbackText = "";
+  feedbackText += `Overall Score: ${data.overall_score ?? "N/A"}/10\n\n`;
+  feedbackText += "Scores:\n";
+  feedbackText += `- Content Quality: ${scores.content_quality ?? "N/A"}/10\n`;
+  feedbackText += `- Relevance: ${scores.relevance ?? "N/A"}/10\n`;
+  feedbackText += `- Technical Depth: ${scores.technical_depth ?? "N/A"}/10\n`;
+  feedbackText += `- Communication: ${scores.communication ?? "N/A"}/10\n`;
+  feedbackText += `- Structure: ${scores.structure ?? "N/A"}/10\n\n`;
+
+  feedbackText += "Strengths:\n";
+  strengths.forEach(s => (feedbackText += `• ${s}\n`));
+  feedbackText += "\nImprovements:\n";
+  improvements.forEach(i => (feedbackText += `• ${i}\n`));
+
+  feedbackText += "\nSuggested Improved Answer:\n";
+  feedbackText += improvedAnswer;
+
+  feedbackBox.textContent = feedbackText;
+}
+
+async function goToNextQuestion(skip = false) {
+  if (currentQuestionIndex < 0) {
+    alert("Start the interview first.");
+    return;
+  }
+
+  const payload = { question_index: currentQuestionIndex };
+  const res = await fetch("/api/interview/next", {
+    method: "POST",
+    headers: { "Content-Type": "application/json" },
+    body: JSON.stringify(payload),
+  });
+
+  if (!res.ok) {
+    questionBubble.textContent = "Error moving to next question.";
+    return;
+  }
+
+  const data = await res.json();
+  if (data.done) {
+    stopTimer();
+    const summary = data.summary || {};
+    questionBubble.textContent = "Interview finished.";
+    feedbackBox.textContent =
+      `Session Summary:\n\n` +
+      `Total Questions: ${summary.total_questions ?? 0}\n` +
+      `Answered: ${summary.answered ?? 0}\n` +
+      `Average Score: ${(summary.average_score ?? 0).toFixed(2)}/10\n`;
+    questionCounter.textContent = "Question - / -";
+    progressOverview.textContent =
+      `Progress: ${summary.answered ?? 0} / ${summary.total_questions ?? 0}`;
+    return;
+  }
+
+  currentQuestionIndex = data.question_index;
+  showQuestion(data.question);
+  startTimer();
+  updateCounters();
+}
+
+function endInterview() {
+  stopTimer();
+  questionBubble.textContent = "Interview ended by user.";
+  feedbackBox.textContent = "You can refresh the page to start a new interview.";
+  timerDisplay.textContent = "Time: 00:00";
+}
+
+function speakQuestion() {
+  const text = questionBubble.textContent || "";
+  if (!window.speechSynthesis) {
+    alert("Text-to-speech not supported in this browser.");
+    return;
+  }
+  const utter = new SpeechSynthesisUtterance(text);
+  window.speechSynthesis.speak(utter);
+}
+
+btnStartInterview.addEventListener("click", startInterview);
+btnSend.addEventListener("click", sendAnswer);
+btnNext.addEventListener("click", () => goToNextQuestion(false));
+btnSkip.addEventListener("click", () => goToNextQuestion(true));
+btnEnd.addEventListener("click", endInterview);
+btnSpeakQuestion.addEventListener("click", speakQuestion);
@@ -0,0 +1,554 @@
+// ---------- MODE & FILTER STATE ----------
+let currentMode = "quiz"; // "quiz" or "interview"
+
+const btnModeQuiz = document.getElementById("btnModeQuiz");
+const btnModeInterview = document.getElementById("btnModeInterview");
+const btnGenerateQuestions = document.getElementById("btnGenerateQuestions");
+
+const quizContainer = document.getElementById("quizContainer");
+const interviewContainer = document.getElementById("interviewContainer");
+
+function setMode(mode) {
+  currentMode = mode;
+  if (mode === "quiz") {
+    btnModeQuiz.classList.add("btn-outline-primary");
+    btnModeQuiz.classList.remove("btn-outline-secondary");
+    btnModeInterview.classList.add("btn-outline-secondary");
+    btnModeInterview.classList.remove("btn-outline-primary");
+    quizContainer.style.display = "block";
+    interviewContainer.style.display = "none";
+  } else {
+    btnModeInterview.classList.add("btn-outline-primary");
+    btnModeInterview.classList.remove("btn-outline-secondary");
+    btnModeQuiz.classList.add("btn-outline-secondary");
+    btnModeQuiz.classList.remove("btn-outline-primary");
+    quizContainer.style.display = "none";
+    interviewContainer.style.display = "block";
+  }
+}
+
+btnModeQuiz.addEventListener("click", () => setMode("quiz"));
+btnModeInterview.addEventListener("click", () => setMode("interview"));
+setMode("quiz");
+
+// ---------- COMMON FILTERS ----------
+const searchTextInput = document.getElementById("searchText");
+const companyInput = document.getElementById("company");
+const techInput = document.getElementById("tech");
+const roleInput = document.getElementById("role");
+const difficultyInput = document.getElementById("difficulty");
+const questionTypeInput = document.getElementById("questionType");
+const limitInput = document.getElementById("limit");
+
+function buildRequestBody() {
+  return {
+    mode: currentMode,
+    company: companyInput.value.trim(),
+    technology: techInput.value.trim(),
+    role: roleInput.value.trim(),
+    difficulty: difficultyInput.value,
+    question_type: questionTypeInput.value,
+    num_questions: parseInt(limitInput.value, 10) || 5,
+    search_text: searchTextInput.value.trim(),
+  };
+}
+
+// ---------- QUIZ MODE ----------
+let quizQuestions = [];
+let quizIndex = 0;
+let quizAnswers = {}; // id -> option index
+
+const quizQuestionText = document.getElementById("quizQuestionText");
+const quizOptionsDiv = document.getElementById("quizOptions");
+const quizCounter = document.getElementById("quizCounter");
+const quizTimer = document.getElementById("quizTimer");
+const quizSummary = document.getElementById("quizSummary");
+
+const btnQuizPrev = document.getElementById("btnQuizPrev");
+const btnQuizNext = document.getElementById("btnQuizNext");
+const btnQuizSubmit = document.getElementById("btnQuizSubmit");
+
+let quizTimerInterval = null;
+let quizSeconds = 0;
+
+function startQuizTimer() {
+  clearInterval(quizTimerInterval);
+  quizSeconds = 0;
+  quizTimerInterval = setInterval(() => {
+    quizSeconds++;
+    const mins = String(Math.floor(quizSeconds / 60)).padStart(2, "0");
+    const secs = String(quizSeconds % 60).padStart(2, "0");
+    quizTimer.textContent = `Time: ${mins}:${secs}`;
+  }, 1000);
+}
+
+function stopQuizTimer() {
+  clearInterval(quizTimerInterval);
+}
+
+function renderCurrentQuizQuestion() {
+  const q = quizQuestions[quizIndex];
+  if (!q) {
+    quizQuestionText.textContent = "Select filters and click Generate Questions to begin.";
+    quizOptionsDiv.innerHTML = "";
+    quizCounter.textContent = "Q 0 / 0";
+    return;
+  }
+
+  quizQuestionText.textContent = q.question || q.question_text || "Question unavailable.";
+  quizCounter.textContent = `Q ${quizIndex + 1} / ${quizQuestions.length}`;
+
+  const opts = q.options || [];
+  const selectedIdx = quizAnswers[q.id];
+  quizOptionsDiv.innerHTML = "";
+
+  opts.forEach((optText, idx) => {
+    const letter = String.fromCharCode(65 + idx);
+    const id = `quiz_opt_${q.id}_${idx}`;
+    const html = `
+      <div class="form-check">
+        <input class="form-check-input" type="radio" name="quizOptions" id="${id}" value="${idx}" ${selectedIdx === idx ? "checked" : ""}>
+        <label class="form-check-label" for="${id}">
+          <strong>${letter}.</strong> ${optText}
+        </label>
+      </div>
+    `;
+    quizOptionsDiv.insertAdjacentHTML("beforeend", html);
+  });
+
+  quizOptionsDiv.querySelectorAll('input[name="quizOptions"]').forEach(radio => {
+    radio.addEventListener("change", () => {
+      quizAnswers[q.id] = Number(radio.value);
+    });
+  });
+}
+
+btnQuizPrev.addEventListener("click", () => {
+  if (adaptiveQuiz) return;
+  if (quizIndex > 0) {
+    quizIndex--;
+    renderCurrentQuizQuestion();
+  }
+});
+
+btnQuizNext.addEventListener("click", () => {
+  if (adaptiveQuiz) {
+    submitAdaptiveAnswer();
+    return;
+  }
+  if (quizIndex < quizQuestions.length - 1) {
+    quizIndex++;
+    renderCurrentQuizQuestion();
+  }
+});
+
+btnQuizSubmit.addEventListener("click", async () => {
+  if (adaptiveQuiz) {
+    submitAdaptiveAnswer();
+    return;
+  }
+  if (quizQuestions.length === 0) {
+    alert("Generate questions before submitting the quiz.");
+    return;
+  }
+
+  stopQuizTimer();
+  quizSummary.style.display = "block";
+  quizSummary.textContent = "Grading your answers...";
+
+  const answersPayload = quizQuestions.map(q => ({
+    id: q.id,
+    selected_option_index: quizAnswers[q.id] ?? null,
+  }));
+
+  const res = await fetch("/api/grade_quiz", {
+    method: "POST",
+    headers: { "Content-Type": "application/json" },
+    body: JSON.stringify({ answers: answersPayload }),
+  });
+
+  const data = await res.json();
+  if (!res.ok) {
+    quizSummary.textContent = data.error || "Unable to grade quiz.";
+    return;
+  }
+
+  renderQuizReview(data);
+  if ((data.pending_explanations || []).length) {
+    streamQuizExplanations(data);
+  }
+});
+
+// ---------- ADAPTIVE QUIZ ----------
+// One question at a time; the server picks the next one from the answers so far
+// and ends the assessment once the ability estimate is precise enough.
+let adaptiveQuiz = null; // {number, log}
+
+function renderAdaptiveQuestion(question, number) {
+  quizQuestions = [question];
+  quizIndex = 0;
+  quizAnswers = {};
+  renderCurrentQuizQuestion();
+  quizCounter.textContent = `Q ${number} (adaptive)`;
+  adaptiveQuiz.number = number;
+}
+
+async function startAdaptiveQuiz() {
+  const res = await fetch("/api/quiz/adaptive/start", {
+    method: "POST",
+    headers: { "Content-Type": "application/json" },
+    body: JSON.stringify({ technology: techInput.value.trim() }),
+  });
+  const data = await res.json();
+  if (!res.ok) {
+    throw new Error(data.error || "Failed to start the adaptive quiz.");
+  }
+  adaptiveQuiz = { number: 1, log: [] };
+  renderAdaptiveQuestion(data.question, data.question_number);
+  startQuizTimer();
+}
+
+async function submitAdaptiveAnswer() {
+  const q = quizQuestions[0];
+  if (!q || quizAnswers[q.id] === undefined) {
+    alert("Pick an option first.");
+    return;
+  }
+  btnQuizNext.disabled = true;
+  btnQuizSubmit.disabled = true;
+  try {
+    const res = await fetch("/api/quiz/adaptive/answer", {
+      method: "POST",
+      headers: { "Content-Type": "application/json" },
+      body: JSON.stringify({ question_id: q.id, selected_option_index: quizAnswers[q.id] }),
+    });
+    const data = await res.json();
+    if (!res.ok) {
+      quizSummary.style.display = "block";
+      quizSummary.textContent = data.error || "Unable to grade answer.";
+      return;
+    }
+
+    const correctLetter = String.fromCharCode(65 + (data.correct_option_index ?? 0));
+    adaptiveQuiz.log.push(
+      `Q${adaptiveQuiz.number}: ${data.is_correct ? "✔ Correct" : `✘ Correct answer: ${correctLetter}`}` +
+      (data.explanation ? ` — ${data.explanation}` : "")
+    );
+    quizSummary.style.display = "block";
+
+    if (data.done) {
+      stopQuizTimer();
+      quizSummary.textContent =
+        `Estimated level: ${data.level} after ${data.answered} questions ` +
+        `(score ${data.score} / ${data.answered}, ability ${data.theta} ± ${data.se})\n\n` +
+        adaptiveQuiz.log.join("\n");
+      quizQuestionText.textContent = "Assessment complete. Generate again to retake.";
+      quizOptionsDiv.innerHTML = "";
+      quizQuestions = [];
+      adaptiveQuiz = null;
+      return;
+    }
+    quizSummary.textContent = adaptiveQuiz.log.join("\n");
+    renderAdaptiveQuestion(data.question, data.question_number);
+  } finally {
+    btnQuizNext.disabled = false;
+    btnQuizSubmit.disabled = false;
+  }
+}
+
+function renderQuizReview(data) {
+  let text = "";
+  text += `Score: ${data.score} / ${data.total}\n`;
+  text += `Accuracy: ${data.accuracy.toFixed(2)}%\n`;
+  text += "\nQuestion review:\n";
+  data.results.forEach((r, idx) => {
+    const letter = val => (val ?? val === 0 ? String.fromCharCode(65 + val) : "-");
+    text += `\nQ${idx + 1}: ${r.question}\n`;
+    text += `Your Answer: ${letter(r.selected_option_index)} | Correct: ${letter(r.correct_option_index)}\n`;
+    text += `Result: ${r.is_correct ? "✅ Correct" : "❌ Incorrect"}\n`;
+    if (r.explanation) {
+      text += `Explanation: ${r.explanation}\n`;
+    } else if ((data.pending_explanations || []).includes(r.id)) {
+      text += "Explanation: loading...\n";
+    }
+  });
+  quizSummary.textContent = text;
+}
+
+// Explanations for missed questions are generated after grading and
+// arrive as NDJSON lines; the review is re-rendered as each one lands.
+async function streamQuizExplanations(data) {
+  const res = await fetch("/api/quiz/explanations", {
+    method: "POST",
+    headers: { "Content-Type": "application/json" },
+    body: JSON.stringify({ ids: data.pending_explanations }),
+  });
+  if (!res.ok || !res.body) {
+    data.pending_explanations = [];
+    renderQuizReview(data);
+    return;
+  }
+
+  const reader = res.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = "";
+  const apply = line => {
+    if (!line.trim()) return;
+    const item = JSON.parse(line);
+    const result = data.results.find(r => r.id === item.id);
+    if (result && item.explanation) {
+      result.explanation = item.explanation;
+    }
+    data.pending_explanations = data.pending_explanations.filter(id => id !== item.id);
+    renderQuizReview(data);
+  };
+  while (true) {
+    const { done, value } = await reader.read();
+    if (done) break;
+    buffer += decoder.decode(value, { stream: true });
+    const lines = buffer.split("\n");
+    buffer = lines.pop();
+    lines.forEach(apply);
+  }
+  apply(buffer);
+}
+
+// ---------- INTERVIEW MODE ----------
+let interviewQuestions = [];
+let interviewIndex = 0;
+const interviewAnswers = {};
+
+const interviewQuestionText = document.getElementById("interviewQuestionText");
+const interviewAnswer = document.getElementById("interviewAnswer");
+const interviewCounter = document.getElementById("interviewCounter");
+const btnInterviewPrev = document.getElementById("btnInterviewPrev");
+const btnInterviewNext = document.getElementById("btnInterviewNext");
+const btnInterviewSubmit = document.getElementById("btnInterviewSubmit");
+const interviewSummary = document.getElementById("interviewSummary");
+
+function persistCurrentInterviewAnswer() {
+  const q = interviewQuestions[interviewIndex];
+  if (q) {
+    interviewAnswers[q.id] = interviewAnswer.value;
+  }
+}
+
+function renderCurrentInterviewQuestion() {
+  const q = interviewQuestions[interviewIndex];
+  if (!q) {
+    interviewQuestionText.textContent = "Select filters and click Generate Questions to begin.";
+    interviewCounter.textContent = "Q 0 / 0";
+    interviewAnswer.value = "";
+    return;
+  }
+  interviewQuestionText.textContent = q.question || "Question unavailable.";
+  interviewCounter.textContent = `Q ${interviewIndex + 1} / ${interviewQuestions.length}`;
+  interviewAnswer.value = interviewAnswers[q.id] || "";
+  interviewSummary.style.display = "none";
+  interviewSummary.textContent = "";
+}
+
+btnInterviewPrev.addEventListener("click", () => {
+  if (interviewIndex > 0) {
+    persistCurrentInterviewAnswer();
+    interviewIndex--;
+    renderCurrentInterviewQuestion();
+  }
+});
+
+btnInterviewNext.addEventListener("click", () => {
+  if (interviewIndex < interviewQuestions.length - 1) {
+    persistCurrentInterviewAnswer();
+    interviewIndex++;
+    renderCurrentInterviewQuestion();
+  }
+});
+
+interviewAnswer.addEventListener("input", () => {
+  const q = interviewQuestions[interviewIndex];
+  if (q) {
+    interviewAnswers[q.id] = interviewAnswer.value;
+  }
+});
+
+btnInterviewSubmit.addEventListener("click", async () => {
+  if (interviewQuestions.length === 0) {
+    alert("Generate questions before submitting answers.");
+    return;
+  }
+  persistCurrentInterviewAnswer();
+  interviewSummary.style.display = "block";
+  interviewSummary.textContent = "Sending answers for AI review...";
+
+  const answersPayload = interviewQuestions.map(q => ({
+    id: q.id,
+    answer: interviewAnswers[q.id] || "",
+  }));
+
+  const res = await fetch("/api/review_interview_answers/stream", {
+    method: "POST",
+    headers: { "Content-Type": "application/json" },
+    body: JSON.stringify({ answers: answersPayload }),
+  });
+
+  if (res.ok && (res.headers.get("Content-Type") || "").includes("ndjson")) {
+    await streamInterviewReview(res, answersPayload.map(a => a.id));
+    return;
+  }
+
+  let data = await res.json();
+  if (!res.ok) {
+    interviewSummary.textContent = data.error || "Unable to review answers.";
+    return;
+  }
+  if (data.queued) {
+    interviewSummary.textContent = "AI review is busy right now. Your answers are queued and will be reviewed shortly...";
+    try {
+      data = await pollQueuedReview(data.job_id, data.retry_after);
+    } catch (err) {
+      interviewSummary.textContent = err.message;
+      return;
+    }
+  }
+
+  renderInterviewReview(data.evaluations || [], 0);
+});
+
+function renderInterviewReview(evaluations, pending) {
+  let text = `Reviewed ${evaluations.length} question(s).`;
+  if (pending) {
+    text += ` Reviewing ${pending} more...`;
+  }
+  text += "\n";
+  evaluations.forEach(item => {
+    text += `\nQuestion ${item.id}:\n`;
+    if (item.error) {
+      text += `${item.error}\n`;
+      return;
+    }
+    text += `Rating: ${item.rating}/5 (${item.verdict})\n`;
+    text += `Feedback: ${item.feedback}\n`;
+    if (item.strengths && item.strengths.length) {
+      text += `Strengths: ${item.strengths.join("; ")}\n`;
+    }
+    if (item.improvements && item.improvements.length) {
+      text += `Improvements: ${item.improvements.join("; ")}\n`;
+    }
+  });
+  interviewSummary.textContent = text;
+}
+
+// Evaluations arrive as NDJSON lines in the order they are ready; they are
+// shown in question order as each one lands.
+async function streamInterviewReview(res, ids) {
+  const received = {};
+  const render = () => {
+    const evaluations = ids.filter(id => received[id]).map(id => received[id]);
+    renderInterviewReview(evaluations, ids.length - evaluations.length);
+  };
+  const reader = res.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = "";
+  const apply = line => {
+    if (!line.trim()) return;
+    const item = JSON.parse(line);
+    received[item.id] = item.evaluation ? { ...item.evaluation, id: item.id } : { id: item.id, error: item.error };
+    render();
+  };
+  render();
+  while (true) {
+    const { done, value } = await reader.read();
+    if (done) break;
+    buffer += decoder.decode(value, { stream: true });
+    const lines = buffer.split("\n");
+    buffer = lines.pop();
+    lines.forEach(apply);
+  }
+  apply(buffer);
+}
+
+async function pollQueuedReview(jobId, retryAfter) {
+  let delay = Math.max(retryAfter || 0, 3) * 1000;
+  for (let attempt = 0; attempt < 40; attempt++) {
+    await new Promise(resolve => setTimeout(resolve, delay));
+    const res = await fetch(`/api/review_interview_answers/${jobId}`);
+    const data = await res.json();
+    if (res.status === 200) {
+      return data;
+    }
+    if (res.status !== 202) {
+      throw new Error(data.error || "Unable to review answers.");
+    }
+    delay = 3000;
+  }
+  throw new Error("Review is taking longer than expected. Please try again later.");
+}
+
+// ---------- GENERATION HANDLER ----------
+async function generateQuestions() {
+  const body = buildRequestBody();
+  quizSummary.style.display = "none";
+  interviewSummary.style.display = "none";
+
+  if (currentMode === "quiz") {
+    quizQuestionText.textContent = "Generating questions with Gemini...";
+    quizOptionsDiv.innerHTML = "";
+    stopQuizTimer();
+    adaptiveQuiz = null;
+  } else {
+    interviewQuestionText.textContent = "Generating questions with Gemini...";
+  }
+
+  btnGenerateQuestions.disabled = true;
+  btnGenerateQuestions.textContent = "Generating...";
+
+  try {
+    if (currentMode === "quiz" && limitInput.value === "adaptive") {
+      await startAdaptiveQuiz();
+      return;
+    }
+
+    const res = await fetch("/api/generate_questions", {
+      method: "POST",
+      headers: { "Content-Type": "application/json" },
+      body: JSON.stringify(body),
+    });
+    const data = await res.json();
+
+    if (!res.ok) {
+      throw new Error(data.error || "Failed to generate questions.");
+    }
+
+    if (currentMode === "quiz") {
+      quizQuestions = data.questions || [];
+      quizIndex = 0;
+      quizAnswers = {};
+      if (quizQuestions.length === 0) {
+        quizQuestionText.textContent = "Gemini returned no questions. Try different filters.";
+      } else {
+        renderCurrentQuizQuestion();
+        startQuizTimer();
+      }
+    } else {
+      interviewQuestions = data.questions || [];
+      interviewIndex = 0;
+      Object.keys(interviewAnswers).forEach(key => delete interviewAnswers[key]);
+      if (interviewQuestions.length === 0) {
+        interviewQuestionText.textContent = "Gemini returned no questions. Try different filters.";
+      } else {
+        renderCurrentInterviewQuestion();
+      }
+    }
+  } catch (err) {
+    if (currentMode === "quiz") {
+      quizQuestionText.textContent = err.message;
+    } else {
+      interviewQuestionText.textContent = err.message;
+    }
+  } finally {
+    btnGenerateQuestions.disabled = false;
+    btnGenerateQuestions.textContent = "⚡ Generate Questions";
+  }
+}
+
+btnGenerateQuestions.addEventListener("click", generateQuestions);
@@ -0,0 +1,235 @@
+// ---------- CAMERA SETUP ----------
+const videoEl = document.getElementById("userVideo");
+const statusText = document.getElementById("statusText");
+const btnToggleCamera = document.getElementById("btnToggleCamera");
+
+let cameraStream = null;
+let cameraOn = false;
+
+async function startCamera() {
+  try {
+    cameraStream = await navigator.mediaDevices.getUserMedia({ video: true, audio: false });
+    videoEl.srcObject = cameraStream;
+    cameraOn = true;
+    statusText.textContent = "Camera: On";
+  } catch (err) {
+    console.error("Camera error:", err);
+    statusText.textContent = "Camera: Permission denied or not available.";
+  }
+}
+
+function stopCamera() {
+  if (cameraStream) {
+    cameraStream.getTracks().forEach(t => t.stop());
+    cameraStream = null;
+  }
+  cameraOn = false;
+  statusText.textContent = "Camera: Off";
+  videoEl.srcObject = null;
+}
+
+btnToggleCamera.addEventListener("click", () => {
+  if (cameraOn) {
+    stopCamera();
+  } else {
+    startCamera();
+  }
+});
+
+// start camera on page load
+startCamera();
+
+// ---------- INTERVIEW LOGIC ----------
+const btnNewQuestion = document.getElementById("btnNewQuestion");
+const btnStartRecording = document.getElementById("btnStartRecording");
+const btnStopSend = document.getElementById("btnStopSend");
+const jobRoleInput = document.getElementById("jobRole");
+const expLevelInput = document.getElementById("experienceLevel");
+const typeInput = document.getElementById("interviewType");
+const questionBubble = document.getElementById("questionBubble");
+const transcriptionBox = document.getElementById("transcriptionBox");
+const recordingStatus = document.getElementById("recordingStatus");
+const feedbackBox = document.getElementById("feedbackBox");
+
+let mediaRecorder = null;
+let audioChunks = [];
+let isRecording = false;
+let recognition = null;
+
+// Initialize speech recognition if available
+if ('webkitSpeechRecognition' in window || 'SpeechRecognition' in window) {
+  const SpeechRecognition = window.SpeechRecognition || window.webkitSpeechRecognition;
+  recognition = new SpeechRecognition();
+  recognition.continuous = true;
+  recognition.interimResults = true;
+  recognition.lang = 'en-US';
+
+  recognition.onresult = (event) => {
+    let finalTranscript = '';
+    let interimTranscript = '';
+
+    for (let i = event.resultIndex; i < event.results.length; i++) {
+      const transcript = event.results[i][0].transcript;
+      if (event.results[i].isFinal) {
+        finalTranscript += transcript + ' ';
+      } else {
+        interimTranscript += transcript;
+      }
+    }
+
+    transcriptionBox.textContent = finalTranscript + interimTranscript;
+  };
+
+  recognition.onerror = (event) => {
+    console.error('Speech recognition error:', event.error);
+    recordingStatus.textContent = `Speech recognition error: ${event.error}`;
+  };
+}
+
+async function fetchQuestion() {
+  const jobRole = jobRoleInput.value.trim();
+  if (!jobRole) {
+    alert("Please enter a job role first.");
+    return;
+  }
+
+  questionBubble.textContent = "Generating question...";
+  feedbackBox.textContent = "After you answer, AI feedback will appear here.";
+  transcriptionBox.textContent = "Transcription will appear here as you speak...";
+
+  const payload = {
+    job_role: jobRole,
+    experience_level: expLevelInput.value,
+    interview_type: typeInput.value,
+  };
+
+  const res = await fetch("/mock-video/question", {
+    method: "POST",
+    headers: { "Content-Type": "application/json" },
+    body: JSON.stringify(payload),
+  });
+
+  if (!res.ok) {
+    questionBubble.textContent = "Error generating question. Try again.";
+    return;
+  }
+
+  const data = await res.json();
+  questionBubble.textContent = data.question || "No question received.";
+  transcriptionBox.textContent = "Transcription will appear here as you speak...";
+  feedbackBox.textContent = "After you answer, AI feedback will appear here.";
+}
+
+async function startRecording() {
+  if (isRecording) return;
+
+  try {
+    const stream = await navigator.mediaDevices.getUserMedia({ audio: true });
+    mediaRecorder = new MediaRecorder(stream);
+    audioChunks = [];
+
+    mediaRecorder.ondataavailable = (event) => {
+      audioChunks.push(event.data);
+    };
+
+    mediaRecorder.onstop = () => {
+      stream.getTracks().forEach(track => track.stop());
+    };
+
+    mediaRecorder.start();
+    isRecording = true;
+
+    btnStartRecording.disabled = true;
+    btnStopSend.disabled = false;
+    recordingStatus.textContent = "Recording... Click 'Stop and Send Answer' when done.";
+
+    // Start speech recognition if available
+    if (recognition) {
+      recognition.start();
+    }
+
+  } catch (error) {
+    console.error('Error starting recording:', error);
+    alert('Could not access microphone. Please check permissions.');
+    recordingStatus.textContent = "Error: Could not access microphone.";
+  }
+}
+
+async function stopAndSendAnswer() {
+  if (!isRecording) return;
+
+  mediaRecorder.stop();
+  isRecording = false;
+
+  if (recognition) {
+    recognition.stop();
+  }
+
+  btnStartRecording.disabled = false;
+  btnStopSend.disabled = true;
+  recordingStatus.textContent = "Processing your answer...";
+
+  const answer = transcriptionBox.textContent.trim();
+  if (!answer) {
+    alert("No speech detected. Please try recording again.");
+    recordingStatus.textContent = "Click 'Start Recording' to begin.";
+    return;
+  }
+
+  feedbackBox.textContent = "Evaluating your answer with AI...";
+
+  const res = await fetch("/mock-video/evaluate", {
+    method: "POST",
+    headers: { "Content-Type": "application/json" },
+    body: JSON.stringify({ answer }),
+  });
+
+  if (!res.ok) {
+    feedbackBox.textContent = "Error during evaluation. Please try again.";
+    recordingStatus.textContent = "Click 'Start Recording' to begin.";
+    return;
+  }
+
+  const data = await res.json();
+  if (data.error) {
+    feedbackBox.textContent = "Error: " + data.error;
+    recordingStatus.textContent = "Click 'Start Recording' to begin.";
+    return;
+  }
+
+  const scores = data.scores || {};
+  const strengths = data.strengths || [];
+  const improvements = data.improvements || [];
+  const improvedAnswer = data.improved_answer || "";
+
+  let feedbackText = "";
+  feedbackText += `Overall Score: ${data.overall_score ?? "N/A"}/10\n\n`;
+  feedbackText += "Scores:\n";
+  feedbackText += `- Content Quality: ${scores.content_quality ?? "N/A"}/10\n`;
+  feedbackText += `- Relevance: ${scores.relevance ?? "N/A"}/10\n`;
+  feedbackText += `- Technical Depth: ${scores.technical_depth ?? "N/A"}/10\n`;
+  feedbackText += `- Communication: ${scores.communication ?? "N/A"}/10\n`;
+  feedbackText += `- Structure: ${scores.structure ?? "N/A"}/10\n\n`;
+
+  feedbackText += "Strengths:\n";
+  strengths.forEach(s => {
+    feedbackText += `• ${s}\n`;
+  });
+  feedbackText += "\nImprovements:\n";
+  improvements.forEach(i => {
+    feedbackText += `• ${i}\n`;
+  });
+
+  feedbackText += "\nSuggested Improved Answer:\n";
+  feedbackText += improvedAnswer;
+
+  feedbackBox.textContent = feedbackText;
+  recordingStatus.textContent = "Evaluation complete. Click 'Start / Next Question' for the next question.";
+}
+
+btnNewQuestion.addEventListener("click", fetchQuestion);
+btnStartRecording.addEventListener("click", startRecording);
+btnStopSend.addEventListener("click", stopAndSendAnswer);
+
+// Auto-start camera on page load (as before)
+// ... existing camera code ...
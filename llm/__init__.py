@@ -0,0 +1 @@
+"""Shared Gemini call path: model routing, and helpers around it."""
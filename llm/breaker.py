@@ -0,0 +1,98 @@
+"""
+Circuit breaker around the Gemini client.
+
+closed    -> calls go through; consecutive failures are counted.
+open      -> calls fail immediately with CircuitOpenError until the
+             recovery timeout passes.
+half_open -> a limited number of probe calls are let through; a success
+             closes the circuit, a failure opens it again.
+"""
+import os
+import threading
+import time
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling Gemini while the circuit is open."""
+
+
+class CircuitBreaker:
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 30.0,
+                 half_open_max_calls: int = 1):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """Current state, moving open -> half_open once the timeout has passed."""
+        with self._lock:
+            self._maybe_half_open()
+            return self._state
+
+    def retry_after(self) -> int:
+        """Seconds until the next probe is allowed (0 when not open)."""
+        with self._lock:
+            if self._state != OPEN:
+                return 0
+            remaining = self.recovery_timeout - (time.monotonic() - self._opened_at)
+            return max(1, int(remaining + 0.999))
+
+    def _maybe_half_open(self) -> None:
+        if self._state == OPEN and time.monotonic() - self._opened_at >= self.recovery_timeout:
+            self._state = HALF_OPEN
+            self._probes_in_flight = 0
+
+    def allow_request(self) -> bool:
+        """Reserve a slot for one call; False means fail fast."""
+        with self._lock:
+            self._maybe_half_open()
+            if self._state == CLOSED:
+                return True
+            if self._state == HALF_OPEN and self._probes_in_flight < self.half_open_max_calls:
+                self._probes_in_flight += 1
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._state = CLOSED
+            self._failures = 0
+            self._probes_in_flight = 0
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._state == HALF_OPEN or self._failures >= self.failure_threshold:
+                self._state = OPEN
+                self._opened_at = time.monotonic()
+                self._probes_in_flight = 0
+
+    def call(self, fn, *args, **kwargs):
+        """Run fn through the breaker."""
+        if not self.allow_request():
+            raise CircuitOpenError(
+                f"Gemini is temporarily unavailable; retry in {self.retry_after()}s."
+            )
+        try:
+            result = fn(*args, **kwargs)
+        except Exception:
+            self.record_failure()
+            raise
+        self.record_success()
+        return result
+
+
+gemini_breaker = CircuitBreaker(
+    failure_threshold=int(os.getenv("LLM_BREAKER_FAILURES", "5")),
+    recovery_timeout=float(os.getenv("LLM_BREAKER_RECOVERY_SECONDS", "30")),
+)
@@ -0,0 +1,170 @@
+"""
+Token budgets for free-text prompt inputs (pasted job descriptions,
+uploaded resumes, LinkedIn exports).
+
+Each prompt family may set an "input_budget" (tokens) in its route
+(llm/routing.py). fit_inputs() estimates the tokens of every input locally
+(estimate_tokens(): a word/punctuation count that errs on the high side, no
+tokenizer download or API call). Inputs that fit are returned untouched.
+Over budget, every input is split into paragraph/sentence chunks (a sentence
+longer than a chunk is split at word boundaries), chunks are
+ranked by relevance to the query (BM25-style term overlap with the target
+role and profile keywords; an input's opening chunk gets a bonus since it
+usually names the role or the person), and the best chunks are kept in
+their original order until the budget is used. Removed spans are marked
+with OMITTED so the model knows the text is partial; an input with no chunk
+kept is replaced by OMITTED alone. fit_inputs() also
+returns what was dropped per input, for the caller's metrics.
+"""
+import math
+import re
+from collections import Counter
+
+from .routing import get_route
+
+CHUNK_TOKENS = 120
+OMITTED = "[...]"
+LEAD_BONUS = 1.5
+# BM25 parameters.
+K1, B = 1.2, 0.75
+
+_TOKEN_RE = re.compile(r"\w+|[^\w\s]", re.UNICODE)
+_TERM_RE = re.compile(r"[a-z0-9+#]{2,}")
+_PARAGRAPH_RE = re.compile(r"\n\s*\n")
+_SENTENCE_RE = re.compile(r"(?<=[.!?;])\s+|\n")
+_STOPWORDS = frozenset(
+    "and the for with you are our will this that from have has your who their they can all not any "
+    "but its was were been into about more than such etc per via use using able work working".split()
+)
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate token count: one per word or symbol, plus one per 8 chars of long words."""
+    return sum(1 + len(piece) // 8 for piece in _TOKEN_RE.findall(text or ""))
+
+
+def _terms(text: str) -> list:
+    return [term for term in _TERM_RE.findall(text.lower()) if term not in _STOPWORDS]
+
+
+def _split_words(sentence: str, max_tokens: int) -> list:
+    """A sentence longer than max_tokens, cut at word boundaries into pieces of at most max_tokens."""
+    pieces, current, size = [], [], 0
+    for word in sentence.split():
+        tokens = estimate_tokens(word)
+        if current and size + tokens > max_tokens:
+            pieces.append(" ".join(current))
+            current, size = [], 0
+        current.append(word)
+        size += tokens
+    if current:
+        pieces.append(" ".join(current))
+    return pieces
+
+
+def split_chunks(text: str, max_tokens: int = CHUNK_TOKENS) -> list:
+    """
+    Paragraphs, with long ones split at sentence ends into chunks of about
+    max_tokens; a sentence longer than max_tokens is split at word boundaries.
+    """
+    chunks = []
+    for paragraph in _PARAGRAPH_RE.split(text.strip()):
+        paragraph = paragraph.strip()
+        if not paragraph:
+            continue
+        if estimate_tokens(paragraph) <= max_tokens:
+            chunks.append(paragraph)
+            continue
+        current, size = [], 0
+        for sentence in _SENTENCE_RE.split(paragraph):
+            sentence = sentence.strip()
+            if not sentence:
+                continue
+            tokens = estimate_tokens(sentence)
+            pieces = _split_words(sentence, max_tokens) if tokens > max_tokens else [sentence]
+            for piece in pieces:
+                if len(pieces) > 1:
+                    tokens = estimate_tokens(piece)
+                if current and size + tokens > max_tokens:
+                    chunks.append(" ".join(current))
+                    current, size = [], 0
+                current.append(piece)
+                size += tokens
+        if current:
+            chunks.append(" ".join(current))
+    return chunks
+
+
+def _bm25_scores(chunk_terms: list, query_terms: set) -> list:
+    if not chunk_terms:
+        return []
+    doc_freq = Counter(term for terms in chunk_terms for term in set(terms))
+    count = len(chunk_terms)
+    avg_len = sum(len(terms) for terms in chunk_terms) / count or 1.0
+    scores = []
+    for terms in chunk_terms:
+        freq = Counter(terms)
+        norm = K1 * (1 - B + B * len(terms) / avg_len)
+        score = 0.0
+        for term in query_terms:
+            tf = freq.get(term)
+            if tf:
+                idf = math.log(1 + (count - doc_freq[term] + 0.5) / (doc_freq[term] + 0.5))
+                score += idf * tf * (K1 + 1) / (tf + norm)
+        scores.append(score)
+    return scores
+
+
+def truncate_to_budget(inputs: dict, query: str, budget: int) -> tuple:
+    """
+    ({name: text}, {name: {"tokens", "chunks"}} dropped) keeping the most
+    query-relevant chunks of all inputs within budget tokens.
+    """
+    chunks = []  # (name, position, text, tokens)
+    for name, text in inputs.items():
+        for position, chunk in enumerate(split_chunks(text or "")):
+            chunks.append((name, position, chunk, estimate_tokens(chunk)))
+
+    scores = _bm25_scores([_terms(chunk[2]) for chunk in chunks], set(_terms(query)))
+    ranked = sorted(
+        range(len(chunks)),
+        key=lambda idx: (-(scores[idx] + (LEAD_BONUS if chunks[idx][1] == 0 else 0.0)), idx),
+    )
+
+    kept, used = set(), 0
+    for idx in ranked:
+        tokens = chunks[idx][3]
+        if used + tokens <= budget:
+            kept.add(idx)
+            used += tokens
+
+    fitted = {name: [] for name in inputs}
+    dropped = {}
+    last_position = {}
+    for idx, (name, position, text, tokens) in enumerate(chunks):
+        if idx in kept:
+            if position != last_position.get(name, -1) + 1:
+                fitted[name].append(OMITTED)
+            fitted[name].append(text)
+            last_position[name] = position
+        else:
+            report = dropped.setdefault(name, {"tokens": 0, "chunks": 0})
+            report["tokens"] += tokens
+            report["chunks"] += 1
+    for name, parts in fitted.items():
+        total = sum(1 for chunk in chunks if chunk[0] == name)
+        if total and last_position.get(name, -1) != total - 1:
+            parts.append(OMITTED)
+    return {name: "\n\n".join(parts) for name, parts in fitted.items()}, dropped
+
+
+def fit_inputs(family: str, inputs: dict, query: str = "") -> tuple:
+    """
+    (inputs cut to the family's input_budget, dropped report); inputs come
+    back unchanged, with an empty report, when they fit or the family has
+    no budget.
+    """
+    budget = get_route(family).get("input_budget")
+    if not budget or sum(estimate_tokens(text or "") for text in inputs.values()) <= budget:
+        return inputs, {}
+    return truncate_to_budget(inputs, query, budget)
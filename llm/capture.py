@@ -0,0 +1,203 @@
+"""
+Capture of LLM traffic for offline replay (see scripts/replay_llm.py).
+
+With LLM_CAPTURE=1 every generate() call appends one JSON line to a
+rotating file in LLM_CAPTURE_DIR:
+
+    {"ts", "family", "tier", "cached_prefix", "prompt_chars", "prompt_hash",
+     "latency_ms", "prompt_tokens", "output_tokens", "response_chars",
+     "response", "error"}
+
+Prompts are never stored (only their size and a salted hash). Responses are
+pseudonymized: every word of free text is replaced by a same-length
+pseudo-word derived from a salt, and JSON keys, numbers and punctuation are
+kept, so the replayed payloads parse exactly like the originals. Values the
+app matches or branches on (ids, enum-like labels such as difficulty or
+verdict, and resume patch "find" text, which must match the prompt) are kept
+as they are; see _KEEP_KEYS.
+"""
+import hashlib
+import json
+import os
+import random
+import re
+import threading
+import time
+
+CAPTURE_ENABLED = os.getenv("LLM_CAPTURE", "0") == "1"
+CAPTURE_SAMPLE_RATE = float(os.getenv("LLM_CAPTURE_SAMPLE_RATE", "1.0"))
+CAPTURE_MAX_BYTES = int(os.getenv("LLM_CAPTURE_MAX_BYTES", str(10 * 1024 * 1024)))
+CAPTURE_MAX_FILES = int(os.getenv("LLM_CAPTURE_MAX_FILES", "20"))
+CAPTURE_DIR = os.getenv(
+    "LLM_CAPTURE_DIR",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "instance", "llm_capture"),
+)
+
+# Set LLM_CAPTURE_SALT to keep pseudonyms and prompt hashes stable across processes.
+_SALT = os.getenv("LLM_CAPTURE_SALT", "").encode("utf-8") or os.urandom(16)
+_WORD_RE = re.compile(r"[^\W_]+", re.UNICODE)
+_FENCE_RE = re.compile(r"^```(?:json)?|```$")
+_LETTERS = "abcdefghijklmnopqrstuvwxyz"
+# JSON keys whose values are identifiers, labels from a fixed set, or text
+# the app looks up in the prompt; they are not free text and are kept.
+_KEEP_KEYS = frozenset((
+    "id", "difficulty", "verdict", "category", "round_type", "question_type",
+    "type", "status", "level", "find",
+))
+
+
+def _pseudo_word(word: str) -> str:
+    digest = hashlib.sha256(_SALT + word.lower().encode("utf-8")).digest()
+    out = []
+    for idx, char in enumerate(word):
+        byte = digest[idx % len(digest)]
+        if char.isdigit():
+            out.append(str(byte % 10))
+        else:
+            letter = _LETTERS[byte % 26]
+            out.append(letter.upper() if char.isupper() else letter)
+    return "".join(out)
+
+
+def anonymize_text(text: str) -> str:
+    return _WORD_RE.sub(lambda m: _pseudo_word(m.group(0)), text or "")
+
+
+def _anonymize_value(value):
+    if isinstance(value, str):
+        return anonymize_text(value)
+    if isinstance(value, list):
+        return [_anonymize_value(item) for item in value]
+    if isinstance(value, dict):
+        return {
+            key: item if key in _KEEP_KEYS else _anonymize_value(item)
+            for key, item in value.items()
+        }
+    return value
+
+
+def anonymize_response(text: str) -> str:
+    """Pseudonymize a response, keeping JSON structure when it parses."""
+    stripped = _FENCE_RE.sub("", (text or "").strip()).strip()
+    try:
+        data = json.loads(stripped)
+    except ValueError:
+        return anonymize_text(text)
+    return json.dumps(_anonymize_value(data))
+
+
+def _prompt_text(prompt) -> str:
+    if isinstance(prompt, str):
+        return prompt
+    if isinstance(prompt, (list, tuple)):
+        return "".join(_prompt_text(part) for part in prompt)
+    return str(prompt)
+
+
+def _usage(response) -> tuple:
+    usage = getattr(response, "usage_metadata", None)
+    return (
+        getattr(usage, "prompt_token_count", None),
+        getattr(usage, "candidates_token_count", None),
+    )
+
+
+def _response_text(response) -> str:
+    try:
+        return response.text or ""
+    except (AttributeError, ValueError):
+        # Blocked or empty candidates raise on .text.
+        return ""
+
+
+class RotatingJSONLWriter:
+    """Appends JSON lines, starting a new file past max_bytes, keeping max_files."""
+
+    def __init__(self, directory: str, max_bytes: int, max_files: int, prefix: str = "capture"):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_files = max_files
+        self.prefix = prefix
+        self._path = None
+        self._lock = threading.Lock()
+
+    def _files(self) -> list:
+        names = [
+            name for name in os.listdir(self.directory)
+            if name.startswith(self.prefix) and name.endswith(".jsonl")
+        ]
+        return sorted(os.path.join(self.directory, name) for name in names)
+
+    def _rotate(self) -> None:
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        self._path = os.path.join(self.directory, f"{self.prefix}-{stamp}-{os.getpid()}.jsonl")
+        files = self._files()
+        # Keep max_files in total, counting the file about to be created.
+        for path in files[:max(0, len(files) - self.max_files + 1)]:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def write(self, record: dict) -> None:
+        line = json.dumps(record, separators=(",", ":")) + "\n"
+        with self._lock:
+            os.makedirs(self.directory, exist_ok=True)
+            if (
+                self._path is None
+                or not os.path.exists(self._path)
+                or os.path.getsize(self._path) + len(line) > self.max_bytes
+            ):
+                self._rotate()
+            with open(self._path, "a", encoding="utf-8") as fh:
+                fh.write(line)
+
+
+_writer = RotatingJSONLWriter(CAPTURE_DIR, CAPTURE_MAX_BYTES, CAPTURE_MAX_FILES)
+
+
+def enabled() -> bool:
+    return CAPTURE_ENABLED and (CAPTURE_SAMPLE_RATE >= 1 or random.random() < CAPTURE_SAMPLE_RATE)
+
+
+def record(family: str, tier: str, prompt, response, latency: float,
+           cached_prefix: bool = False, error: BaseException = None) -> None:
+    """Write one anonymized capture record; never raises."""
+    text = _response_text(response) if response is not None else ""
+    prompt_text = _prompt_text(prompt)
+    prompt_tokens, output_tokens = _usage(response)
+    entry = {
+        "ts": time.time(),
+        "family": family,
+        "tier": tier,
+        "cached_prefix": cached_prefix,
+        "prompt_chars": len(prompt_text),
+        "prompt_hash": hashlib.sha256(_SALT + prompt_text.encode("utf-8")).hexdigest()[:16],
+        "latency_ms": round(latency * 1000, 2),
+        "prompt_tokens": prompt_tokens,
+        "output_tokens": output_tokens,
+        "response_chars": len(text),
+        "response": anonymize_response(text) if text else "",
+        "error": type(error).__name__ if error is not None else None,
+    }
+    try:
+        _writer.write(entry)
+    except OSError:
+        pass
+
+
+def load_records(paths) -> list:
+    """Read capture records from JSONL files and/or directories, oldest first."""
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(
+                os.path.join(path, name) for name in sorted(os.listdir(path)) if name.endswith(".jsonl")
+            )
+        else:
+            files.append(path)
+    records = []
+    for path in files:
+        with open(path, encoding="utf-8") as fh:
+            records.extend(json.loads(line) for line in fh if line.strip())
+    return sorted(records, key=lambda item: item.get("ts", 0))
@@ -0,0 +1,103 @@
+"""
+Gemini context caching for long-lived interview sessions.
+
+The stable part of a prompt (instructions, schema and the candidate profile
+with resume and JD) is uploaded once as cached content; later calls send only
+the variable suffix. Whenever caching is unavailable (prefix below the API
+minimum, SDK without caching support, a backend that rejects it) callers
+transparently fall back to the inline prompt.
+"""
+import datetime
+import os
+
+from .breaker import CircuitOpenError
+from .budget import estimate_tokens
+from .routing import MODEL_TIERS, generate, generate_stream, get_route
+
+try:
+    from google.generativeai import caching
+except ImportError:  # pragma: no cover - older SDKs
+    caching = None
+
+CONTEXT_CACHE_ENABLED = os.getenv("LLM_CONTEXT_CACHE", "1") != "0"
+CONTEXT_CACHE_TTL_SECONDS = int(os.getenv("LLM_CONTEXT_CACHE_TTL", "3600"))
+# Gemini rejects cached content below a minimum token count. Counted with
+# llm/budget.estimate_tokens, the unit of the routes' input_budget.
+CONTEXT_CACHE_MIN_TOKENS = int(os.getenv("LLM_CONTEXT_CACHE_MIN_TOKENS", "4096"))
+
+
+def create_cache(family: str, prefix: str, ttl_seconds: int = CONTEXT_CACHE_TTL_SECONDS):
+    """
+    Upload prefix as cached content for the family's primary model.
+    Returns the cache name, or None when caching is not available.
+    """
+    if not CONTEXT_CACHE_ENABLED or caching is None:
+        return None
+    if estimate_tokens(prefix) < CONTEXT_CACHE_MIN_TOKENS:
+        return None
+    route = get_route(family)
+    try:
+        cached = caching.CachedContent.create(
+            model=MODEL_TIERS[route["tier"]],
+            display_name=f"interview-{family}",
+            contents=[prefix],
+            ttl=datetime.timedelta(seconds=ttl_seconds),
+        )
+    except Exception:  # pylint: disable=broad-except
+        return None
+    return cached.name
+
+
+def create_caches(prefixes: dict) -> dict:
+    """Create one cache per family in {family: prefix}; skips unavailable ones."""
+    names = {}
+    for family, prefix in prefixes.items():
+        name = create_cache(family, prefix)
+        if name:
+            names[family] = name
+    return names
+
+
+def generate_with_prefix(family: str, prefix: str, suffix: str, cache_name: str = None):
+    """
+    Generate using the cached prefix when cache_name is set, otherwise (or if
+    the cached call fails for a non-availability reason) send it inline.
+    """
+    if cache_name:
+        try:
+            return generate(family, suffix, cached_content=cache_name)
+        except (CircuitOpenError, TimeoutError):
+            raise
+        except Exception:  # pylint: disable=broad-except
+            pass  # expired or deleted cache: fall back to the inline prompt
+    return generate(family, prefix + suffix)
+
+
+def generate_stream_with_prefix(family: str, prefix: str, suffix: str, cache_name: str = None):
+    """Streaming generate_with_prefix(); the inline fallback applies until the first chunk."""
+    if cache_name:
+        stream = generate_stream(family, suffix, cached_content=cache_name)
+        try:
+            first = next(stream)
+        except StopIteration:
+            return
+        except (CircuitOpenError, TimeoutError):
+            raise
+        except Exception:  # pylint: disable=broad-except
+            stream = None  # expired or deleted cache: fall back to the inline prompt
+        if stream is not None:
+            yield first
+            yield from stream
+            return
+    yield from generate_stream(family, prefix + suffix)
+
+
+def release_caches(names) -> None:
+    """Delete cached contents (best effort; they also expire via TTL)."""
+    if caching is None:
+        return
+    for name in names:
+        try:
+            caching.CachedContent.get(name).delete()
+        except Exception:  # pylint: disable=broad-except
+            pass
@@ -0,0 +1,322 @@
+"""
+Per-prompt-family model routing with latency budgets and hedged requests.
+
+Each prompt family (extract, match, create, polish, polish_patch,
+question_gen, explain, evaluate, batch_review) maps to a model tier, a max_output_tokens cap and a latency
+budget. If the primary call has not returned by the family's p95 deadline, a
+duplicate is sent to the hedge tier and whichever finishes first wins.
+Every call goes through the shared circuit breaker (llm/breaker.py) and,
+with LLM_CAPTURE=1, is recorded for offline replay (llm/capture.py).
+set_backend() swaps Gemini for a stand-in (used by scripts/replay_llm.py).
+generate_stream() yields the response text as it is produced, for callers
+that parse JSON arrays incrementally (llm/streaming.py).
+"""
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from types import SimpleNamespace
+
+import google.generativeai as genai
+
+from . import capture
+from .breaker import CircuitOpenError, gemini_breaker
+
+MODEL_TIERS = {
+    "fast": os.getenv("GEMINI_FAST_MODEL", "models/gemini-2.0-flash-lite"),
+    "standard": os.getenv("GEMINI_STANDARD_MODEL", "models/gemini-2.0-flash"),
+}
+
+# latency_budget: hard timeout (seconds) for the whole call, hedges included.
+# hedge_after: default p95 deadline before enough latencies are observed;
+#   None disables hedging for the family.
+# input_budget: estimated tokens allowed for free-text inputs (pasted JDs,
+#   resumes); longer inputs are cut by relevance (llm/budget.py). The
+#   question_gen/evaluate prefixes are context-cached per interview session,
+#   so their budget must stay above CONTEXT_CACHE_MIN_TOKENS
+#   (llm/context_cache.py): long profiles are the ones worth caching.
+ROUTES = {
+    "extract": {
+        "tier": "standard",
+        "max_output_tokens": 2048,
+        "latency_budget": 30.0,
+        "hedge_after": 12.0,
+        "hedge_tier": "standard",
+        "input_budget": 6000,
+    },
+    "match": {
+        "tier": "standard",
+        "max_output_tokens": 2048,
+        "latency_budget": 25.0,
+        "hedge_after": 10.0,
+        "hedge_tier": "fast",
+        "input_budget": 3000,
+    },
+    "create": {
+        "tier": "standard",
+        "max_output_tokens": 1024,
+        "latency_budget": 25.0,
+        "hedge_after": 10.0,
+        "hedge_tier": "fast",
+    },
+    "polish": {
+        "tier": "fast",
+        "max_output_tokens": 1536,
+        "latency_budget": 15.0,
+        "hedge_after": 6.0,
+        "hedge_tier": "fast",
+    },
+    "polish_patch": {
+        "tier": "fast",
+        "max_output_tokens": 512,
+        "latency_budget": 10.0,
+        "hedge_after": 4.0,
+        "hedge_tier": "fast",
+    },
+    "question_gen": {
+        "tier": "standard",
+        "max_output_tokens": 2048,
+        "latency_budget": 20.0,
+        "hedge_after": 8.0,
+        "hedge_tier": "fast",
+        "input_budget": 6000,
+    },
+    "explain": {
+        "tier": "fast",
+        "max_output_tokens": 768,
+        "latency_budget": 15.0,
+        "hedge_after": 6.0,
+        "hedge_tier": "fast",
+    },
+    "evaluate": {
+        "tier": "fast",
+        "max_output_tokens": 512,
+        "latency_budget": 12.0,
+        "hedge_after": 5.0,
+        "hedge_tier": "fast",
+        "input_budget": 6000,
+    },
+    "batch_review": {
+        "tier": "standard",
+        "max_output_tokens": 3072,
+        "latency_budget": 30.0,
+        "hedge_after": None,
+        "hedge_tier": "fast",
+    },
+}
+
+# Observed latencies replace the static hedge deadline once there are enough.
+LATENCY_WINDOW = 200
+MIN_SAMPLES_FOR_P95 = 20
+
+_executor = ThreadPoolExecutor(
+    max_workers=int(os.getenv("LLM_MAX_WORKERS", "16")),
+    thread_name_prefix="llm",
+)
+_latencies = {family: deque(maxlen=LATENCY_WINDOW) for family in ROUTES}
+_latency_lock = threading.Lock()
+_models = {}
+# Per-thread total time spent waiting on Gemini (read by web/profiling.py).
+_wait = threading.local()
+# Replaces _generate_routed when set: backend(family, prompt, cached_content).
+_backend = None
+
+
+def get_route(family: str) -> dict:
+    """Return the route config for a prompt family."""
+    try:
+        return ROUTES[family]
+    except KeyError as exc:
+        raise ValueError(f"Unknown prompt family: {family}") from exc
+
+
+def get_model(tier: str, max_output_tokens: int):
+    """Return a (cached) Gemini model for a tier and output cap."""
+    key = (tier, max_output_tokens)
+    model = _models.get(key)
+    if model is None:
+        model = genai.GenerativeModel(
+            MODEL_TIERS[tier],
+            generation_config={"max_output_tokens": max_output_tokens},
+        )
+        _models[key] = model
+    return model
+
+
+def llm_wait_seconds() -> float:
+    """Time the current thread has spent in generate() since the last reset."""
+    return getattr(_wait, "seconds", 0.0)
+
+
+def reset_llm_wait() -> None:
+    _wait.seconds = 0.0
+
+
+def record_latency(family: str, seconds: float) -> None:
+    with _latency_lock:
+        _latencies[family].append(seconds)
+
+
+def hedge_deadline(family: str):
+    """p95 of recent latencies for the family, or the configured default."""
+    route = get_route(family)
+    if route["hedge_after"] is None:
+        return None
+    with _latency_lock:
+        samples = sorted(_latencies[family])
+    if len(samples) < MIN_SAMPLES_FOR_P95:
+        return route["hedge_after"]
+    p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+    return min(p95, route["latency_budget"])
+
+
+def set_backend(backend) -> None:
+    """Route every generate() call to backend instead of Gemini (None restores it)."""
+    global _backend  # pylint: disable=global-statement
+    _backend = backend
+
+
+def _call(tier: str, route: dict, prompt, cached_content=None, stream: bool = False):
+    if cached_content:
+        model = genai.GenerativeModel.from_cached_content(
+            cached_content,
+            generation_config={"max_output_tokens": route["max_output_tokens"]},
+        )
+    else:
+        model = get_model(tier, route["max_output_tokens"])
+    return model.generate_content(
+        prompt,
+        stream=stream,
+        request_options={"timeout": route["latency_budget"]},
+    )
+
+
+def _chunk_text(chunk) -> str:
+    try:
+        return chunk.text or ""
+    except (AttributeError, ValueError):
+        # Chunks without text parts (e.g. the final finish-reason chunk) raise on .text.
+        return ""
+
+
+def generate(family: str, prompt, cached_content: str = None):
+    """
+    Run a prompt through the family's route and return the Gemini response.
+    cached_content is a context-cache name created for the family's primary
+    tier (see llm/context_cache.py); hedges then stay on that tier.
+    Raises CircuitOpenError while the breaker is open and TimeoutError when
+    the latency budget is exhausted.
+    """
+    started = time.monotonic()
+    response = error = None
+    try:
+        response = gemini_breaker.call(_backend or _generate_routed, family, prompt, cached_content)
+        return response
+    except Exception as exc:
+        error = exc
+        raise
+    finally:
+        elapsed = time.monotonic() - started
+        _wait.seconds = llm_wait_seconds() + elapsed
+        if capture.enabled():
+            capture.record(
+                family,
+                get_route(family)["tier"],
+                prompt,
+                response,
+                elapsed,
+                cached_prefix=bool(cached_content),
+                error=error,
+            )
+
+
+def generate_stream(family: str, prompt, cached_content: str = None):
+    """
+    Like generate(), but yield the response text in chunks as Gemini streams
+    it. There is no hedging (a stream cannot switch models once tokens have
+    arrived); the latency budget is the request timeout. Closing the
+    generator early stops reading and counts as a success for the breaker.
+    With set_backend(), the stand-in's whole response is a single chunk.
+    """
+    if not gemini_breaker.allow_request():
+        raise CircuitOpenError(
+            f"Gemini is temporarily unavailable; retry in {gemini_breaker.retry_after()}s."
+        )
+    route = get_route(family)
+    started = time.monotonic()
+    parts = []
+    error = None
+    try:
+        if _backend is not None:
+            chunks = [_chunk_text(_backend(family, prompt, cached_content))]
+        else:
+            response = _call(route["tier"], route, prompt, cached_content, stream=True)
+            chunks = (_chunk_text(chunk) for chunk in response)
+        for text in chunks:
+            if text:
+                parts.append(text)
+                yield text
+    except Exception as exc:
+        error = exc
+        raise
+    finally:
+        if error is None:
+            gemini_breaker.record_success()
+        else:
+            gemini_breaker.record_failure()
+        elapsed = time.monotonic() - started
+        _wait.seconds = llm_wait_seconds() + elapsed
+        if capture.enabled():
+            capture.record(
+                family,
+                route["tier"],
+                prompt,
+                SimpleNamespace(text="".join(parts)),
+                elapsed,
+                cached_prefix=bool(cached_content),
+                error=error,
+            )
+
+
+def _generate_routed(family: str, prompt, cached_content=None):
+    route = get_route(family)
+    # A context cache is bound to one model, so hedges cannot switch tiers.
+    hedge_tier = route["tier"] if cached_content else route["hedge_tier"]
+    started = time.monotonic()
+    pending = {_executor.submit(_call, route["tier"], route, prompt, cached_content)}
+
+    deadline = hedge_deadline(family)
+    hedged = deadline is None
+    last_error = None
+
+    while pending:
+        elapsed = time.monotonic() - started
+        remaining = route["latency_budget"] - elapsed
+        if remaining <= 0:
+            break
+        timeout = remaining if hedged else max(0.0, min(remaining, deadline - elapsed))
+        done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+
+        for future in done:
+            try:
+                response = future.result()
+            except Exception as exc:  # pylint: disable=broad-except
+                last_error = exc
+                continue
+            for other in pending:
+                other.cancel()
+            record_latency(family, time.monotonic() - started)
+            return response
+
+        if not hedged and (not done or last_error is not None):
+            # Primary is slow (or failed): fire the duplicate on the hedge tier.
+            hedged = True
+            pending.add(_executor.submit(_call, hedge_tier, route, prompt, cached_content))
+
+    if last_error is not None and not pending:
+        raise last_error
+    record_latency(family, time.monotonic() - started)
+    raise TimeoutError(
+        f"Gemini call for '{family}' exceeded {route['latency_budget']:.0f}s budget."
+    )
@@ -0,0 +1,109 @@
+"""
+Incremental parsing of streamed JSON-array responses.
+
+Prompts that ask for a JSON array of objects can be consumed element by
+element while Gemini is still writing: ArrayItemParser tracks string/escape
+state and brace depth over the text chunks and hands back each top-level
+object as soon as its closing brace arrives. iter_array_items() wraps a
+chunk stream, stops reading (and closes the stream) once `limit` items were
+produced, and raises OffSchemaError as soon as the output cannot be the
+expected array, so a derailed generation is not paid for to the end.
+"""
+import json
+
+# Markdown fence Gemini sometimes puts before the array despite instructions.
+_FENCE = "```json"
+_MAX_PREFIX = 64
+
+
+class OffSchemaError(ValueError):
+    """The streamed output is not a JSON array of objects (or fails validation)."""
+
+
+class ArrayItemParser:
+    """Feed text chunks; get back each completed top-level array element."""
+
+    def __init__(self):
+        self.done = False
+        self._started = False
+        self._prefix = ""
+        self._buf = []
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+
+    def _before_array(self, char: str) -> None:
+        if char == "[":
+            self._started = True
+            return
+        self._prefix += char
+        head = self._prefix.strip()
+        if len(self._prefix) > _MAX_PREFIX or not _FENCE.startswith(head):
+            raise OffSchemaError(f"Expected a JSON array, got {self._prefix.strip()[:40]!r}.")
+
+    def feed(self, text: str) -> list:
+        items = []
+        for char in text:
+            if self.done:
+                break
+            if not self._started:
+                self._before_array(char)
+                continue
+
+            if self._depth == 0:
+                if char in " \t\r\n,":
+                    continue
+                if char == "]":
+                    self.done = True
+                    continue
+                if char != "{":
+                    raise OffSchemaError(f"Expected an object in the array, got {char!r}.")
+
+            self._buf.append(char)
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char in "{[":
+                self._depth += 1
+            elif char in "}]":
+                self._depth -= 1
+                if self._depth == 0:
+                    raw = "".join(self._buf)
+                    self._buf = []
+                    try:
+                        items.append(json.loads(raw))
+                    except ValueError as exc:
+                        raise OffSchemaError(f"Malformed array element: {exc}") from exc
+        return items
+
+
+def iter_array_items(chunks, limit: int = None, validate=None):
+    """
+    Yield the objects of a streamed JSON array from an iterable of text
+    chunks. Stops after `limit` items or at the closing bracket; raises
+    OffSchemaError when the text or an item (validate(item) is falsy) is off
+    schema. The chunk iterator is closed whenever iteration ends early.
+    """
+    parser = ArrayItemParser()
+    produced = 0
+    try:
+        for chunk in chunks:
+            for item in parser.feed(chunk):
+                if validate is not None and not validate(item):
+                    raise OffSchemaError(f"Array element does not match the schema: {str(item)[:80]}")
+                yield item
+                produced += 1
+                if limit is not None and produced >= limit:
+                    return
+            if parser.done:
+                return
+    finally:
+        close = getattr(chunks, "close", None)
+        if close is not None:
+            close()
@@ -0,0 +1,390 @@
+"""
+Adaptive MCQ assessment with a two-parameter IRT model.
+
+Every bank item has a discrimination a and difficulty b:
+
+    P(correct | theta) = 1 / (1 + exp(-a * (theta - b)))
+
+Parameters come from scripts/estimate_item_params.py (fitted offline on
+the attempts recorded here); uncalibrated items use DEFAULT_DISCRIMINATION
+and a difficulty derived from their easy/medium/hard label.
+
+For a set of candidate items, ItemTable precomputes, on a fixed theta grid,
+log P and log(1 - P) for every item and the items ranked by Fisher
+information a^2 * P * (1 - P). Estimating ability (EAP with a standard
+normal prior) is then a sum of table rows, and choosing the next item is a
+walk down one precomputed ranking, skipping items already asked. The
+assessment stops when the posterior standard error drops below TARGET_SE.
+Tables are built outside the bank lock, and new generated items are merged
+into the cached tables (ItemTable.extended()) instead of invalidating them.
+
+The bank is the question store (quiz/store.py) plus every generated quiz
+question recorded with ItemBank.add(), so most assessments run without
+calling Gemini at all. Store questions are indexed by row with only their
+difficulty and topic kept in memory; a question is decoded when it is
+served (ItemBank.get()). At most MAX_BANK_ITEMS generated questions are
+kept; beyond that the oldest are dropped and quiz_items.jsonl is compacted.
+"""
+import bisect
+import copy
+import hashlib
+import json
+import math
+import os
+import random
+import threading
+import time
+from collections import OrderedDict, deque
+
+from llm.capture import RotatingJSONLWriter
+
+from .services import to_skills_question
+from .store import QuestionStore, question_bank
+
+INSTANCE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "instance")
+ITEM_BANK_PATH = os.getenv("QUIZ_ITEM_BANK", os.path.join(INSTANCE_DIR, "quiz_items.jsonl"))
+ITEM_PARAMS_PATH = os.getenv("QUIZ_ITEM_PARAMS", os.path.join(INSTANCE_DIR, "quiz_item_params.json"))
+ATTEMPTS_DIR = os.getenv("QUIZ_ATTEMPTS_DIR", os.path.join(INSTANCE_DIR, "quiz_attempts"))
+
+TARGET_SE = float(os.getenv("ADAPTIVE_TARGET_SE", "0.45"))
+MIN_ITEMS = int(os.getenv("ADAPTIVE_MIN_ITEMS", "5"))
+MAX_ITEMS = int(os.getenv("ADAPTIVE_MAX_ITEMS", "12"))
+# Pick randomly among the top-N most informative items so everyone with the
+# same answers does not see the same sequence.
+RANDOMESQUE = int(os.getenv("ADAPTIVE_RANDOMESQUE", "3"))
+# Topics are free text: keep only the most recently used item tables.
+MAX_TABLES = int(os.getenv("ADAPTIVE_MAX_TABLES", "64"))
+MAX_BANK_ITEMS = int(os.getenv("ADAPTIVE_MAX_BANK_ITEMS", "5000"))
+
+DEFAULT_DISCRIMINATION = 1.2
+LABEL_DIFFICULTY = {"easy": -1.0, "medium": 0.0, "hard": 1.0}
+
+THETA_MIN, THETA_MAX, THETA_STEP = -4.0, 4.0, 0.1
+THETA_GRID = [THETA_MIN + i * THETA_STEP for i in range(int(round((THETA_MAX - THETA_MIN) / THETA_STEP)) + 1)]
+LOG_PRIOR = [-0.5 * theta * theta for theta in THETA_GRID]
+
+
+def item_id(question: dict) -> str:
+    """Stable id for a generated MCQ (hash of its text and options)."""
+    raw = json.dumps([" ".join((question.get("question") or "").lower().split()), question.get("options")])
+    return "g-" + hashlib.sha1(raw.encode("utf-8")).hexdigest()[:12]
+
+
+def default_params(question: dict) -> dict:
+    label = (question.get("difficulty") or "medium").lower()
+    return {"a": DEFAULT_DISCRIMINATION, "b": LABEL_DIFFICULTY.get(label, 0.0)}
+
+
+def _bank_entry(bank, row: int) -> tuple:
+    """(item id, difficulty, topic) of a question_bank() row, without decoding the question."""
+    if isinstance(bank, QuestionStore):
+        tags = bank.tags("tech", row)
+        return f"bank-{bank.question_id(row)}", bank.label("difficulty", row), tags[0] if tags else "General"
+    q = bank[row]
+    return f"bank-{q.get('id', row + 1)}", q.get("difficulty"), (q.get("tech_tags") or ["General"])[0]
+
+
+def _bank_text(bank, row: int) -> str:
+    if isinstance(bank, QuestionStore):
+        return bank.question_text(row)
+    return bank[row]["question_text"]
+
+
+class ItemTable:
+    """Precomputed grid tables for one candidate item set."""
+
+    def __init__(self, items: list, params: dict):
+        self.ids = []
+        self.index = {}
+        self.log_p = []
+        self.log_q = []
+        self.information = []
+        self._append(items, params)
+        # ranked[g]: item indexes by information at THETA_GRID[g], best first.
+        self.ranked = [
+            sorted(range(len(self.ids)), key=lambda idx, g=g: -self.information[idx][g])
+            for g in range(len(THETA_GRID))
+        ]
+
+    def _append(self, items: list, params: dict) -> None:
+        for q in items:
+            if q["id"] in self.index:
+                continue
+            p = params.get(q["id"]) or default_params(q)
+            a, b = p["a"], p["b"]
+            probs = [1.0 / (1.0 + math.exp(-a * (theta - b))) for theta in THETA_GRID]
+            self.index[q["id"]] = len(self.ids)
+            self.ids.append(q["id"])
+            self.log_p.append([math.log(max(prob, 1e-12)) for prob in probs])
+            self.log_q.append([math.log(max(1.0 - prob, 1e-12)) for prob in probs])
+            self.information.append([a * a * prob * (1.0 - prob) for prob in probs])
+
+    def extended(self, items: list, params: dict) -> "ItemTable":
+        """
+        A copy with items added: only their rows are computed and they are
+        inserted into the existing rankings. The table itself is unchanged,
+        so assessments reading it concurrently are unaffected.
+        """
+        table = copy.copy(self)
+        table.ids = list(self.ids)
+        table.index = dict(self.index)
+        table.log_p = list(self.log_p)
+        table.log_q = list(self.log_q)
+        table.information = list(self.information)
+        start = len(table.ids)
+        table._append(items, params)  # pylint: disable=protected-access
+        information = table.information
+        table.ranked = []
+        for g, ranked in enumerate(self.ranked):
+            ranked = list(ranked)
+            for idx in range(start, len(table.ids)):
+                bisect.insort(ranked, idx, key=lambda i, g=g: -information[i][g])
+            table.ranked.append(ranked)
+        return table
+
+    def __len__(self):
+        return len(self.ids)
+
+    def estimate(self, administered: list, responses: list) -> tuple:
+        """EAP ability estimate and its standard error."""
+        log_post = list(LOG_PRIOR)
+        for qid, correct in zip(administered, responses):
+            idx = self.index.get(qid)
+            if idx is None:
+                continue
+            row = self.log_p[idx] if correct else self.log_q[idx]
+            log_post = [lp + value for lp, value in zip(log_post, row)]
+        peak = max(log_post)
+        weights = [math.exp(lp - peak) for lp in log_post]
+        total = sum(weights)
+        mean = sum(w * theta for w, theta in zip(weights, THETA_GRID)) / total
+        var = sum(w * (theta - mean) ** 2 for w, theta in zip(weights, THETA_GRID)) / total
+        return mean, math.sqrt(var)
+
+    def next_item(self, theta: float, administered, rng=random) -> str:
+        """Most informative unasked item at theta (randomesque), or None."""
+        g = min(len(THETA_GRID) - 1, max(0, int(round((theta - THETA_MIN) / THETA_STEP))))
+        asked = set(administered)
+        top = []
+        for idx in self.ranked[g]:
+            if self.ids[idx] not in asked:
+                top.append(self.ids[idx])
+                if len(top) >= max(1, RANDOMESQUE):
+                    break
+        return rng.choice(top) if top else None
+
+
+def ability_level(theta: float) -> str:
+    if theta < -0.5:
+        return "beginner"
+    if theta < 0.5:
+        return "intermediate"
+    return "advanced"
+
+
+def should_stop(asked: int, se: float, remaining: int) -> bool:
+    if remaining <= 0 or asked >= MAX_ITEMS:
+        return True
+    return asked >= MIN_ITEMS and se <= TARGET_SE
+
+
+class ItemBank:
+    """Bank MCQs (skills-quiz schema, keyed by id) plus fitted parameters."""
+
+    def __init__(self, bank_path: str = ITEM_BANK_PATH, params_path: str = ITEM_PARAMS_PATH):
+        self.bank_path = bank_path
+        self.params_path = params_path
+        self._rows = {}  # store item id -> question_bank() row, decoded on get()
+        self._items = OrderedDict()  # generated item id -> question, oldest first
+        self._meta = {}  # item id -> (difficulty, topic, bank_topic), all items
+        self._params = {}
+        self._params_mtime = None
+        self._tables = OrderedDict()
+        # Bumped whenever items or parameters change, so a table built from
+        # an older snapshot is not cached.
+        self._version = 0
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        bank = question_bank()
+        labels = {}
+        for row in range(len(bank)):
+            qid, difficulty, topic = _bank_entry(bank, row)
+            self._rows[qid] = row
+            # Few distinct labels: share one tuple per (difficulty, topic).
+            key = ((difficulty or "medium").lower(), topic.lower())
+            self._meta[qid] = labels.setdefault(key, key + ("",))
+        try:
+            with open(self.bank_path, encoding="utf-8") as fh:
+                lines = deque((line for line in fh if line.strip()), maxlen=MAX_BANK_ITEMS)
+            for line in lines:
+                self._remember(json.loads(line))
+        except (OSError, ValueError):
+            pass
+        self._loaded = True
+
+    def _remember(self, item: dict) -> None:
+        self._items[item["id"]] = item
+        self._meta[item["id"]] = (
+            (item.get("difficulty") or "medium").lower(),
+            (item.get("topic") or "").lower(),
+            item.get("bank_topic") or "",
+        )
+
+    def _matching(self, metas: list, texts: dict, topic: str) -> list:
+        """
+        Light {"id", "difficulty"} items among metas [(id, meta)] that match
+        topic; texts holds the question text of generated items, store
+        questions are read from the mapped bank. Needs no lock.
+        """
+        bank = question_bank()
+        items = []
+        for qid, (difficulty, item_topic, bank_topic) in metas:
+            if topic and bank_topic != topic and topic not in item_topic:
+                text = texts[qid] if qid in texts else _bank_text(bank, self._rows[qid])
+                if topic not in (text or "").lower():
+                    continue
+            items.append({"id": qid, "difficulty": difficulty})
+        return items
+
+    def _evict(self) -> None:
+        """Drop the oldest generated items down to 90% of MAX_BANK_ITEMS; lock held."""
+        while len(self._items) > MAX_BANK_ITEMS * 9 // 10:
+            qid, _ = self._items.popitem(last=False)
+            del self._meta[qid]
+        self._tables.clear()
+        tmp = f"{self.bank_path}.tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as fh:
+                for item in self._items.values():
+                    fh.write(json.dumps(item, separators=(",", ":")) + "\n")
+            os.replace(tmp, self.bank_path)
+        except OSError:
+            pass
+
+    def _refresh_params(self) -> None:
+        try:
+            mtime = os.path.getmtime(self.params_path)
+        except OSError:
+            return
+        if mtime == self._params_mtime:
+            return
+        try:
+            with open(self.params_path, encoding="utf-8") as fh:
+                self._params = json.load(fh).get("items", {})
+        except (OSError, ValueError):
+            self._params = {}
+        self._params_mtime = mtime
+        self._tables.clear()
+        self._version += 1
+
+    def get(self, qid: str) -> dict:
+        with self._lock:
+            self._ensure_loaded()
+            item = self._items.get(qid)
+            row = self._rows.get(qid)
+        if item is not None or row is None:
+            return item
+        question = to_skills_question(question_bank()[row], row + 1)
+        question["id"] = qid
+        return question
+
+    def add(self, questions: list, topic: str = "") -> int:
+        """
+        Record generated MCQs with an answer key; topic is the technology
+        they were generated for. Returns how many were new. Cached tables
+        get the new items merged in, outside the lock.
+        """
+        new = []
+        updates = []
+        with self._lock:
+            self._ensure_loaded()
+            for q in questions:
+                if not q.get("question") or "correct_option_index" not in q:
+                    continue
+                item = {key: value for key, value in q.items() if key != "explanation"}
+                item["id"] = item_id(q)
+                if topic:
+                    item["bank_topic"] = topic.lower()
+                if item["id"] not in self._meta:
+                    self._remember(item)
+                    new.append(item)
+            if not new:
+                return 0
+            self._version += 1
+            try:
+                os.makedirs(os.path.dirname(self.bank_path), exist_ok=True)
+                with open(self.bank_path, "a", encoding="utf-8") as fh:
+                    for item in new:
+                        fh.write(json.dumps(item, separators=(",", ":")) + "\n")
+            except OSError:
+                pass
+            if len(self._items) > MAX_BANK_ITEMS:
+                self._evict()
+            else:
+                metas = [(item["id"], self._meta[item["id"]]) for item in new]
+                texts = {item["id"]: item.get("question") for item in new}
+                for key, table in self._tables.items():
+                    matched = self._matching(metas, texts, key)
+                    if matched:
+                        updates.append((key, table, matched))
+            params = self._params
+
+        for key, table, matched in updates:
+            extended = table.extended(matched, params)
+            with self._lock:
+                current = self._tables.get(key)
+                if current is table:
+                    self._tables[key] = extended
+                elif current is not None:
+                    # Replaced meanwhile by another add(): rebuild on next use.
+                    del self._tables[key]
+        return len(new)
+
+    def table(self, topic: str = "") -> ItemTable:
+        """
+        Cached ItemTable for the items matching topic (LRU, MAX_TABLES
+        topics). A missing table is built outside the lock, so other
+        assessments keep answering meanwhile.
+        """
+        key = (topic or "").lower()
+        with self._lock:
+            self._ensure_loaded()
+            self._refresh_params()
+            table = self._tables.get(key)
+            if table is not None:
+                self._tables.move_to_end(key)
+                return table
+            version = self._version
+            params = self._params
+            metas = list(self._meta.items())
+            texts = {qid: item.get("question") for qid, item in self._items.items()}
+
+        table = ItemTable(self._matching(metas, texts, key), params)
+        with self._lock:
+            if self._version == version:
+                self._tables[key] = table
+                while len(self._tables) > MAX_TABLES:
+                    self._tables.popitem(last=False)
+        return table
+
+
+bank = ItemBank()
+_attempts = RotatingJSONLWriter(ATTEMPTS_DIR, 10 * 1024 * 1024, 50, prefix="attempts")
+
+
+def record_attempt(assessment_id: str, qid: str, correct: bool) -> None:
+    """Append one response for offline parameter estimation; never raises."""
+    try:
+        _attempts.write({"ts": time.time(), "assessment": assessment_id, "item": qid, "correct": bool(correct)})
+    except OSError:
+        pass
+
+
+def public_question(question: dict) -> dict:
+    """Question as sent to the client (no answer key)."""
+    hidden = ("correct_option_index", "explanation", "bank_topic")
+    return {key: value for key, value in question.items() if key not in hidden}
@@ -1,6 +1,6 @@
 from flask import Blueprint, render_template, request, jsonify
-from .data import QUESTIONS
-from .services import filter_questions
+from .services import filter_questions, grade_answers
+from .store import question_bank
 
 quiz_bp = Blueprint("quiz", __name__, template_folder="../templates/quiz")
 
@@ -17,7 +17,7 @@ def start_quiz():
     difficulty = request.form.get("difficulty")
     num_q = int(request.form.get("numQuestions", 10))
 
-    selected = filter_questions(QUESTIONS, company, tech, difficulty, num_q)
+    selected = filter_questions(question_bank(), company, tech, difficulty, num_q)
 
     if mode == "quiz":
         return render_template("quiz/session.html", questions=selected, mode="quiz")
@@ -30,23 +30,4 @@ def submit_quiz():
     answers = data.get("answers", [])
     questions = data.get("questions", [])
 
-    score = 0
-    detailed = []
-    for q, ans_index in zip(questions, answers):
-        correct = q["correct_option"]
-        is_correct = (ans_index == correct)
-        if is_correct:
-            score += 1
-        detailed.append({
-            "question_text": q["question_text"],
-            "your_answer": q["options"][ans_index] if ans_index is not None else None,
-            "correct_answer": q["options"][correct],
-            "is_correct": is_correct,
-            "explanation": q.get("explanation")
-        })
-
-    return jsonify({
-        "score": score,
-        "total": len(questions),
-        "details": detailed
-    })
+    return jsonify(grade_answers(questions, answers))
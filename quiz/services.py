@@ -1,6 +1,11 @@
 import random
 
+from .store import QuestionStore
+
 def filter_questions(all_q, company, tech, difficulty, num_q):
+    if isinstance(all_q, QuestionStore):
+        return all_q.select(company, tech, difficulty, num_q)
+
     def match(q):
         if company and company not in q.get("company_tags", []):
             return False
@@ -13,3 +18,57 @@ def filter_questions(all_q, company, tech, difficulty, num_q):
     filtered = [q for q in all_q if match(q)]
     random.shuffle(filtered)
     return filtered[:num_q]
+
+
+def grade_answers(questions, answers):
+    """Score option indexes (positional) against quiz/data.py questions."""
+    score = 0
+    detailed = []
+    for q, ans_index in zip(questions, answers):
+        correct = q["correct_option"]
+        is_correct = (ans_index == correct)
+        if is_correct:
+            score += 1
+        detailed.append({
+            "question_text": q["question_text"],
+            "your_answer": q["options"][ans_index] if ans_index is not None else None,
+            "correct_answer": q["options"][correct],
+            "is_correct": is_correct,
+            "explanation": q.get("explanation")
+        })
+
+    return {
+        "score": score,
+        "total": len(questions),
+        "details": detailed
+    }
+
+
+def to_skills_question(q, idx):
+    """Convert a quiz/data.py question to the /api/generate_questions MCQ schema."""
+    return {
+        "id": f"q{idx}",
+        "question": q["question_text"],
+        "options": list(q["options"]),
+        "correct_option_index": q["correct_option"],
+        "explanation": q.get("explanation", ""),
+        "difficulty": (q.get("difficulty") or "medium").lower(),
+        "topic": (q.get("tech_tags") or ["General"])[0],
+        "company": (q.get("company_tags") or ["Any company"])[0],
+        "role": (q.get("role_tags") or ["Any role"])[0],
+    }
+
+
+def fallback_quiz_questions(all_q, company, tech, difficulty, num_q):
+    """
+    Pick local MCQs when Gemini is unavailable, relaxing filters until
+    something matches.
+    """
+    difficulty = (difficulty or "").capitalize()
+    if difficulty not in ("Easy", "Medium", "Hard"):
+        difficulty = None
+    for filters in ((company, tech, difficulty), (None, tech, difficulty), (None, None, None)):
+        selected = filter_questions(all_q, *filters, num_q)
+        if selected:
+            break
+    return [to_skills_question(q, idx) for idx, q in enumerate(selected, start=1)]
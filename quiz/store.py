@@ -0,0 +1,281 @@
+"""
+Compact, memory-mapped question bank.
+
+quiz/data.py is a list of dicts: every worker process holds its own copy,
+with per-dict overhead and the same tag strings repeated on every question.
+scripts/build_question_store.py writes the bank to one binary file instead:
+
+- a string heap: every distinct string once, UTF-8, indexed by an offsets
+  array (string id -> byte range)
+- per-question columns as typed arrays: id, correct option, difficulty,
+  round/question type (indexes into small interned dictionaries), question
+  and explanation (string ids), options (offsets + string ids)
+- for each tag kind (company, tech, role): the interned tag dictionary, the
+  tags of every question and a posting list of questions per tag, so
+  filtering never decodes a question
+
+The file is opened with mmap (read-only), so all workers share one
+page-cache copy and opening it parses nothing but a small header. Columns
+are memoryviews cast straight onto the mapping; a question dict is only
+built for the questions actually served.
+
+Layout: MAGIC, question count, section count, then a directory of
+(name, offset, length, typecode) entries; sections are 8-byte aligned and
+little-endian.
+"""
+import mmap
+import os
+import random
+import struct
+import sys
+import threading
+from array import array
+
+QUESTION_STORE_PATH = os.getenv(
+    "QUIZ_QUESTION_STORE",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "instance", "questions.qstore"),
+)
+
+MAGIC = b"QSTORE01"
+_HEADER = struct.Struct("<8sII")
+_ENTRY = struct.Struct("<32sQQc7x")
+TAG_KINDS = ("company", "tech", "role")
+_DICT_FIELDS = ("difficulty", "round_type", "question_type")
+
+
+class _Interner:
+    def __init__(self):
+        self.index = {}
+        self.values = []
+
+    def __call__(self, value: str) -> int:
+        idx = self.index.get(value)
+        if idx is None:
+            idx = self.index[value] = len(self.values)
+            self.values.append(value)
+        return idx
+
+
+def _pad(size: int) -> int:
+    return (8 - size % 8) % 8
+
+
+def build_store(questions, path: str) -> int:
+    """Write quiz/data.py-style questions to a store file; returns its size in bytes."""
+    if sys.byteorder != "little":
+        raise ValueError("Question stores are little-endian only.")
+    strings = _Interner()
+    dicts = {field: _Interner() for field in _DICT_FIELDS}
+    tags = {kind: _Interner() for kind in TAG_KINDS}
+    tag_dicts = {kind: array("I") for kind in TAG_KINDS}
+    cols = {
+        "ids": array("q"),
+        "correct": array("B"),
+        "question": array("I"),
+        "explanation": array("I"),
+        "opt_start": array("I", [0]),
+        "options": array("I"),
+    }
+    for field in _DICT_FIELDS:
+        cols[field] = array("H")
+    tag_cols = {kind: (array("I", [0]), array("H")) for kind in TAG_KINDS}
+    postings = {kind: [] for kind in TAG_KINDS}
+
+    for row, q in enumerate(questions):
+        cols["ids"].append(int(q.get("id", row + 1)))
+        cols["correct"].append(int(q["correct_option"]))
+        cols["question"].append(strings(q["question_text"]))
+        cols["explanation"].append(strings(q.get("explanation") or ""))
+        cols["options"].extend(strings(option) for option in q["options"])
+        cols["opt_start"].append(len(cols["options"]))
+        for field in _DICT_FIELDS:
+            cols[field].append(dicts[field](q.get(field) or ""))
+        for kind in TAG_KINDS:
+            starts, values = tag_cols[kind]
+            for tag in q.get(f"{kind}_tags") or []:
+                idx = tags[kind](tag)
+                if idx == len(postings[kind]):
+                    postings[kind].append([])
+                    tag_dicts[kind].append(strings(tag))
+                values.append(idx)
+                postings[kind][idx].append(row)
+            starts.append(len(values))
+
+    sections = [(name, col) for name, col in cols.items()]
+    for field in _DICT_FIELDS:
+        sections.append((f"dict.{field}", array("I", (strings(value) for value in dicts[field].values))))
+    for kind in TAG_KINDS:
+        starts, values = tag_cols[kind]
+        post_start, post_rows = array("I", [0]), array("I")
+        for rows in postings[kind]:
+            post_rows.extend(rows)
+            post_start.append(len(post_rows))
+        sections += [
+            (f"tags.{kind}", tag_dicts[kind]),
+            (f"qtag_start.{kind}", starts),
+            (f"qtag.{kind}", values),
+            (f"post_start.{kind}", post_start),
+            (f"post.{kind}", post_rows),
+        ]
+    encoded = [value.encode("utf-8") for value in strings.values]
+    str_start = array("I", [0])
+    for raw in encoded:
+        str_start.append(str_start[-1] + len(raw))
+    sections += [("str_start", str_start), ("heap", array("B", b"".join(encoded)))]
+
+    header_size = _HEADER.size + _ENTRY.size * len(sections)
+    offset = header_size + _pad(header_size)
+    directory = []
+    for name, col in sections:
+        length = len(col) * col.itemsize
+        directory.append(_ENTRY.pack(name.encode("ascii"), offset, length, col.typecode.encode("ascii")))
+        offset += length + _pad(length)
+
+    tmp = f"{path}.tmp"
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(tmp, "wb") as fh:
+        fh.write(_HEADER.pack(MAGIC, len(cols["ids"]), len(sections)))
+        fh.writelines(directory)
+        fh.write(b"\0" * _pad(header_size))
+        for _, col in sections:
+            data = col.tobytes()
+            fh.write(data)
+            fh.write(b"\0" * _pad(len(data)))
+    # Workers that already mapped the old file keep reading its inode.
+    os.replace(tmp, path)
+    return offset
+
+
+class QuestionStore:
+    """Read-only view of a store file; questions decode on access."""
+
+    def __init__(self, path: str = QUESTION_STORE_PATH):
+        if sys.byteorder != "little":
+            raise ValueError("Question stores are little-endian only.")
+        with open(path, "rb") as fh:
+            self._mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = view = memoryview(self._mm)
+        magic, count, n_sections = _HEADER.unpack_from(view)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a question store.")
+        self._count = count
+        self._sec = {}
+        for idx in range(n_sections):
+            name, offset, length, typecode = _ENTRY.unpack_from(view, _HEADER.size + idx * _ENTRY.size)
+            self._sec[name.rstrip(b"\0").decode("ascii")] = view[offset:offset + length].cast(typecode.decode("ascii"))
+        self._heap = self._sec["heap"]
+        self._str_start = self._sec["str_start"]
+        self._dicts = {field: [self.string(sid) for sid in self._sec[f"dict.{field}"]] for field in _DICT_FIELDS}
+        self._tag_index = {
+            kind: {self.string(sid): idx for idx, sid in enumerate(self._sec[f"tags.{kind}"])}
+            for kind in TAG_KINDS
+        }
+        self._tag_cols = {
+            kind: (self._sec[f"qtag_start.{kind}"], self._sec[f"qtag.{kind}"], self._sec[f"tags.{kind}"])
+            for kind in TAG_KINDS
+        }
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        return (self[row] for row in range(self._count))
+
+    def string(self, sid: int) -> str:
+        return str(self._heap[self._str_start[sid]:self._str_start[sid + 1]], "utf-8")
+
+    def tags(self, kind: str, row: int) -> list:
+        starts, values, tag_ids = self._tag_cols[kind]
+        return [self.string(tag_ids[idx]) for idx in values[starts[row]:starts[row + 1]]]
+
+    # Single fields of a row, for callers that index the bank without
+    # decoding whole questions.
+
+    def question_id(self, row: int) -> int:
+        return self._sec["ids"][row]
+
+    def question_text(self, row: int) -> str:
+        return self.string(self._sec["question"][row])
+
+    def label(self, field: str, row: int) -> str:
+        """difficulty, round_type or question_type of row."""
+        return self._dicts[field][self._sec[field][row]]
+
+    def __getitem__(self, row: int) -> dict:
+        """Question `row` in the quiz/data.py schema."""
+        if not 0 <= row < self._count:
+            raise IndexError(row)
+        sec = self._sec
+        start, end = sec["opt_start"][row], sec["opt_start"][row + 1]
+        question = {
+            "id": sec["ids"][row],
+            "question_text": self.string(sec["question"][row]),
+            "options": [self.string(sid) for sid in sec["options"][start:end]],
+            "correct_option": sec["correct"][row],
+            "explanation": self.string(sec["explanation"][row]),
+        }
+        for kind in TAG_KINDS:
+            question[f"{kind}_tags"] = self.tags(kind, row)
+        for field in _DICT_FIELDS:
+            question[field] = self._dicts[field][sec[field][row]]
+        return question
+
+    def _posting(self, kind: str, tag: str):
+        idx = self._tag_index[kind].get(tag)
+        if idx is None:
+            return []
+        start, end = self._sec[f"post_start.{kind}"][idx:idx + 2]
+        return self._sec[f"post.{kind}"][start:end]
+
+    def matching(self, company=None, tech=None, difficulty=None) -> list:
+        """Rows matching the filters (same semantics as quiz.services.filter_questions)."""
+        rows = None
+        for kind, tag in (("company", company), ("tech", tech)):
+            if tag:
+                posting = self._posting(kind, tag)
+                rows = set(posting) if rows is None else rows.intersection(posting)
+        rows = range(self._count) if rows is None else sorted(rows)
+        if difficulty:
+            values = self._dicts["difficulty"]
+            if difficulty not in values:
+                return []
+            code, column = values.index(difficulty), self._sec["difficulty"]
+            rows = [row for row in rows if column[row] == code]
+        return list(rows)
+
+    def select(self, company, tech, difficulty, num_q: int) -> list:
+        """Up to num_q random matching questions, decoding only those."""
+        rows = self.matching(company, tech, difficulty)
+        return [self[row] for row in random.sample(rows, min(num_q, len(rows)))]
+
+    def close(self) -> None:
+        for section in self._sec.values():
+            section.release()
+        self._sec.clear()
+        self._tag_cols.clear()
+        self._heap = self._str_start = None
+        self._view.release()
+        self._mm.close()
+
+
+_bank = None
+_bank_lock = threading.Lock()
+
+
+def question_bank():
+    """
+    The MCQ bank, opened once per process: the mapped store when it has
+    been built, otherwise the quiz/data.py list (imported only in that case).
+    """
+    global _bank  # pylint: disable=global-statement
+    with _bank_lock:
+        if _bank is None:
+            if os.path.exists(QUESTION_STORE_PATH):
+                try:
+                    _bank = QuestionStore(QUESTION_STORE_PATH)
+                except (OSError, ValueError, KeyError):
+                    pass
+            if _bank is None:
+                from .data import QUESTIONS  # pylint: disable=import-outside-toplevel
+                _bank = QUESTIONS
+        return _bank
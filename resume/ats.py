@@ -0,0 +1,53 @@
+"""
+Local ATS keyword coverage.
+
+Scores how many of a job description's keywords appear in a rendered
+resume, without calling Gemini, so every tailored variant can be compared.
+"""
+import re
+from collections import Counter
+
+_TOKEN_RE = re.compile(r"[a-z][a-z0-9+#./-]*[a-z0-9+#]|[a-z]")
+
+STOPWORDS = {
+    "a", "about", "across", "all", "an", "and", "any", "are", "as", "at", "be",
+    "been", "both", "but", "by", "can", "candidate", "candidates", "do", "etc",
+    "experience", "for", "from", "good", "have", "having", "help", "in", "into",
+    "is", "it", "its", "job", "join", "knowledge", "looking", "may", "more",
+    "must", "new", "of", "on", "or", "our", "per", "plus", "preferred", "role",
+    "should", "strong", "such", "team", "that", "the", "their", "this", "to",
+    "understanding", "up", "using", "we", "well", "what", "who", "will", "with",
+    "work", "working", "years", "you", "your",
+}
+
+
+def _tokens(text: str) -> list:
+    return [
+        token.strip(".-/")
+        for token in _TOKEN_RE.findall((text or "").lower())
+        if token.strip(".-/") and token.strip(".-/") not in STOPWORDS
+    ]
+
+
+def ats_keywords(job_description: str, limit: int = 30) -> list:
+    """Most frequent non-stopword terms of the JD, in first-seen order on ties."""
+    counts = Counter(token for token in _tokens(job_description) if len(token) > 1)
+    return [token for token, _ in counts.most_common(limit)]
+
+
+def ats_coverage(resume_text: str, job_description: str) -> dict:
+    """
+    {"score": 0-100, "matched": [...], "missing": [...]} for the JD keywords
+    found in the resume text.
+    """
+    keywords = ats_keywords(job_description)
+    if not keywords:
+        return {"score": 0, "matched": [], "missing": []}
+    present = set(_tokens(resume_text))
+    matched = [kw for kw in keywords if kw in present]
+    missing = [kw for kw in keywords if kw not in present]
+    return {
+        "score": round(100 * len(matched) / len(keywords)),
+        "matched": matched,
+        "missing": missing,
+    }
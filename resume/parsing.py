@@ -0,0 +1,418 @@
+"""
+Local parsing of uploaded resumes (PDF, DOCX and TXT).
+
+Werkzeug already spools uploads (small files in memory, large ones on
+disk), so the upload's own stream is parsed in place once its size is
+checked against the cap; only a stream that cannot seek is copied, in
+fixed-size chunks, into a spooled temporary file. Text is extracted locally
+and split into sections with simple heading rules, which gives the
+extraction prompt a compact structure instead of raw bytes. When the
+sections cover too little of the text (unrecognized headings leave their
+lines in the header), the upload is flagged as sparse and the caller sends
+the raw text instead.
+"""
+import os
+import re
+import tempfile
+
+MAX_UPLOAD_BYTES = int(os.getenv("RESUME_MAX_UPLOAD_BYTES", str(5 * 1024 * 1024)))
+SPOOL_MEMORY_BYTES = 256 * 1024
+CHUNK_SIZE = 64 * 1024
+MAX_PDF_PAGES = 10
+MAX_TEXT_CHARS = 20000
+# Below this share of the text's characters in parsed fields, a parse is sparse.
+MIN_SECTION_COVERAGE = 0.6
+
+ALLOWED_EXTENSIONS = (".pdf", ".docx", ".txt")
+
+SECTION_ALIASES = {
+    "summary": (
+        "summary", "professional summary", "profile", "objective",
+        "career objective", "about me", "about",
+    ),
+    "education": (
+        "education", "academic background", "academics", "qualifications",
+        "educational qualifications", "academic qualifications",
+    ),
+    "experience": (
+        "experience", "work experience", "professional experience",
+        "employment", "employment history", "work history", "internships",
+        "internship", "internship experience",
+    ),
+    "projects": (
+        "projects", "academic projects", "personal projects", "key projects",
+    ),
+    "skills": (
+        "skills", "technical skills", "key skills", "core competencies",
+        "skills & tools", "skills and tools", "technologies",
+    ),
+    "achievements": (
+        "achievements", "awards", "certifications", "accomplishments",
+        "awards & achievements", "honors",
+    ),
+}
+_HEADING_LOOKUP = {
+    alias: section for section, aliases in SECTION_ALIASES.items() for alias in aliases
+}
+
+_BULLET_RE = re.compile(r"^\s*(?:[-*•▪●‣–>]|\d+[.)])\s+")
+_EMAIL_RE = re.compile(r"[\w.+-]+@[\w-]+\.[\w.-]+")
+_PHONE_RE = re.compile(r"\+?\d[\d\s().-]{7,}\d")
+_URL_RE = re.compile(r"(?:https?://)?(?:www\.)?[\w-]+\.[a-z]{2,}(?:/[\w./%-]*)?", re.I)
+_YEAR_RE = re.compile(r"\b(?:19|20)\d{2}\b|\bpresent\b|\bcurrent\b", re.I)
+_DATE_RANGE_RE = re.compile(
+    r"((?:[A-Za-z]{3,9}\.?\s+)?(?:19|20)\d{2})\s*(?:-|–|to)\s*"
+    r"((?:[A-Za-z]{3,9}\.?\s+)?(?:19|20)\d{2}|present|current)",
+    re.I,
+)
+_SKILL_SPLIT_RE = re.compile(r"[,;|•\n]+")
+
+
+class UploadError(ValueError):
+    """Raised when an uploaded resume is too large or cannot be read."""
+
+
+def spool_upload(file_storage, max_bytes: int = MAX_UPLOAD_BYTES):
+    """
+    Copy an upload into a SpooledTemporaryFile, enforcing the size cap.
+    The caller owns the returned file and must close it.
+    """
+    spooled = tempfile.SpooledTemporaryFile(max_size=SPOOL_MEMORY_BYTES)
+    total = 0
+    try:
+        while True:
+            chunk = file_storage.stream.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            total += len(chunk)
+            if total > max_bytes:
+                raise UploadError(
+                    f"Resume upload is larger than {max_bytes / (1024 * 1024):.1f} MB."
+                )
+            spooled.write(chunk)
+    except Exception:
+        spooled.close()
+        raise
+    spooled.seek(0)
+    return spooled
+
+
+def _upload_stream(file_storage, max_bytes: int):
+    """
+    (stream, owned): the upload's own stream when it can seek, else a
+    spooled copy that the caller must close. Enforces the size cap.
+    """
+    stream = file_storage.stream
+    try:
+        stream.seek(0, os.SEEK_END)
+        size = stream.tell()
+        stream.seek(0)
+    except (AttributeError, OSError, ValueError):
+        return spool_upload(file_storage, max_bytes=max_bytes), True
+    if size > max_bytes:
+        raise UploadError(
+            f"Resume upload is larger than {max_bytes / (1024 * 1024):.1f} MB."
+        )
+    return stream, False
+
+
+def _detect_kind(stream, filename: str) -> str:
+    """Pick a parser from the extension, falling back to magic bytes."""
+    ext = os.path.splitext(filename or "")[1].lower()
+    if ext in ALLOWED_EXTENSIONS:
+        return ext.lstrip(".")
+    head = stream.read(8)
+    stream.seek(0)
+    if head.startswith(b"%PDF"):
+        return "pdf"
+    if head.startswith(b"PK\x03\x04"):
+        return "docx"
+    return "txt"
+
+
+def _extract_pdf(stream) -> str:
+    try:
+        from pypdf import PdfReader
+    except ImportError as exc:
+        raise UploadError("PDF uploads need the 'pypdf' package installed.") from exc
+
+    try:
+        reader = PdfReader(stream)
+        pages = []
+        for page in reader.pages[:MAX_PDF_PAGES]:
+            pages.append(page.extract_text() or "")
+    except Exception as exc:  # pylint: disable=broad-except
+        raise UploadError(f"Could not read PDF resume: {exc}") from exc
+    return "\n".join(pages)
+
+
+def _extract_docx(stream) -> str:
+    try:
+        from docx import Document
+    except ImportError as exc:
+        raise UploadError("DOCX uploads need the 'python-docx' package installed.") from exc
+
+    try:
+        document = Document(stream)
+    except Exception as exc:  # pylint: disable=broad-except
+        raise UploadError(f"Could not read DOCX resume: {exc}") from exc
+
+    lines = [p.text for p in document.paragraphs]
+    for table in document.tables:
+        for row in table.rows:
+            cells = [cell.text.strip() for cell in row.cells if cell.text.strip()]
+            if cells:
+                lines.append(" | ".join(cells))
+    return "\n".join(lines)
+
+
+def _extract_txt(stream) -> str:
+    return stream.read(MAX_TEXT_CHARS * 4).decode("utf-8", errors="ignore")
+
+
+def extract_text(stream, filename: str) -> str:
+    """Return normalized plain text for a PDF, DOCX or TXT stream."""
+    kind = _detect_kind(stream, filename)
+    if kind == "pdf":
+        text = _extract_pdf(stream)
+    elif kind == "docx":
+        text = _extract_docx(stream)
+    else:
+        text = _extract_txt(stream)
+
+    lines = [re.sub(r"[ \t ]+", " ", line).strip() for line in text.splitlines()]
+    cleaned = "\n".join(lines)
+    cleaned = re.sub(r"\n{3,}", "\n\n", cleaned).strip()
+    return cleaned[:MAX_TEXT_CHARS]
+
+
+def _heading_for(line: str):
+    """Return the section name if the line looks like a section heading."""
+    candidate = line.strip().rstrip(":").strip().lower()
+    if not candidate or len(candidate) > 40:
+        return None
+    return _HEADING_LOOKUP.get(candidate)
+
+
+def _split_entries(lines: list) -> list:
+    """Group lines into entries: a heading line followed by its bullets."""
+    entries = []
+    current = None
+    for line in lines:
+        if _BULLET_RE.match(line):
+            bullet = _BULLET_RE.sub("", line).strip()
+            if current is None:
+                current = {"heading": "", "bullets": []}
+                entries.append(current)
+            current["bullets"].append(bullet)
+        elif current is not None and not current["bullets"] and len(current["heading"]) < 120:
+            # Multi-line headings such as "Title\nCompany | 2021 - 2023".
+            current["heading"] = f"{current['heading']} | {line}".strip(" |")
+        else:
+            current = {"heading": line, "bullets": []}
+            entries.append(current)
+    return entries
+
+
+def parse_sections(text: str) -> dict:
+    """
+    Split resume text into header fields and known sections.
+    Unknown headings keep lines in the previous section.
+    """
+    header_lines = []
+    sections = {name: [] for name in SECTION_ALIASES}
+    current = None
+
+    for raw_line in (text or "").splitlines():
+        line = raw_line.strip()
+        if not line:
+            continue
+        section = _heading_for(line)
+        if section:
+            current = section
+            continue
+        if current is None:
+            header_lines.append(line)
+        else:
+            sections[current].append(line)
+
+    header_text = "\n".join(header_lines)
+    emails = _EMAIL_RE.findall(header_text)
+    phones = _PHONE_RE.findall(header_text)
+    urls = [u for u in _URL_RE.findall(_EMAIL_RE.sub(" ", header_text)) if not u[0].isdigit()]
+
+    links = {"linkedin": "", "portfolio": ""}
+    for url in urls:
+        if "linkedin" in url.lower():
+            links["linkedin"] = links["linkedin"] or url
+        else:
+            links["portfolio"] = links["portfolio"] or url
+
+    name = ""
+    headline = ""
+    for line in header_lines:
+        if _EMAIL_RE.search(line) or _PHONE_RE.search(line) or _URL_RE.fullmatch(line):
+            continue
+        if not name:
+            name = line
+        elif not headline:
+            headline = line
+            break
+
+    skills = []
+    for line in sections["skills"]:
+        line = _BULLET_RE.sub("", line)
+        if ":" in line:
+            line = line.split(":", 1)[1]
+        for skill in _SKILL_SPLIT_RE.split(line):
+            skill = skill.strip(" .")
+            if skill and skill.lower() not in {s.lower() for s in skills}:
+                skills.append(skill)
+
+    return {
+        "name": name,
+        "headline": headline,
+        "contact": " | ".join(dict.fromkeys(emails[:1] + [p.strip() for p in phones[:1]])),
+        "links": links,
+        "summary": " ".join(sections["summary"]),
+        "education": [_BULLET_RE.sub("", line) for line in sections["education"]],
+        "experience": _split_entries(sections["experience"]),
+        "projects": _split_entries(sections["projects"]),
+        "skills": skills,
+        "achievements": [_BULLET_RE.sub("", line) for line in sections["achievements"]],
+    }
+
+
+def is_well_formed(parsed: dict) -> bool:
+    """True when the deterministic parse is complete enough to skip Gemini."""
+    if not parsed:
+        return False
+    has_history = bool(parsed.get("experience") or parsed.get("projects"))
+    return bool(
+        parsed.get("name")
+        and parsed.get("contact")
+        and parsed.get("education")
+        and parsed.get("skills")
+        and has_history
+    )
+
+
+def _text_chars(value) -> int:
+    if isinstance(value, str):
+        return len(value)
+    if isinstance(value, dict):
+        return sum(_text_chars(item) for item in value.values())
+    if isinstance(value, list):
+        return sum(_text_chars(item) for item in value)
+    return 0
+
+
+def is_sparse(parsed: dict, text: str) -> bool:
+    """True when the parsed fields hold too little of the text to stand in for it."""
+    total = len((text or "").replace("\n", ""))
+    if not total:
+        return False
+    return _text_chars(parsed) < MIN_SECTION_COVERAGE * total
+
+
+def _split_dates(text: str):
+    """Return (text_without_dates, start, end) for the first date range found."""
+    match = _DATE_RANGE_RE.search(text)
+    if match:
+        remainder = (text[:match.start()] + text[match.end():]).strip(" |,-–()")
+        return remainder, match.group(1).strip(), match.group(2).strip()
+    years = _YEAR_RE.findall(text)
+    if years:
+        remainder = _YEAR_RE.sub("", text).strip(" |,-–()")
+        return remainder, years[0], years[-1] if len(years) > 1 else ""
+    return text, "", ""
+
+
+def _split_title_company(heading: str, separators=(" at ", " @ ", " | ", ", ", " - ", " – ")):
+    for sep in separators:
+        if sep in heading:
+            left, right = heading.split(sep, 1)
+            return left.strip(), right.strip(" |,")
+    return heading.strip(), ""
+
+
+def profile_from_sections(parsed: dict) -> dict:
+    """
+    Map a parsed resume onto the profile schema used by the resume pipeline.
+    """
+    education = []
+    for line in parsed.get("education", []):
+        rest, start, end = _split_dates(line)
+        parts = [p.strip() for p in re.split(r",|\||–| - ", rest) if p.strip()]
+        education.append({
+            "degree": parts[0] if parts else rest,
+            "institution": parts[1] if len(parts) > 1 else "",
+            "start_year": start,
+            "end_year": end,
+            "details": ", ".join(parts[2:]),
+        })
+
+    experience = []
+    for entry in parsed.get("experience", []):
+        rest, start, end = _split_dates(entry.get("heading", ""))
+        title, company = _split_title_company(rest)
+        location = ""
+        if " | " in company:
+            company, location = [p.strip() for p in company.split(" | ", 1)]
+        experience.append({
+            "title": title,
+            "company": company,
+            "location": location,
+            "start_date": start,
+            "end_date": end,
+            "bullets": entry.get("bullets", []),
+        })
+
+    projects = []
+    for entry in parsed.get("projects", []):
+        heading = entry.get("heading", "")
+        name, tech = _split_title_company(heading, (" - ", " – ", " | ", ": "))
+        projects.append({
+            "name": name,
+            "tech_stack": [t.strip() for t in _SKILL_SPLIT_RE.split(tech) if t.strip()],
+            "bullets": entry.get("bullets", []),
+        })
+
+    return {
+        "name": parsed.get("name", ""),
+        "headline": parsed.get("headline", ""),
+        "contact": parsed.get("contact", ""),
+        "location": "",
+        "links": dict(parsed.get("links") or {"linkedin": "", "portfolio": ""}),
+        "education": education,
+        "experience": experience,
+        "projects": projects,
+        "skills": list(parsed.get("skills", [])),
+        "achievements": list(parsed.get("achievements", [])),
+    }
+
+
+def read_resume_upload(file_storage, max_bytes: int = MAX_UPLOAD_BYTES) -> dict:
+    """
+    Size-check, extract and parse an uploaded resume.
+    Returns {"text": ..., "sections": ..., "well_formed": bool, "sparse": bool}.
+    """
+    filename = file_storage.filename or ""
+    ext = os.path.splitext(filename)[1].lower()
+    if ext and ext not in ALLOWED_EXTENSIONS:
+        raise UploadError("Upload a PDF, DOCX or TXT resume.")
+
+    stream, owned = _upload_stream(file_storage, max_bytes)
+    try:
+        text = extract_text(stream, filename)
+    finally:
+        if owned:
+            stream.close()
+
+    sections = parse_sections(text)
+    return {
+        "text": text,
+        "sections": sections,
+        "well_formed": is_well_formed(sections),
+        "sparse": is_sparse(sections, text),
+    }
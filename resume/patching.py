@@ -0,0 +1,76 @@
+"""
+Line-anchored edit operations for resume polishing.
+
+Instead of regenerating the whole resume, the model returns a short list of
+{"line": n, "find": "...", "replace": "..."} operations against a numbered
+copy of the text. Each operation is checked against the original line before
+it is applied; any mismatch rejects the whole patch so the caller can fall
+back to a full rewrite.
+"""
+import json
+import re
+
+# Reject patches that would rewrite more than this share of the characters:
+# at that point a full rewrite is the honest result.
+MAX_CHANGED_RATIO = 0.5
+
+
+class PatchError(ValueError):
+    """Raised when a list of edit operations does not apply cleanly."""
+
+
+def number_lines(text: str) -> str:
+    """Prefix each line with its 1-based number ("12| ...") for the prompt."""
+    return "\n".join(f"{idx}| {line}" for idx, line in enumerate(text.split("\n"), start=1))
+
+
+def parse_edits(raw: str) -> list:
+    """Parse the model's JSON edit list, tolerating Markdown fences."""
+    cleaned = re.sub(r"```(?:json)?", "", raw or "").strip() or "[]"
+    try:
+        edits = json.loads(cleaned)
+    except json.JSONDecodeError as exc:
+        raise PatchError(f"Edit list is not valid JSON: {exc}") from exc
+    if isinstance(edits, dict):
+        edits = edits.get("edits", [])
+    if not isinstance(edits, list):
+        raise PatchError("Edit list must be a JSON array.")
+
+    parsed = []
+    for edit in edits:
+        if not isinstance(edit, dict):
+            raise PatchError("Each edit must be an object.")
+        try:
+            line = int(edit["line"])
+            find = str(edit["find"])
+            replace = str(edit.get("replace", ""))
+        except (KeyError, TypeError, ValueError) as exc:
+            raise PatchError(f"Malformed edit: {edit!r}") from exc
+        if not find:
+            raise PatchError(f"Edit for line {line} has an empty 'find'.")
+        if "\n" in replace:
+            raise PatchError(f"Edit for line {line} would split the line.")
+        parsed.append({"line": line, "find": find, "replace": replace})
+    return parsed
+
+
+def apply_line_edits(text: str, edits: list) -> str:
+    """
+    Apply edits to text. Every 'find' must occur in its anchored line (after
+    earlier edits to the same line). Raises PatchError otherwise. Lines are
+    split on "\n" only, so empty lines (even trailing ones) keep their place.
+    """
+    lines = text.split("\n")
+    changed = 0
+    for edit in edits:
+        idx = edit["line"] - 1
+        if not 0 <= idx < len(lines):
+            raise PatchError(f"Edit refers to line {edit['line']} of {len(lines)}.")
+        if edit["find"] not in lines[idx]:
+            raise PatchError(f"Line {edit['line']} does not contain {edit['find']!r}.")
+        lines[idx] = lines[idx].replace(edit["find"], edit["replace"], 1)
+        changed += max(len(edit["find"]), len(edit["replace"]))
+
+    if text and changed / len(text) > MAX_CHANGED_RATIO:
+        raise PatchError("Patch rewrites too much of the resume.")
+    return "\n".join(lines)
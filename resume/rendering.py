@@ -0,0 +1,178 @@
+"""
+Deterministic resume rendering.
+
+Turns the structured profile JSON into plain text or HTML in any of the
+classic / modern / minimal styles without calling Gemini, so switching
+layouts is instant. Gemini only writes the summary and bullet text (see
+merge_generated_content).
+"""
+import copy
+
+from flask import render_template
+
+TEMPLATE_STYLES = ("classic", "modern", "minimal")
+
+_LIST_FIELDS = ("education", "experience", "projects", "skills", "achievements")
+
+
+def normalize_style(style: str) -> str:
+    style = (style or "").strip().lower()
+    return style if style in TEMPLATE_STYLES else "classic"
+
+
+def normalize_profile(profile: dict) -> dict:
+    """Copy of profile with every field the renderers and templates expect."""
+    data = copy.deepcopy(profile or {})
+    for field in ("name", "headline", "contact", "location", "summary"):
+        data[field] = (data.get(field) or "").strip()
+    links = data.get("links") if isinstance(data.get("links"), dict) else {}
+    data["links"] = {
+        "linkedin": links.get("linkedin") or "",
+        "portfolio": links.get("portfolio") or "",
+    }
+    for field in _LIST_FIELDS:
+        value = data.get(field) or []
+        data[field] = value if isinstance(value, list) else [value]
+    for item in data["experience"] + data["projects"]:
+        if isinstance(item, dict):
+            item["bullets"] = [b for b in (item.get("bullets") or []) if b]
+    for item in data["projects"]:
+        if isinstance(item, dict) and not isinstance(item.get("tech_stack"), list):
+            item["tech_stack"] = [item["tech_stack"]] if item.get("tech_stack") else []
+    data["experience"] = [e for e in data["experience"] if isinstance(e, dict)]
+    data["projects"] = [p for p in data["projects"] if isinstance(p, dict)]
+    data["education"] = [
+        e if isinstance(e, dict) else {"degree": str(e)} for e in data["education"]
+    ]
+    return data
+
+
+def _join(parts, sep: str) -> str:
+    return sep.join(p.strip() for p in parts if p and p.strip())
+
+
+def _date_range(start, end) -> str:
+    return _join([start or "", end or ""], " - ")
+
+
+def _heading(title: str, style: str) -> list:
+    if style == "modern":
+        return [f"== {title} =="]
+    if style == "classic":
+        return [title, "-" * len(title)]
+    return [title]
+
+
+def render_text(profile: dict, style: str = "classic") -> str:
+    """Plain-text resume with ALL-CAPS section headings and '-' bullets."""
+    style = normalize_style(style)
+    data = normalize_profile(profile)
+    links = data["links"]
+
+    lines = [data["name"].upper() if style == "classic" else data["name"]]
+    if data["headline"]:
+        lines.append(data["headline"])
+    contact = _join(
+        [data["contact"], data["location"], links["linkedin"], links["portfolio"]], " | "
+    )
+    if contact:
+        lines.append(contact)
+
+    def section(title, body):
+        if body:
+            lines.append("")
+            lines.extend(_heading(title, style))
+            lines.extend(body)
+
+    section("SUMMARY", [data["summary"]] if data["summary"] else [])
+
+    skill_sep = " · " if style == "minimal" else ", "
+    section("SKILLS", [skill_sep.join(str(s) for s in data["skills"])] if data["skills"] else [])
+
+    body = []
+    for idx, exp in enumerate(data["experience"]):
+        if idx and style != "minimal":
+            body.append("")
+        title = _join([exp.get("title"), exp.get("company")], " — ")
+        where = exp.get("location") or ""
+        dates = _date_range(exp.get("start_date"), exp.get("end_date"))
+        body.append(_join([_join([title, where], ", "), dates], " | "))
+        body.extend(f"- {bullet}" for bullet in exp["bullets"])
+    section("EXPERIENCE", body)
+
+    body = []
+    for idx, proj in enumerate(data["projects"]):
+        if idx and style != "minimal":
+            body.append("")
+        stack = ", ".join(proj.get("tech_stack") or [])
+        body.append(f"{proj.get('name', '')} ({stack})" if stack else proj.get("name", ""))
+        body.extend(f"- {bullet}" for bullet in proj["bullets"])
+    section("PROJECTS", body)
+
+    body = []
+    for edu in data["education"]:
+        dates = _date_range(edu.get("start_year"), edu.get("end_year"))
+        head = _join([edu.get("degree"), edu.get("institution")], ", ")
+        body.append(f"{head} ({dates})" if dates else head)
+        if edu.get("details"):
+            body.append(f"  {edu['details']}")
+    section("EDUCATION", body)
+
+    section("ACHIEVEMENTS", [f"- {item}" for item in data["achievements"]])
+
+    return "\n".join(lines).strip()
+
+
+def render_html(profile: dict, style: str = "classic", print_layout: bool = False) -> str:
+    """HTML resume using templates/resume/<style>.html (needs an app context)."""
+    style = normalize_style(style)
+    return render_template(
+        f"resume/{style}.html",
+        profile=normalize_profile(profile),
+        print_layout=print_layout,
+    )
+
+
+def prose_lines(profile: dict) -> list:
+    """Summary and every bullet, one per line, in a fixed order."""
+    data = normalize_profile(profile)
+    lines = [" ".join(data["summary"].split())]
+    for item in data["experience"] + data["projects"]:
+        lines.extend(" ".join(str(b).split()) for b in item["bullets"])
+    return lines
+
+
+def with_prose_lines(profile: dict, lines: list) -> dict:
+    """Inverse of prose_lines; returns profile unchanged if counts differ."""
+    data = normalize_profile(profile)
+    if len(lines) != len(prose_lines(data)):
+        return data
+    data["summary"] = lines[0]
+    pos = 1
+    for item in data["experience"] + data["projects"]:
+        count = len(item["bullets"])
+        item["bullets"] = list(lines[pos:pos + count])
+        pos += count
+    return data
+
+
+def merge_generated_content(profile: dict, content: dict) -> dict:
+    """
+    Apply Gemini's {"summary", "experience": [[...]], "projects": [[...]]}
+    onto the profile. Bullet lists are only replaced when the entry counts
+    line up, so a malformed response never reorders or drops entries.
+    """
+    data = normalize_profile(profile)
+    if not isinstance(content, dict):
+        return data
+    summary = content.get("summary")
+    if isinstance(summary, str) and summary.strip():
+        data["summary"] = " ".join(summary.split())
+    for field in ("experience", "projects"):
+        rewritten = content.get(field)
+        if not isinstance(rewritten, list) or len(rewritten) != len(data[field]):
+            continue
+        for item, bullets in zip(data[field], rewritten):
+            if isinstance(bullets, list) and all(isinstance(b, str) for b in bullets) and bullets:
+                item["bullets"] = [b.strip() for b in bullets if b.strip()]
+    return data
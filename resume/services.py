@@ -2,6 +2,7 @@ import os
 import json
 import google.generativeai as genai
 from dotenv import load_dotenv
+from llm.routing import generate
 
 # Load .env file (so GEMINI_API_KEY is available)
 load_dotenv()
@@ -61,9 +62,7 @@ Requirements:
 Only output valid JSON.
 """
 
-    model = genai.GenerativeModel("models/gemini-2.0-flash")
-
-    response = model.generate_content(prompt)
+    response = generate("create", prompt)
 
     # Gemini puts text response here:
     text = response.text
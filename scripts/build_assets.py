@@ -0,0 +1,167 @@
+"""
+Static asset build: fingerprinted, precompressed bundles plus a manifest.
+
+    python scripts/build_assets.py                      # build interview/static/dist
+    python scripts/build_assets.py --extract home.html  # move inline <style>/<script> into static/
+
+Every .js/.css/.svg under interview/static is copied to
+dist/<dir>/<name>.<hash>.<ext> with .gz (and .br when the brotli package is
+installed) next to it, and dist/manifest.json maps the logical path
+("js/interview.js") to the fingerprinted one. Templates reference assets
+through asset_url() (web/assets.py), which reads that manifest.
+
+--extract rewrites a template in place: inline <style> blocks become
+css/pages/<page>.css and inline <script> blocks become js/pages/<page>.js,
+referenced through asset_url(). Blocks containing Jinja syntax are left
+inline because they need the render context.
+"""
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import re
+import shutil
+import sys
+import textwrap
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STATIC_DIR = os.path.join(ROOT, "interview", "static")
+TEMPLATE_DIR = os.path.join(ROOT, "interview", "templates")
+DIST_DIRNAME = "dist"
+MANIFEST_NAME = "manifest.json"
+ASSET_EXTENSIONS = {".js", ".css", ".svg"}
+HASH_LENGTH = 10
+
+_STYLE_RE = re.compile(r"(?P<indent>[ \t]*)<style>\r?\n(?P<body>.*?)[ \t]*</style>", re.S)
+_SCRIPT_RE = re.compile(r"(?P<indent>[ \t]*)<script>\r?\n(?P<body>.*?)[ \t]*</script>", re.S)
+_JINJA_RE = re.compile(r"{{|{%|{#")
+
+
+# ------------------ EXTRACT ------------------
+
+def _page_name(template: str) -> str:
+    stem = os.path.splitext(os.path.basename(template))[0]
+    return re.sub(r"[^a-z0-9]+", "-", stem.lower()).strip("-")
+
+
+def _collect(pattern, source: str) -> tuple:
+    """Dedented bodies and (start, end, indent) spans of the inline blocks without Jinja."""
+    bodies = []
+    spans = []
+    for match in pattern.finditer(source):
+        if _JINJA_RE.search(match.group("body")):
+            continue
+        bodies.append(textwrap.dedent(match.group("body").replace("\r\n", "\n")).strip("\n"))
+        spans.append((match.start(), match.end(), match.group("indent")))
+    return bodies, spans
+
+
+def extract_inline(template: str, static_dir: str = STATIC_DIR, template_dir: str = TEMPLATE_DIR) -> list:
+    """Move inline styles/scripts of one template into static files; returns the files written."""
+    path = os.path.join(template_dir, template)
+    with open(path, encoding="utf-8", newline="") as fh:
+        source = fh.read()
+    newline = "\r\n" if "\r\n" in source else "\n"
+    page = _page_name(template)
+    written = []
+
+    for pattern, rel, tag in (
+        (_STYLE_RE, f"css/pages/{page}.css", '<link rel="stylesheet" href="{{{{ asset_url(\'{rel}\') }}}}">'),
+        (_SCRIPT_RE, f"js/pages/{page}.js", '<script src="{{{{ asset_url(\'{rel}\') }}}}"></script>'),
+    ):
+        bodies, spans = _collect(pattern, source)
+        if not bodies:
+            continue
+        out = os.path.join(static_dir, rel)
+        os.makedirs(os.path.dirname(out), exist_ok=True)
+        with open(out, "w", encoding="utf-8", newline="\n") as fh:
+            fh.write("\n\n".join(bodies) + "\n")
+        written.append(out)
+
+        # Replace the first block with the reference and drop the rest, back to front.
+        for idx, (start, end, indent) in reversed(list(enumerate(spans))):
+            if idx == 0:
+                source = source[:start] + indent + tag.format(rel=rel) + source[end:]
+            else:
+                if source.startswith(newline, end):
+                    end += len(newline)
+                source = source[:start] + source[end:]
+
+    if written:
+        with open(path, "w", encoding="utf-8", newline="") as fh:
+            fh.write(source)
+    return written
+
+
+# ------------------ BUILD ------------------
+
+def _fingerprint(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()[:HASH_LENGTH]
+
+
+def _write(path: str, data: bytes) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as fh:
+        fh.write(data)
+
+
+def _sources(static_dir: str):
+    for dirpath, dirnames, filenames in os.walk(static_dir):
+        if os.path.abspath(dirpath) == os.path.abspath(static_dir):
+            dirnames[:] = [name for name in dirnames if name != DIST_DIRNAME]
+        for name in sorted(filenames):
+            if os.path.splitext(name)[1] in ASSET_EXTENSIONS:
+                full = os.path.join(dirpath, name)
+                yield os.path.relpath(full, static_dir).replace(os.sep, "/"), full
+
+
+def build(static_dir: str = STATIC_DIR) -> dict:
+    """Rebuild dist/ from scratch and return the manifest."""
+    dist_dir = os.path.join(static_dir, DIST_DIRNAME)
+    shutil.rmtree(dist_dir, ignore_errors=True)
+    manifest = {}
+    for logical, full in _sources(static_dir):
+        with open(full, "rb") as fh:
+            data = fh.read()
+        stem, ext = os.path.splitext(logical)
+        hashed = f"{stem}.{_fingerprint(data)}{ext}"
+        out = os.path.join(dist_dir, hashed)
+        _write(out, data)
+        _write(out + ".gz", gzip.compress(data, compresslevel=9, mtime=0))
+        if brotli is not None:
+            _write(out + ".br", brotli.compress(data, quality=11))
+        manifest[logical] = hashed
+    _write(os.path.join(dist_dir, MANIFEST_NAME), json.dumps(manifest, indent=2, sort_keys=True).encode("utf-8"))
+    return manifest
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Build fingerprinted static assets")
+    parser.add_argument("--extract", nargs="*", metavar="TEMPLATE",
+                        help="templates (relative to interview/templates) to pull inline assets out of")
+    args = parser.parse_args(argv)
+
+    for template in args.extract or []:
+        for path in extract_inline(template):
+            print(f"extracted {os.path.relpath(path, ROOT)}")
+
+    manifest = build()
+    dist_dir = os.path.join(STATIC_DIR, DIST_DIRNAME)
+    for logical, hashed in sorted(manifest.items()):
+        sizes = [os.path.getsize(os.path.join(dist_dir, hashed))]
+        sizes.append(os.path.getsize(os.path.join(dist_dir, hashed + ".gz")))
+        if brotli is not None:
+            sizes.append(os.path.getsize(os.path.join(dist_dir, hashed + ".br")))
+        print(f"{logical:40} -> {hashed:50} {' / '.join(str(size) for size in sizes)} bytes")
+    print(f"{len(manifest)} assets, manifest at {os.path.relpath(os.path.join(dist_dir, MANIFEST_NAME), ROOT)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,64 @@
+"""
+Build the memory-mapped question store (quiz/store.py) from the bank.
+
+    python scripts/build_question_store.py                       # quiz/data.py -> instance/questions.qstore
+    python scripts/build_question_store.py --source bank.jsonl --out /srv/questions.qstore
+
+--source takes a JSON list or JSON Lines file of quiz/data.py-style
+questions. The file is replaced atomically; workers map the new store when
+they (re)start.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from quiz.store import QUESTION_STORE_PATH, QuestionStore, build_store  # noqa: E402  pylint: disable=wrong-import-position
+
+
+def load_source(path: str) -> list:
+    with open(path, encoding="utf-8") as fh:
+        if path.endswith(".jsonl"):
+            return [json.loads(line) for line in fh if line.strip()]
+        return json.load(fh)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Build the compact question store")
+    parser.add_argument("--source", help="JSON/JSONL question file (default: quiz/data.py)")
+    parser.add_argument("--out", default=QUESTION_STORE_PATH)
+    args = parser.parse_args(argv)
+
+    if args.source:
+        questions = load_source(args.source)
+    else:
+        from quiz.data import QUESTIONS  # pylint: disable=import-outside-toplevel
+        questions = QUESTIONS
+    if not questions:
+        print("no questions to store")
+        return 1
+
+    started = time.perf_counter()
+    size = build_store(questions, args.out)
+    elapsed = time.perf_counter() - started
+
+    store = QuestionStore(args.out)
+    try:
+        # Cheap round-trip check on the first and last question.
+        for row in {0, len(questions) - 1}:
+            decoded, source = store[row], questions[row]
+            if decoded["question_text"] != source["question_text"] or decoded["options"] != list(source["options"]):
+                print(f"round-trip mismatch on question {row}")
+                return 1
+    finally:
+        store.close()
+    print(f"{len(questions)} questions, {size / 1024:.1f} KiB -> {args.out} ({elapsed:.2f}s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,138 @@
+"""
+Fit 2PL item parameters for the adaptive quiz from recorded attempts.
+
+    python scripts/estimate_item_params.py                      # instance/quiz_attempts -> instance/quiz_item_params.json
+    python scripts/estimate_item_params.py attempts/ --min-attempts 50
+
+Joint MAP estimation: abilities (standard normal prior) and item
+discrimination/difficulty (normal priors centred on the defaults in
+quiz/adaptive.py) are updated alternately with Newton/Fisher-scoring steps.
+Items with fewer than --min-attempts responses are left out and keep their
+defaults. The running app picks up the new file without a restart.
+"""
+import argparse
+import json
+import math
+import os
+import sys
+import time
+from collections import defaultdict
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from llm.capture import load_records  # noqa: E402  pylint: disable=wrong-import-position
+from quiz.adaptive import (  # noqa: E402  pylint: disable=wrong-import-position
+    ATTEMPTS_DIR,
+    DEFAULT_DISCRIMINATION,
+    ITEM_PARAMS_PATH,
+    bank,
+    default_params,
+)
+
+A_MIN, A_MAX = 0.2, 3.0
+B_MIN, B_MAX = -4.0, 4.0
+A_PRIOR_VAR = 0.5 ** 2
+B_PRIOR_VAR = 1.0 ** 2
+
+
+def _prob(a: float, b: float, theta: float) -> float:
+    return 1.0 / (1.0 + math.exp(-a * (theta - b)))
+
+
+def _clamp(value: float, low: float, high: float) -> float:
+    return min(high, max(low, value))
+
+
+def fit(records: list, min_attempts: int = 30, iterations: int = 20) -> dict:
+    """{item_id: {"a", "b", "n"}} for items with at least min_attempts responses."""
+    by_person = defaultdict(list)
+    by_item = defaultdict(list)
+    for rec in records:
+        person, item, correct = rec.get("assessment"), rec.get("item"), 1 if rec.get("correct") else 0
+        if person and item:
+            by_person[person].append((item, correct))
+            by_item[item].append((person, correct))
+
+    priors = {}
+    for item in by_item:
+        question = bank.get(item)
+        priors[item] = default_params(question) if question else {"a": DEFAULT_DISCRIMINATION, "b": 0.0}
+    params = {item: dict(prior) for item, prior in priors.items()}
+    fitted = {item for item, obs in by_item.items() if len(obs) >= min_attempts}
+    theta = {person: 0.0 for person in by_person}
+
+    for _ in range(iterations):
+        for person, responses in by_person.items():
+            th = theta[person]
+            for _step in range(3):
+                grad, hess = -th, -1.0
+                for item, correct in responses:
+                    a, b = params[item]["a"], params[item]["b"]
+                    p = _prob(a, b, th)
+                    grad += a * (correct - p)
+                    hess -= a * a * p * (1.0 - p)
+                th = _clamp(th - grad / hess, B_MIN, B_MAX)
+            theta[person] = th
+
+        for item in fitted:
+            a, b = params[item]["a"], params[item]["b"]
+            prior = priors[item]
+            for _step in range(3):
+                grad_a = -(a - prior["a"]) / A_PRIOR_VAR
+                grad_b = -(b - prior["b"]) / B_PRIOR_VAR
+                h_aa, h_bb, h_ab = -1.0 / A_PRIOR_VAR, -1.0 / B_PRIOR_VAR, 0.0
+                for person, correct in by_item[item]:
+                    dist = theta[person] - b
+                    p = _prob(a, b, theta[person])
+                    weight = p * (1.0 - p)
+                    grad_a += (correct - p) * dist
+                    grad_b -= a * (correct - p)
+                    h_aa -= weight * dist * dist
+                    h_bb -= weight * a * a
+                    h_ab += weight * a * dist
+                det = h_aa * h_bb - h_ab * h_ab
+                if det <= 0:
+                    break
+                a = _clamp(a - (h_bb * grad_a - h_ab * grad_b) / det, A_MIN, A_MAX)
+                b = _clamp(b - (h_aa * grad_b - h_ab * grad_a) / det, B_MIN, B_MAX)
+            params[item] = {"a": a, "b": b}
+
+    return {
+        item: {"a": round(params[item]["a"], 4), "b": round(params[item]["b"], 4), "n": len(by_item[item])}
+        for item in sorted(fitted)
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Estimate adaptive-quiz item parameters")
+    parser.add_argument("attempts", nargs="*", default=[ATTEMPTS_DIR], help="attempt .jsonl files or directories")
+    parser.add_argument("--out", default=ITEM_PARAMS_PATH)
+    parser.add_argument("--min-attempts", type=int, default=30)
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    paths = [path for path in args.attempts if os.path.exists(path)]
+    records = load_records(paths) if paths else []
+    if not records:
+        print("no attempts found")
+        return 1
+
+    items = fit(records, args.min_attempts, args.iterations)
+    out = {
+        "generated_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "attempts": len(records),
+        "assessments": len({rec.get("assessment") for rec in records}),
+        "items": items,
+    }
+    os.makedirs(os.path.dirname(os.path.abspath(args.out)), exist_ok=True)
+    tmp = f"{args.out}.tmp"
+    with open(tmp, "w", encoding="utf-8") as fh:
+        json.dump(out, fh, indent=2, sort_keys=True)
+    os.replace(tmp, args.out)  # the app reloads on mtime change; never show it a partial file
+    print(f"{len(items)} items fitted from {out['attempts']} attempts ({out['assessments']} assessments) -> {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
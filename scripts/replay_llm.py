@@ -0,0 +1,255 @@
+"""
+Replay captured LLM traffic against the Flask app.
+
+Drives the app in-process with virtual users while a local stand-in
+answers every generate() call with captured payloads, sleeping for the
+captured latency divided by --speedup. Use it to size worker counts and
+admission limits, or to compare caching/batching changes under a realistic
+latency distribution.
+
+    LLM_CAPTURE=1 flask run                      # capture in production/staging
+    python scripts/replay_llm.py instance/llm_capture --users 20 --duration 60 --speedup 4
+
+The scenario mix follows the prompt-family mix of the capture.
+"""
+import argparse
+import itertools
+import json
+import os
+import random
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from types import SimpleNamespace
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.environ.setdefault("GEMINI_API_KEY", "replay")
+os.environ["LLM_CAPTURE"] = "0"
+os.environ["LLM_CONTEXT_CACHE"] = "0"
+
+from llm import routing  # noqa: E402  pylint: disable=wrong-import-position
+from llm.capture import load_records  # noqa: E402  pylint: disable=wrong-import-position
+
+ROLES = ["Software Engineer", "Data Analyst", "Frontend Developer", "Backend Engineer"]
+FILLER = ("I would start by clarifying requirements, then explain the trade-offs, "
+          "walk through an example from my last project and measure the result.")
+
+# Scenario -> prompt families it exercises.
+SCENARIO_FAMILIES = {
+    "resume": ("extract", "match", "create", "polish", "polish_patch"),
+    "quiz": ("question_gen", "explain"),
+    "review": ("batch_review",),
+    "interview": ("evaluate",),
+}
+
+
+class StandIn:
+    """generate() backend that replays captured records per prompt family."""
+
+    def __init__(self, records: list, speedup: float):
+        self.speedup = max(speedup, 1e-6)
+        self.by_family = defaultdict(list)
+        for rec in records:
+            self.by_family[rec["family"]].append(rec)
+        self.cursors = defaultdict(itertools.count)
+        self.calls = Counter()
+        self._lock = threading.Lock()
+
+    def __call__(self, family, prompt, cached_content=None):  # pylint: disable=unused-argument
+        records = self.by_family.get(family)
+        if not records:
+            raise RuntimeError(f"No captured traffic for '{family}'.")
+        with self._lock:
+            rec = records[next(self.cursors[family]) % len(records)]
+            self.calls[family] += 1
+        time.sleep(rec["latency_ms"] / 1000.0 / self.speedup)
+        if rec.get("error"):
+            raise RuntimeError(f"Replayed {rec['error']}")
+        return SimpleNamespace(
+            text=rec.get("response", ""),
+            usage_metadata=SimpleNamespace(
+                prompt_token_count=rec.get("prompt_tokens"),
+                candidates_token_count=rec.get("output_tokens"),
+            ),
+        )
+
+
+class Recorder:
+    def __init__(self):
+        self.samples = defaultdict(list)
+        self.statuses = defaultdict(Counter)
+        self._lock = threading.Lock()
+
+    def request(self, client, method, path, **kwargs):
+        started = time.perf_counter()
+        response = client.open(path, method=method, **kwargs)
+        body = response.get_data()  # drains streamed bodies
+        response.close()  # releases the admission slot
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            self.samples[f"{method} {path.split('?')[0]}"].append(elapsed)
+            self.statuses[f"{method} {path.split('?')[0]}"][response.status_code] += 1
+        try:
+            return response.status_code, json.loads(body) if body else {}
+        except ValueError:
+            return response.status_code, {}
+
+    def report(self) -> dict:
+        out = {}
+        for endpoint, samples in sorted(self.samples.items()):
+            ordered = sorted(samples)
+
+            def pct(p, ordered=ordered):
+                return round(ordered[min(len(ordered) - 1, int(len(ordered) * p))] * 1000, 1)
+
+            out[endpoint] = {
+                "count": len(ordered),
+                "p50_ms": pct(0.50),
+                "p95_ms": pct(0.95),
+                "p99_ms": pct(0.99),
+                "statuses": dict(self.statuses[endpoint]),
+            }
+        return out
+
+
+def run_resume(client, rec, rng):
+    rec.request(client, "POST", "/resume", data={
+        "name": "Replay User",
+        "contact": "replay@example.com",
+        "experience": "- Intern, Example Corp - built internal tools",
+        "skills": "Python, SQL, Flask",
+        "target_role": rng.choice(ROLES),
+        "job_description": "Build APIs in Python and SQL.",
+        "tone": "corporate",
+    })
+
+
+def run_quiz(client, rec, rng):
+    status, data = rec.request(client, "POST", "/api/generate_questions", json={
+        "mode": "quiz", "num_questions": 5, "technology": rng.choice(["Python", "SQL", "DSA"]),
+    })
+    questions = data.get("questions") or []
+    if status != 200 or not questions:
+        return
+    answers = [{"id": q.get("id"), "selected_option_index": rng.randrange(4)} for q in questions]
+    status, graded = rec.request(client, "POST", "/api/grade_quiz", json={"answers": answers})
+    pending = graded.get("pending_explanations") or []
+    if status == 200 and pending:
+        rec.request(client, "POST", "/api/quiz/explanations", json={"ids": pending})
+
+
+def run_review(client, rec, rng):
+    status, data = rec.request(client, "POST", "/api/generate_questions", json={
+        "mode": "interview", "num_questions": 5, "role": rng.choice(ROLES),
+    })
+    questions = data.get("questions") or []
+    if status != 200 or not questions:
+        return
+    answers = [{"id": q.get("id"), "answer": f"{q.get('question', '')} {FILLER}"} for q in questions]
+    rec.request(client, "POST", "/api/review_interview_answers", json={"answers": answers})
+
+
+def run_interview(client, rec, rng, steps=5):
+    status, data = rec.request(client, "POST", "/api/interview/start", json={
+        "role": rng.choice(ROLES), "experience": "Fresher", "style": "General",
+    })
+    for _ in range(steps):
+        question = data.get("question")
+        if status != 200 or not question:
+            break
+        answer = f"{question.get('question', '')} {FILLER}"
+        status, data = rec.request(client, "POST", "/api/interview/step", json={
+            "question_id": question.get("id"), "answer": answer,
+        })
+    rec.request(client, "POST", "/api/interview/end")
+
+
+SCENARIOS = {
+    "resume": run_resume,
+    "quiz": run_quiz,
+    "review": run_review,
+    "interview": run_interview,
+}
+
+
+def scenario_weights(records: list) -> dict:
+    families = Counter(rec["family"] for rec in records)
+    weights = {
+        name: sum(families[f] for f in fams) for name, fams in SCENARIO_FAMILIES.items()
+    }
+    return {name: weight for name, weight in weights.items() if weight} or {"quiz": 1}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("captures", nargs="+", help="capture .jsonl files or directories")
+    parser.add_argument("--users", type=int, default=10, help="concurrent virtual users")
+    parser.add_argument("--duration", type=float, default=30.0, help="seconds to run")
+    parser.add_argument("--speedup", type=float, default=1.0, help="divide captured latencies by this")
+    parser.add_argument("--think-ms", type=float, default=0.0, help="pause between scenarios")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args(argv)
+
+    records = load_records(args.captures)
+    if not records:
+        parser.error("no capture records found")
+
+    stand_in = StandIn(records, args.speedup)
+    routing.set_backend(stand_in)
+    from app import app  # pylint: disable=import-outside-toplevel
+
+    weights = scenario_weights(records)
+    names, values = zip(*weights.items())
+    recorder = Recorder()
+    deadline = time.monotonic() + args.duration
+    scenario_counts = Counter()
+    counts_lock = threading.Lock()
+
+    def user(idx):
+        rng = random.Random(None if args.seed is None else args.seed + idx)
+        client = app.test_client()
+        while time.monotonic() < deadline:
+            name = rng.choices(names, weights=values)[0]
+            with counts_lock:
+                scenario_counts[name] += 1
+            try:
+                SCENARIOS[name](client, recorder, rng)
+            except Exception as exc:  # pylint: disable=broad-except
+                print(f"[user {idx}] {name} failed: {exc}", file=sys.stderr)
+            if args.think_ms:
+                time.sleep(args.think_ms / 1000.0)
+
+    started = time.monotonic()
+    threads = [threading.Thread(target=user, args=(i,), daemon=True) for i in range(args.users)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    report = {
+        "wall_seconds": round(time.monotonic() - started, 2),
+        "users": args.users,
+        "speedup": args.speedup,
+        "scenarios": dict(scenario_counts),
+        "llm_calls": dict(stand_in.calls),
+        "endpoints": recorder.report(),
+    }
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return 0
+
+    print(f"{report['wall_seconds']}s, {args.users} users, speedup x{args.speedup}")
+    print("scenarios:", report["scenarios"])
+    print("llm calls:", report["llm_calls"])
+    print(f"{'endpoint':45} {'count':>6} {'p50':>8} {'p95':>8} {'p99':>8}  statuses")
+    for endpoint, row in report["endpoints"].items():
+        print(f"{endpoint:45} {row['count']:>6} {row['p50_ms']:>8} {row['p95_ms']:>8} "
+              f"{row['p99_ms']:>8}  {row['statuses']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
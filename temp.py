@@ -1,6 +1,7 @@
 import json
 import re
 import google.generativeai as genai
+from llm.routing import generate
 
 # ⚠️ DO NOT configure API key here.
 # It is configured in temp.py using genai.configure(api_key="...")
@@ -67,9 +68,7 @@ Job Description: {job_description}
 Tone: {tone}
 """
 
-    model = genai.GenerativeModel("models/gemini-2.0-flash")
-
-    response = model.generate_content(prompt)
+    response = generate("create", prompt)
 
     # Try to get the text safely
     text = (response.text or "").strip()
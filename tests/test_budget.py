@@ -0,0 +1,41 @@
+from llm.budget import OMITTED, estimate_tokens, split_chunks, truncate_to_budget
+
+
+def test_split_chunks_keeps_short_paragraphs_whole():
+    text = "First paragraph.\n\nSecond paragraph."
+    assert split_chunks(text) == ["First paragraph.", "Second paragraph."]
+
+
+def test_split_chunks_splits_oversized_sentence_at_word_boundaries():
+    words = [f"skill{idx}" for idx in range(400)]
+    chunks = split_chunks(" ".join(words), max_tokens=50)
+    assert len(chunks) > 1
+    assert all(estimate_tokens(chunk) <= 50 for chunk in chunks)
+    assert " ".join(chunks).split() == words
+
+
+def test_truncate_keeps_part_of_a_job_description_without_sentence_breaks():
+    jd = " ".join(f"python requirement{idx}" for idx in range(2500))
+    assert estimate_tokens(jd) > 5000
+    fitted, dropped = truncate_to_budget({"job_description": jd}, "python", 500)
+    text = fitted["job_description"]
+    assert text.startswith("python requirement0")
+    assert text.endswith(OMITTED)
+    assert 0 < estimate_tokens(text) <= 500 + estimate_tokens(OMITTED)
+    assert dropped["job_description"]["chunks"] > 0
+
+
+def test_truncate_marks_fully_dropped_inputs():
+    inputs = {
+        "job_description": "python " * 100,
+        "linkedin": "Unrelated text about gardening. " * 40,
+    }
+    fitted, dropped = truncate_to_budget(inputs, "python", 110)
+    assert fitted["linkedin"] == OMITTED
+    assert "linkedin" in dropped
+    assert "python" in fitted["job_description"]
+
+
+def test_truncate_leaves_empty_inputs_empty():
+    fitted, _ = truncate_to_budget({"job_description": "python " * 300, "resume": ""}, "python", 100)
+    assert fitted["resume"] == ""
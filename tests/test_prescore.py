@@ -0,0 +1,43 @@
+from interview.prescore import merge_reviews
+
+
+def _entries(*ids):
+    return [{"id": qid, "question": f"Question {qid}", "answer": "An answer."} for qid in ids]
+
+
+def test_merge_matches_by_id_not_position():
+    evaluations = [
+        {"id": "q2", "rating": 4, "verdict": "Strong"},
+        {"id": "q1", "rating": 2, "verdict": "Improve"},
+    ]
+    merged = merge_reviews(_entries("q1", "q2"), {}, evaluations)
+    assert [(ev["id"], ev["rating"]) for ev in merged] == [("q1", 2), ("q2", 4)]
+
+
+def test_merge_ignores_missing_and_unknown_ids():
+    evaluations = [
+        {"rating": 5, "verdict": "Strong"},
+        {"id": "q9", "rating": 5, "verdict": "Strong"},
+    ]
+    merged = merge_reviews(_entries("q1"), {}, evaluations)
+    assert merged[0]["id"] == "q1"
+    assert merged[0]["verdict"] == "Unavailable"
+    assert merged[0]["rating"] is None
+
+
+def test_merge_keeps_first_of_repeated_ids():
+    evaluations = [
+        {"id": "q1", "rating": 3, "verdict": "Fair"},
+        {"id": "q1", "rating": 5, "verdict": "Strong"},
+    ]
+    merged = merge_reviews(_entries("q1", "q2"), {}, evaluations)
+    assert merged[0]["rating"] == 3
+    assert merged[1]["verdict"] == "Unavailable"
+
+
+def test_merge_normalizes_id_type_and_keeps_prescored():
+    prescored = {2: {"id": 2, "rating": 1, "verdict": "Improve", "feedback": "Skipped."}}
+    evaluations = [{"id": "1", "rating": 4, "verdict": "Strong"}, {"id": "2", "rating": 5}]
+    merged = merge_reviews(_entries(1, 2), prescored, evaluations)
+    assert merged[0] == {"id": 1, "rating": 4, "verdict": "Strong"}
+    assert merged[1] is prescored[2]
@@ -0,0 +1,93 @@
+import pytest
+
+from quiz.services import filter_questions
+from quiz.store import QuestionStore, build_store
+
+QUESTIONS = [
+    {
+        "id": 1,
+        "question_text": "What is the time complexity of binary search?",
+        "options": ["O(n)", "O(log n)", "O(n log n)", "O(1)"],
+        "correct_option": 1,
+        "explanation": "Binary search halves the range each time → O(log n).",
+        "company_tags": ["TCS", "Infosys"],
+        "tech_tags": ["DSA"],
+        "role_tags": ["SDE"],
+        "round_type": "Technical",
+        "difficulty": "Easy",
+        "question_type": "MCQ",
+    },
+    {
+        "id": 42,
+        "question_text": "Which keyword defines a generator in Python?",
+        "options": ["return", "yield", "async"],
+        "correct_option": 1,
+        "explanation": "",
+        "company_tags": ["Infosys"],
+        "tech_tags": ["Python", "DSA"],
+        "role_tags": [],
+        "round_type": "Technical",
+        "difficulty": "Medium",
+        "question_type": "MCQ",
+    },
+    {
+        "id": 7,
+        "question_text": "Tell us about a conflict in your team.",
+        "options": ["A", "B"],
+        "correct_option": 0,
+        "explanation": "Use the STAR format.",
+        "company_tags": [],
+        "tech_tags": [],
+        "role_tags": ["SDE", "Analyst"],
+        "round_type": "HR",
+        "difficulty": "Easy",
+        "question_type": "MCQ",
+    },
+]
+
+
+@pytest.fixture
+def store(tmp_path):
+    path = tmp_path / "questions.qstore"
+    build_store(QUESTIONS, str(path))
+    bank = QuestionStore(str(path))
+    yield bank
+    bank.close()
+
+
+def test_store_round_trips_every_question(store):
+    assert len(store) == len(QUESTIONS)
+    assert list(store) == QUESTIONS
+    with pytest.raises(IndexError):
+        store[len(QUESTIONS)]
+
+
+def test_store_single_field_accessors(store):
+    assert store.question_id(1) == 42
+    assert store.question_text(1) == QUESTIONS[1]["question_text"]
+    assert store.label("difficulty", 2) == "Easy"
+    assert store.label("round_type", 2) == "HR"
+    assert store.tags("tech", 1) == ["Python", "DSA"]
+    assert store.tags("company", 2) == []
+
+
+@pytest.mark.parametrize("company, tech, difficulty", [
+    (None, None, None),
+    ("Infosys", None, None),
+    ("Infosys", "DSA", None),
+    (None, "DSA", "Medium"),
+    (None, None, "Easy"),
+    ("Wipro", None, None),
+    (None, None, "Hard"),
+])
+def test_store_filters_like_the_list_bank(store, company, tech, difficulty):
+    expected = filter_questions(QUESTIONS, company, tech, difficulty, len(QUESTIONS))
+    selected = filter_questions(store, company, tech, difficulty, len(QUESTIONS))
+    assert sorted(q["id"] for q in selected) == sorted(q["id"] for q in expected)
+
+
+def test_store_rejects_other_files(tmp_path):
+    path = tmp_path / "not-a-store.bin"
+    path.write_bytes(b"x" * 64)
+    with pytest.raises(ValueError):
+        QuestionStore(str(path))
@@ -0,0 +1,72 @@
+import pytest
+
+from llm.streaming import ArrayItemParser, OffSchemaError, iter_array_items
+
+
+def test_parser_yields_items_across_chunk_boundaries():
+    parser = ArrayItemParser()
+    text = '```json\n[{"id": "q1", "text": "a } in \\"quotes\\" ]"}, {"id": "q2", "tags": [{"x": 1}]}]'
+    items = []
+    for start in range(0, len(text), 3):
+        items.extend(parser.feed(text[start:start + 3]))
+    assert items == [
+        {"id": "q1", "text": 'a } in "quotes" ]'},
+        {"id": "q2", "tags": [{"x": 1}]},
+    ]
+    assert parser.done
+
+
+def test_parser_rejects_text_before_the_array():
+    with pytest.raises(OffSchemaError):
+        ArrayItemParser().feed("Sure! Here are your questions: [")
+
+
+def test_parser_rejects_non_object_elements():
+    with pytest.raises(OffSchemaError):
+        ArrayItemParser().feed('[{"id": 1}, "loose string"]')
+
+
+def test_parser_rejects_malformed_elements():
+    with pytest.raises(OffSchemaError):
+        ArrayItemParser().feed('[{"id": 1,}]')
+
+
+class _Chunks:
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self.read = 0
+        self.closed = False
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        chunk = next(self._chunks)
+        self.read += 1
+        return chunk
+
+    def close(self):
+        self.closed = True
+
+
+def test_iter_array_items_stops_at_limit_and_closes_stream():
+    chunks = _Chunks(['[{"id": 1},', ' {"id": 2},', ' {"id": 3}]'])
+    assert list(iter_array_items(chunks, limit=2)) == [{"id": 1}, {"id": 2}]
+    assert chunks.read == 2
+    assert chunks.closed
+
+
+def test_iter_array_items_stops_at_closing_bracket():
+    chunks = _Chunks(['[{"id": 1}]', "trailing text the model kept writing"])
+    assert list(iter_array_items(chunks)) == [{"id": 1}]
+    assert chunks.read == 1
+    assert chunks.closed
+
+
+def test_iter_array_items_validates_items():
+    chunks = _Chunks(['[{"id": 1}, {"name": "no id"}]'])
+    items = iter_array_items(chunks, validate=lambda item: "id" in item)
+    assert next(items) == {"id": 1}
+    with pytest.raises(OffSchemaError):
+        next(items)
+    assert chunks.closed
@@ -0,0 +1 @@
+"""Web-layer helpers shared by the Flask app."""
@@ -0,0 +1,190 @@
+"""
+Admission control and load shedding.
+
+Requests are admitted through one of three concurrency pools:
+
+- expensive: POSTs that call Gemini (/resume, /api/resume/*, /api/interview/*,
+             /api/generate_questions, /api/review_interview_answers,
+             /api/quiz/explanations, /api/quiz/adaptive/*)
+- stream:    long-lived server-sent event streams (STREAM_ENDPOINTS); a
+             small pool with no queue, so open streams never hold cheap
+             slots and extra ones are refused at once (clients fall back
+             to polling)
+- cheap:     everything else (grading, polling, pages)
+
+Each pool has a concurrency limit and a bounded wait queue with a
+queue-time deadline. When the queue is full, or the deadline passes before
+a slot frees up, the request is shed with a fast 503 and Retry-After.
+Because the pools are separate, a pile-up of LLM calls never holds slots
+that cheap routes need. Every decision is counted in web/metrics.py.
+"""
+import math
+import os
+import threading
+import time
+
+from flask import Response, g, jsonify, request
+
+from .metrics import registry
+
+EXPENSIVE_PREFIXES = (
+    "/resume",
+    "/api/resume/",
+    "/api/interview/",
+    "/api/generate_questions",
+    "/api/review_interview_answers",
+    "/api/quiz/explanations",
+    "/api/quiz/adaptive/",
+)
+# Never gated: static files, the metrics endpoint itself and history exports
+# (a long export would hold a slot for its whole duration).
+EXEMPT_ENDPOINTS = {"static", "assets.asset", "metrics.metrics", "history.export_history"}
+STREAM_ENDPOINTS = {"api_interview_evaluation_events"}
+
+ADMITTED = "admitted"
+SHED_QUEUE_FULL = "shed_queue_full"
+SHED_TIMEOUT = "shed_timeout"
+
+registry.describe("admission_decisions_total", "Admission decisions per pool.")
+registry.describe("admission_in_flight", "Requests currently holding a slot.")
+registry.describe("admission_queue_depth", "Requests waiting for a slot.")
+registry.describe("admission_queue_wait_seconds", "Time admitted requests spent queued.")
+
+
+class AdmissionPool:
+    def __init__(self, name: str, max_concurrent: int, max_queue: int, queue_timeout: float):
+        self.name = name
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self._in_flight = 0
+        self._waiting = 0
+        self._avg_hold = 1.0  # EWMA of slot hold time, for Retry-After
+        self._cond = threading.Condition()
+
+    def _publish(self) -> None:
+        registry.set("admission_in_flight", self._in_flight, {"pool": self.name})
+        registry.set("admission_queue_depth", self._waiting, {"pool": self.name})
+
+    def acquire(self) -> str:
+        """Wait for a slot; returns ADMITTED or the reason the request was shed."""
+        started = time.monotonic()
+        with self._cond:
+            if self._in_flight >= self.max_concurrent:
+                if self._waiting >= self.max_queue:
+                    decision = SHED_QUEUE_FULL
+                else:
+                    self._waiting += 1
+                    self._publish()
+                    deadline = started + self.queue_timeout
+                    while self._in_flight >= self.max_concurrent:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            break
+                        self._cond.wait(remaining)
+                    self._waiting -= 1
+                    decision = ADMITTED if self._in_flight < self.max_concurrent else SHED_TIMEOUT
+            else:
+                decision = ADMITTED
+            if decision == ADMITTED:
+                self._in_flight += 1
+            self._publish()
+
+        registry.inc("admission_decisions_total", {"pool": self.name, "decision": decision})
+        if decision == ADMITTED:
+            registry.observe("admission_queue_wait_seconds", time.monotonic() - started,
+                             {"pool": self.name})
+        return decision
+
+    def release(self, held_seconds: float) -> None:
+        with self._cond:
+            self._in_flight -= 1
+            self._avg_hold = 0.8 * self._avg_hold + 0.2 * held_seconds
+            self._publish()
+            self._cond.notify()
+
+    def retry_after(self) -> int:
+        """Rough seconds until a slot frees up."""
+        with self._cond:
+            backlog = (self._waiting + 1) / max(1, self.max_concurrent)
+            return max(1, math.ceil(self._avg_hold * backlog))
+
+
+expensive_pool = AdmissionPool(
+    "expensive",
+    max_concurrent=int(os.getenv("ADMISSION_EXPENSIVE_CONCURRENCY", "8")),
+    max_queue=int(os.getenv("ADMISSION_EXPENSIVE_QUEUE", "16")),
+    queue_timeout=float(os.getenv("ADMISSION_EXPENSIVE_QUEUE_TIMEOUT", "2.0")),
+)
+stream_pool = AdmissionPool(
+    "stream",
+    max_concurrent=int(os.getenv("ADMISSION_STREAM_CONCURRENCY", "16")),
+    max_queue=0,
+    queue_timeout=0.0,
+)
+cheap_pool = AdmissionPool(
+    "cheap",
+    max_concurrent=int(os.getenv("ADMISSION_CHEAP_CONCURRENCY", "64")),
+    max_queue=int(os.getenv("ADMISSION_CHEAP_QUEUE", "128")),
+    queue_timeout=float(os.getenv("ADMISSION_CHEAP_QUEUE_TIMEOUT", "0.5")),
+)
+
+
+def pool_for_request() -> AdmissionPool:
+    if request.endpoint in STREAM_ENDPOINTS:
+        return stream_pool
+    if request.method == "POST" and request.path.startswith(EXPENSIVE_PREFIXES):
+        return expensive_pool
+    return cheap_pool
+
+
+class _Slot:
+    """One admitted request's slot; release() is idempotent."""
+
+    def __init__(self, pool: AdmissionPool):
+        self.pool = pool
+        self.started = time.monotonic()
+        self._released = False
+
+    def release(self) -> None:
+        if not self._released:
+            self._released = True
+            self.pool.release(time.monotonic() - self.started)
+
+
+def _admit():
+    if request.endpoint in EXEMPT_ENDPOINTS:
+        return None
+    pool = pool_for_request()
+    if pool.acquire() != ADMITTED:
+        message = "Server is busy, please retry shortly."
+        if request.path.startswith("/api/"):
+            response = jsonify({"error": message})
+            response.status_code = 503
+        else:
+            response = Response(message, status=503, mimetype="text/plain")
+        response.headers["Retry-After"] = str(pool.retry_after())
+        return response
+    g.admission_slot = _Slot(pool)
+    return None
+
+
+def _release_on_close(response):
+    slot = g.pop("admission_slot", None)
+    if slot is not None:
+        # Streamed bodies keep the slot until the last chunk is sent.
+        response.call_on_close(slot.release)
+    return response
+
+
+def _release_on_teardown(exc):  # pylint: disable=unused-argument
+    slot = g.pop("admission_slot", None)
+    if slot is not None:
+        slot.release()
+
+
+def init_admission(app) -> None:
+    """Gate every request through the expensive or cheap admission pool."""
+    app.before_request(_admit)
+    app.after_request(_release_on_close)
+    app.teardown_request(_release_on_teardown)
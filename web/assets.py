@@ -0,0 +1,101 @@
+"""
+Fingerprinted static assets built by scripts/build_assets.py.
+
+asset_url("js/interview.js") resolves through static/dist/manifest.json to
+/assets/js/interview.<hash>.js, served with an immutable one-year cache and
+the precompressed .br/.gz variant the client accepts. Without a build (or for
+files missing from the manifest) it falls back to the plain /static URL, so
+development works without running the build.
+"""
+import json
+import mimetypes
+import os
+import threading
+
+from flask import Blueprint, abort, current_app, request, send_from_directory, url_for
+
+DIST_DIRNAME = "dist"
+MANIFEST_NAME = "manifest.json"
+IMMUTABLE_MAX_AGE = 365 * 24 * 3600
+# Preference order for precompressed variants; ".br" only exists when brotli was installed at build time.
+PRECOMPRESSED = (("br", ".br"), ("gzip", ".gz"))
+
+assets_bp = Blueprint("assets", __name__)
+
+
+class Manifest:
+    """manifest.json, reloaded when the file changes (cheap stat per lookup)."""
+
+    def __init__(self):
+        self._path = None
+        self._mtime = None
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def _load(self, path: str) -> dict:
+        try:
+            mtime = os.path.getmtime(path)
+        except OSError:
+            return {}
+        if path == self._path and mtime == self._mtime:
+            return self._entries
+        with self._lock:
+            try:
+                with open(path, encoding="utf-8") as fh:
+                    self._entries = json.load(fh)
+            except (OSError, ValueError):
+                self._entries = {}
+            self._path, self._mtime = path, mtime
+        return self._entries
+
+    def lookup(self, logical: str) -> str:
+        return self._load(os.path.join(_dist_dir(), MANIFEST_NAME)).get(logical)
+
+    def version(self):
+        """mtime of the loaded manifest (None without a build), for cache keys."""
+        self._load(os.path.join(_dist_dir(), MANIFEST_NAME))
+        return self._mtime
+
+
+manifest = Manifest()
+
+
+def _dist_dir() -> str:
+    return os.path.join(current_app.static_folder, DIST_DIRNAME)
+
+
+def asset_url(logical: str) -> str:
+    """URL for a static file, fingerprinted when it has been built."""
+    hashed = manifest.lookup(logical)
+    if hashed:
+        return url_for("assets.asset", filename=hashed)
+    return url_for("static", filename=logical)
+
+
+@assets_bp.route("/assets/<path:filename>")
+def asset(filename):
+    """Serve a built asset, preferring a precompressed variant."""
+    dist_dir = _dist_dir()
+    if filename.endswith((".gz", ".br", ".json")) or not os.path.isfile(os.path.join(dist_dir, filename)):
+        abort(404)
+
+    mimetype = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+    served, encoding = filename, None
+    for candidate, suffix in PRECOMPRESSED:
+        if request.accept_encodings[candidate] > 0 and os.path.isfile(os.path.join(dist_dir, filename + suffix)):
+            served, encoding = filename + suffix, candidate
+            break
+
+    response = send_from_directory(dist_dir, served, mimetype=mimetype, max_age=IMMUTABLE_MAX_AGE)
+    if encoding:
+        response.headers["Content-Encoding"] = encoding
+    response.vary.add("Accept-Encoding")
+    response.cache_control.immutable = True
+    response.cache_control.public = True
+    return response
+
+
+def init_assets(app) -> None:
+    """Register /assets and make asset_url() available to templates."""
+    app.register_blueprint(assets_bp)
+    app.add_template_global(asset_url)
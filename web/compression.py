@@ -0,0 +1,85 @@
+"""
+Negotiated response compression.
+
+Buffered responses of a compressible type and at least COMPRESS_MIN_BYTES
+are encoded with brotli (when the brotli package is installed and the client
+accepts "br") or gzip. Streamed responses (NDJSON, SSE, file downloads) are
+left alone so chunks still reach the client as soon as they are produced.
+"""
+import gzip
+import os
+
+from flask import request
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+COMPRESS_MIN_BYTES = int(os.getenv("COMPRESS_MIN_BYTES", "1024"))
+COMPRESS_LEVEL_GZIP = int(os.getenv("COMPRESS_LEVEL_GZIP", "6"))
+COMPRESS_LEVEL_BROTLI = int(os.getenv("COMPRESS_LEVEL_BROTLI", "5"))
+COMPRESSIBLE_TYPES = {
+    "application/json",
+    "application/javascript",
+    "text/html",
+    "text/css",
+    "text/plain",
+    "text/javascript",
+    "image/svg+xml",
+}
+
+
+def available_encodings() -> list:
+    """Encodings this process can produce, in order of preference."""
+    return (["br"] if brotli is not None else []) + ["gzip"]
+
+
+def choose_encoding(accept_encodings) -> str:
+    """Best supported encoding for the request's Accept-Encoding, or None."""
+    for encoding in available_encodings():
+        if accept_encodings[encoding] > 0:
+            return encoding
+    return None
+
+
+def compress(data: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(data, quality=COMPRESS_LEVEL_BROTLI)
+    return gzip.compress(data, compresslevel=COMPRESS_LEVEL_GZIP, mtime=0)
+
+
+def _compress_response(response):
+    response.vary.add("Accept-Encoding")
+    if (
+        response.direct_passthrough
+        or response.is_streamed
+        or response.status_code < 200
+        or response.status_code in (204, 304)
+        or "Content-Encoding" in response.headers
+        or response.mimetype not in COMPRESSIBLE_TYPES
+    ):
+        return response
+
+    encoding = choose_encoding(request.accept_encodings)
+    if encoding is None:
+        return response
+    data = response.get_data()
+    if len(data) < COMPRESS_MIN_BYTES:
+        return response
+
+    response.set_data(compress(data, encoding))
+    response.headers["Content-Encoding"] = encoding
+    etag, weak = response.get_etag()
+    if etag:
+        # A different representation needs a different validator.
+        response.set_etag(f"{etag}-{encoding}", weak=weak)
+    return response
+
+
+def init_compression(app) -> None:
+    """
+    Compress eligible responses. after_request hooks run in reverse order of
+    registration, so call this before installing any other hooks.
+    """
+    app.after_request(_compress_response)
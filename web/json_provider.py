@@ -0,0 +1,64 @@
+"""
+Fast JSON for Flask responses and LLM payloads.
+
+FastJSONProvider encodes with orjson when it is installed and falls back to
+Flask's stdlib provider otherwise (or when pretty-printing in debug mode).
+loads()/dumps() are the same choice for code outside a request, such as
+parsing Gemini responses.
+"""
+import json
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+BACKEND = "orjson" if orjson is not None else "json"
+
+
+def loads(data):
+    """Parse JSON from str or bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj) -> str:
+    """Compact JSON string (no indentation)."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=DefaultJSONProvider.default).decode("utf-8")
+    return json.dumps(obj, separators=(",", ":"), default=DefaultJSONProvider.default)
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson, same output contract as the default."""
+
+    def _options(self) -> int:
+        options = orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            options |= orjson.OPT_SORT_KEYS
+        return options
+
+    def _fast(self, kwargs: dict) -> bool:
+        # Anything beyond default/sort_keys (indent, cls, ...) needs stdlib.
+        return orjson is not None and not set(kwargs) - {"default", "sort_keys"}
+
+    def dumps(self, obj, **kwargs) -> str:
+        if not self._fast(kwargs):
+            return super().dumps(obj, **kwargs)
+        return orjson.dumps(obj, default=self.default, option=self._options()).decode("utf-8")
+
+    def loads(self, s, **kwargs):
+        if orjson is None or kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        pretty = self.compact is False or (self.compact is None and self._app.debug)
+        if orjson is None or pretty:
+            return super().response(*args, **kwargs)
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=self.default, option=self._options())
+        return self._app.response_class(body + b"\n", mimetype=self.mimetype)
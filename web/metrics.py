@@ -0,0 +1,103 @@
+"""
+In-process metrics with a Prometheus text endpoint at /metrics.
+
+Counters, gauges and summaries (sum + count) are keyed by name and a small
+label dict. Set METRICS_TOKEN to require "Authorization: Bearer <token>".
+"""
+import os
+import threading
+
+from flask import Blueprint, Response, abort, request
+
+METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")
+
+metrics_bp = Blueprint("metrics", __name__)
+
+
+def _label_key(labels: dict) -> tuple:
+    return tuple(sorted((labels or {}).items()))
+
+
+def _format_labels(key: tuple) -> str:
+    if not key:
+        return ""
+    body = ",".join(f'{name}="{str(value)}"' for name, value in key)
+    return "{" + body + "}"
+
+
+class Registry:
+    def __init__(self):
+        self._counters = {}
+        self._gauges = {}
+        self._summaries = {}
+        self._help = {}
+        self._lock = threading.Lock()
+
+    def describe(self, name: str, text: str) -> None:
+        self._help[name] = text
+
+    def inc(self, name: str, labels: dict = None, value: float = 1.0) -> None:
+        key = (name, _label_key(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0.0) + value
+
+    def set(self, name: str, value: float, labels: dict = None) -> None:
+        with self._lock:
+            self._gauges[(name, _label_key(labels))] = value
+
+    def observe(self, name: str, value: float, labels: dict = None) -> None:
+        key = (name, _label_key(labels))
+        with self._lock:
+            total, count = self._summaries.get(key, (0.0, 0))
+            self._summaries[key] = (total + value, count + 1)
+
+    def value(self, name: str, labels: dict = None) -> float:
+        key = (name, _label_key(labels))
+        with self._lock:
+            return self._counters.get(key, self._gauges.get(key, 0.0))
+
+    def render(self) -> str:
+        """Prometheus text exposition format."""
+        with self._lock:
+            counters = dict(self._counters)
+            gauges = dict(self._gauges)
+            summaries = dict(self._summaries)
+
+        lines = []
+
+        def family(series: dict, kind: str, emit):
+            for name in sorted({name for name, _ in series}):
+                if name in self._help:
+                    lines.append(f"# HELP {name} {self._help[name]}")
+                lines.append(f"# TYPE {name} {kind}")
+                for (series_name, key), value in sorted(series.items()):
+                    if series_name == name:
+                        emit(name, key, value)
+
+        family(counters, "counter",
+               lambda name, key, value: lines.append(f"{name}{_format_labels(key)} {value:g}"))
+        family(gauges, "gauge",
+               lambda name, key, value: lines.append(f"{name}{_format_labels(key)} {value:g}"))
+
+        def emit_summary(name, key, value):
+            total, count = value
+            lines.append(f"{name}_sum{_format_labels(key)} {total:g}")
+            lines.append(f"{name}_count{_format_labels(key)} {count}")
+
+        family(summaries, "summary", emit_summary)
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+
+@metrics_bp.route("/metrics", methods=["GET"])
+def metrics():
+    if METRICS_TOKEN and request.headers.get("Authorization") != f"Bearer {METRICS_TOKEN}":
+        abort(403)
+    return Response(registry.render(), mimetype="text/plain; version=0.0.4")
+
+
+def init_metrics(app) -> None:
+    """Register the /metrics endpoint on the app."""
+    app.register_blueprint(metrics_bp)
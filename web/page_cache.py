@@ -0,0 +1,100 @@
+"""
+Template compile and render caching.
+
+- A filesystem Jinja bytecode cache, so fresh workers load compiled
+  templates instead of recompiling them (JINJA_BYTECODE_CACHE_DIR, empty
+  to disable).
+- @cached_page for views whose output does not depend on the user: the
+  rendered page is kept per path (and asset manifest version) with its
+  gzip/brotli variants, served with an ETag, and answered with 304 when the
+  client's If-None-Match matches. Repeat views never run the template.
+
+Caching is bypassed in debug mode so template edits show up immediately.
+"""
+import functools
+import hashlib
+import os
+
+from flask import current_app, request
+from jinja2 import FileSystemBytecodeCache
+
+from llm.cache import ResponseCache, make_key
+from web.assets import manifest
+from web.compression import COMPRESS_MIN_BYTES, choose_encoding, compress
+from web.metrics import registry
+
+PAGE_CACHE_ENABLED = os.getenv("PAGE_CACHE", "1") == "1"
+PAGE_CACHE_TTL = float(os.getenv("PAGE_CACHE_TTL", "300"))
+BYTECODE_CACHE_DIR = os.getenv(
+    "JINJA_BYTECODE_CACHE_DIR",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "instance", "jinja_cache"),
+)
+
+page_store = ResponseCache(max_entries=64, ttl_seconds=PAGE_CACHE_TTL)
+
+registry.describe("page_cache_requests_total", "Cached page lookups by result (hit, miss, not_modified).")
+
+
+class CachedPage:
+    """A rendered page plus lazily built compressed variants."""
+
+    def __init__(self, body: bytes, mimetype: str):
+        self.body = body
+        self.mimetype = mimetype
+        self.etag = hashlib.sha1(body).hexdigest()[:20]
+        self._variants = {}
+
+    def encoded(self, encoding: str) -> bytes:
+        if encoding is None:
+            return self.body
+        variant = self._variants.get(encoding)
+        if variant is None:
+            variant = self._variants[encoding] = compress(self.body, encoding)
+        return variant
+
+
+def _caching_active() -> bool:
+    return PAGE_CACHE_ENABLED and not current_app.debug
+
+
+def cached_page(view):
+    """Serve a user-independent GET view from the page cache."""
+
+    @functools.wraps(view)
+    def wrapper(*args, **kwargs):
+        if not _caching_active():
+            return view(*args, **kwargs)
+
+        key = make_key("page", request.path, manifest.version())
+        page = page_store.get(key)
+        result = "hit"
+        if page is None:
+            response = current_app.make_response(view(*args, **kwargs))
+            if response.status_code != 200 or response.is_streamed:
+                return response
+            page = CachedPage(response.get_data(), response.mimetype)
+            page_store.set(key, page)
+            result = "miss"
+
+        encoding = choose_encoding(request.accept_encodings) if len(page.body) >= COMPRESS_MIN_BYTES else None
+        response = current_app.response_class(page.encoded(encoding), mimetype=page.mimetype)
+        if encoding:
+            response.headers["Content-Encoding"] = encoding
+        response.vary.add("Accept-Encoding")
+        response.set_etag(f"{page.etag}-{encoding}" if encoding else page.etag)
+        response.cache_control.no_cache = True  # revalidate with If-None-Match
+        response.headers["X-Page-Cache"] = result
+        response = response.make_conditional(request)
+        if response.status_code == 304:
+            result = "not_modified"
+        registry.inc("page_cache_requests_total", {"result": result})
+        return response
+
+    return wrapper
+
+
+def init_page_cache(app) -> None:
+    """Install the bytecode cache on app.jinja_env."""
+    if BYTECODE_CACHE_DIR:
+        os.makedirs(BYTECODE_CACHE_DIR, exist_ok=True)
+        app.jinja_env.bytecode_cache = FileSystemBytecodeCache(BYTECODE_CACHE_DIR)
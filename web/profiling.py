@@ -0,0 +1,276 @@
+"""
+Opt-in per-request sampling profiler.
+
+A request is profiled when it carries the admin header
+(X-Profile-Token == PROFILE_ADMIN_TOKEN) or is picked by PROFILE_SAMPLE_RATE.
+A background thread samples the request thread's Python stack every
+PROFILE_INTERVAL_SECONDS and folds the samples into flamegraph-compatible
+"frame;frame;frame count" lines:
+
+- <id>.wall.folded: every sample (wall-clock time)
+- <id>.cpu.folded:  samples whose leaf frame is not a blocking wait
+- <id>.json:        metadata, with time split into LLM wait, template
+                    rendering and session cookie serialization
+
+Time spent inside a Gemini call (generate(), generate_stream() or a
+set_backend() stand-in) shows up as a synthetic "[llm-wait]" leaf.
+Profiles are kept in PROFILE_DIR and rotated to the newest PROFILE_MAX_FILES.
+"""
+import json
+import os
+import random
+import re
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+
+from flask import Blueprint, Response, abort, g, jsonify, request, template_rendered
+from flask import before_render_template
+
+from llm.routing import llm_wait_seconds, reset_llm_wait
+
+PROFILE_HEADER = "X-Profile-Token"
+PROFILE_ADMIN_TOKEN = os.getenv("PROFILE_ADMIN_TOKEN", "")
+PROFILE_SAMPLE_RATE = float(os.getenv("PROFILE_SAMPLE_RATE", "0"))
+PROFILE_INTERVAL_SECONDS = float(os.getenv("PROFILE_INTERVAL_SECONDS", "0.005"))
+PROFILE_MAX_FILES = int(os.getenv("PROFILE_MAX_FILES", "50"))
+PROFILE_DIR = os.getenv(
+    "PROFILE_DIR",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "instance", "profiles"),
+)
+
+# Leaf frames that mean "blocked, not using CPU".
+IDLE_LEAVES = {
+    ("threading.py", "wait"),
+    ("threading.py", "_wait_for_tstate_lock"),
+    ("selectors.py", "select"),
+    ("socket.py", "readinto"),
+    ("ssl.py", "read"),
+    ("ssl.py", "recv_into"),
+}
+# Entry points of every LLM call, routed, streamed or through a stand-in backend.
+LLM_FRAMES = {
+    ("routing.py", "generate"),
+    ("routing.py", "generate_stream"),
+    ("routing.py", "_generate_routed"),
+}
+
+_PROFILE_ID_RE = re.compile(r"^[\w.-]+$")
+
+profiling_bp = Blueprint("profiling", __name__, url_prefix="/admin/profiles")
+
+
+class _Sampler(threading.Thread):
+    """Samples one thread's stack until stopped."""
+
+    def __init__(self, target_thread_id: int, interval: float):
+        super().__init__(name="profiler-sampler", daemon=True)
+        self.target_thread_id = target_thread_id
+        self.interval = interval
+        self.wall = Counter()
+        self.cpu = Counter()
+        self._stop_event = threading.Event()
+
+    def run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            frame = sys._current_frames().get(self.target_thread_id)  # pylint: disable=protected-access
+            if frame is None:
+                continue
+            keys = []
+            while frame is not None:
+                code = frame.f_code
+                keys.append((os.path.basename(code.co_filename), code.co_name))
+                frame = frame.f_back
+            keys.reverse()
+
+            names = [f"{filename}:{func}" for filename, func in keys]
+            idle = keys[-1] in IDLE_LEAVES
+            if any(key in LLM_FRAMES for key in keys):
+                names.append("[llm-wait]")
+            stack = ";".join(names)
+            self.wall[stack] += 1
+            if not idle:
+                self.cpu[stack] += 1
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self.join(timeout=1.0)
+
+
+def _should_profile() -> bool:
+    token = request.headers.get(PROFILE_HEADER)
+    if token and PROFILE_ADMIN_TOKEN and token == PROFILE_ADMIN_TOKEN:
+        return True
+    return PROFILE_SAMPLE_RATE > 0 and random.random() < PROFILE_SAMPLE_RATE
+
+
+def _require_admin() -> None:
+    # Header only: a query-string token would end up in access logs.
+    token = request.headers.get(PROFILE_HEADER)
+    if not PROFILE_ADMIN_TOKEN or token != PROFILE_ADMIN_TOKEN:
+        abort(403)
+
+
+def _start_profile() -> None:
+    if request.blueprint == profiling_bp.name or not _should_profile():
+        return
+    reset_llm_wait()
+    sampler = _Sampler(threading.get_ident(), PROFILE_INTERVAL_SECONDS)
+    g.profile = {
+        "sampler": sampler,
+        "wall_start": time.perf_counter(),
+        "cpu_start": time.thread_time(),
+        "render_seconds": 0.0,
+        "session_seconds": 0.0,
+    }
+    sampler.start()
+
+
+def _finish_profile(response):
+    profile = g.get("profile")
+    if profile is None:
+        return response
+
+    profile_id = f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:8]}"
+    meta = {
+        "id": profile_id,
+        "method": request.method,
+        "path": request.path,
+        "endpoint": request.endpoint,
+        "status": response.status_code,
+        "created_at": time.time(),
+        "cpu_ms": round((time.thread_time() - profile["cpu_start"]) * 1000, 2),
+        "llm_wait_ms": round(llm_wait_seconds() * 1000, 2),
+        "interval_ms": PROFILE_INTERVAL_SECONDS * 1000,
+    }
+    response.headers["X-Profile-Id"] = profile_id
+    # The session cookie is written after after_request hooks, so the
+    # profile is closed (and stored) once the response itself is closed.
+    response.call_on_close(lambda: _close_profile(profile, meta))
+    return response
+
+
+def _close_profile(profile: dict, meta: dict) -> None:
+    sampler = profile["sampler"]
+    sampler.stop()
+    meta.update({
+        "wall_ms": round((time.perf_counter() - profile["wall_start"]) * 1000, 2),
+        "render_ms": round(profile["render_seconds"] * 1000, 2),
+        "session_save_ms": round(profile["session_seconds"] * 1000, 2),
+        "samples": sum(sampler.wall.values()),
+    })
+    try:
+        _write_profile(meta["id"], meta, sampler.wall, sampler.cpu)
+    except OSError:
+        pass
+
+
+def _write_profile(profile_id: str, meta: dict, wall: Counter, cpu: Counter) -> None:
+    os.makedirs(PROFILE_DIR, exist_ok=True)
+    for kind, counts in (("wall", wall), ("cpu", cpu)):
+        path = os.path.join(PROFILE_DIR, f"{profile_id}.{kind}.folded")
+        with open(path, "w", encoding="utf-8") as fh:
+            for stack, count in counts.most_common():
+                fh.write(f"{stack} {count}\n")
+    with open(os.path.join(PROFILE_DIR, f"{profile_id}.json"), "w", encoding="utf-8") as fh:
+        json.dump(meta, fh)
+    _rotate()
+
+
+def _stored_metas() -> list:
+    """Paths of stored profile metadata files, oldest first."""
+    paths = [
+        os.path.join(PROFILE_DIR, name)
+        for name in os.listdir(PROFILE_DIR)
+        if name.endswith(".json")
+    ]
+    return sorted(paths, key=os.path.getmtime)
+
+
+def _rotate() -> None:
+    metas = [os.path.basename(path) for path in _stored_metas()]
+    for name in metas[:-PROFILE_MAX_FILES] if PROFILE_MAX_FILES > 0 else []:
+        profile_id = name[: -len(".json")]
+        for suffix in (".json", ".wall.folded", ".cpu.folded"):
+            try:
+                os.remove(os.path.join(PROFILE_DIR, profile_id + suffix))
+            except FileNotFoundError:
+                pass
+
+
+def _on_before_render(sender, template, context, **extra):  # pylint: disable=unused-argument
+    profile = g.get("profile")
+    if profile is not None:
+        profile["render_started"] = time.perf_counter()
+
+
+def _on_rendered(sender, template, context, **extra):  # pylint: disable=unused-argument
+    profile = g.get("profile")
+    if profile is not None and "render_started" in profile:
+        profile["render_seconds"] += time.perf_counter() - profile.pop("render_started")
+
+
+class _TimedSessionInterface:
+    """Delegates to the app's session interface, timing save_session."""
+
+    def __init__(self, inner):
+        self._inner = inner
+
+    def __getattr__(self, name):
+        return getattr(self._inner, name)
+
+    def save_session(self, app, session, response):
+        started = time.perf_counter()
+        try:
+            return self._inner.save_session(app, session, response)
+        finally:
+            profile = g.get("profile")
+            if profile is not None:
+                profile["session_seconds"] += time.perf_counter() - started
+
+
+@profiling_bp.route("", methods=["GET"])
+def list_profiles():
+    """List stored profiles, newest first."""
+    _require_admin()
+    if not os.path.isdir(PROFILE_DIR):
+        return jsonify({"profiles": []})
+    profiles = []
+    for path in reversed(_stored_metas()):
+        with open(path, encoding="utf-8") as fh:
+            profiles.append(json.load(fh))
+    return jsonify({"profiles": profiles})
+
+
+@profiling_bp.route("/<profile_id>", methods=["GET"])
+def download_profile(profile_id):
+    """
+    Download a profile as folded stacks (?kind=wall|cpu), ready for
+    flamegraph.pl or speedscope.
+    """
+    _require_admin()
+    kind = request.args.get("kind", "wall")
+    if kind not in ("wall", "cpu") or not _PROFILE_ID_RE.match(profile_id):
+        abort(400)
+    path = os.path.join(PROFILE_DIR, f"{profile_id}.{kind}.folded")
+    if not os.path.exists(path):
+        abort(404)
+    with open(path, encoding="utf-8") as fh:
+        body = fh.read()
+    return Response(
+        body,
+        mimetype="text/plain",
+        headers={"Content-Disposition": f"attachment; filename={profile_id}.{kind}.folded"},
+    )
+
+
+def init_profiling(app) -> None:
+    """Install the profiling hooks and admin endpoints on the app."""
+    app.before_request(_start_profile)
+    app.after_request(_finish_profile)
+    before_render_template.connect(_on_before_render, app)
+    template_rendered.connect(_on_rendered, app)
+    app.session_interface = _TimedSessionInterface(app.session_interface)
+    app.register_blueprint(profiling_bp)